@@ -0,0 +1,79 @@
+"""Micro-benchmarks for src/utils/io: legacy per-row helpers vs batch readers/writers.
+
+Usage: python benchmarks/bench_io.py --rows 1000000
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.utils.io import CsvBatchWriter, read_csv, read_csv_columns, write_csv  # noqa: E402
+
+FIELDS = ["title", "price", "url", "price_value"]
+
+
+def make_rows(n: int) -> List[Dict[str, str]]:
+    return [
+        {"title": f"Metal Tree Of Life Wall Art {i}", "price": f"${i % 500}.99", "url": f"https://example.com/listing/{i}", "price_value": f"{i % 500}.99"}
+        for i in range(n)
+    ]
+
+
+def legacy_write(path: str, rows: List[Dict[str, str]]) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def timed(label: str, fn: Callable[[], object], results: List[str]) -> None:
+    start = time.perf_counter()
+    fn()
+    results.append(f"| {label} | {time.perf_counter() - start:.2f} |")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="io micro-benchmarks")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    columns = {f: [r[f] for r in rows] for f in FIELDS}
+    results = ["| Case | Seconds |", "|---|---|"]
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "rows.csv")
+        gz = os.path.join(tmp, "rows.csv.gz")
+
+        timed("write: csv.DictWriter per row (legacy)", lambda: legacy_write(plain, rows), results)
+        timed("write: write_csv (batched, atomic)", lambda: write_csv(plain, rows, FIELDS), results)
+
+        def write_cols() -> None:
+            with CsvBatchWriter(plain, FIELDS) as w:
+                w.write_columns(columns)
+
+        timed("write: CsvBatchWriter.write_columns", write_cols, results)
+
+        def write_gz() -> None:
+            with CsvBatchWriter(gz, FIELDS) as w:
+                w.write_columns(columns)
+
+        timed("write: CsvBatchWriter.write_columns (.gz)", write_gz, results)
+        timed("read: read_csv -> list of dicts", lambda: read_csv(plain), results)
+        timed("read: read_csv_columns (price_value float64)", lambda: read_csv_columns(plain, {"price_value": float}), results)
+        timed("read: read_csv_columns (.gz)", lambda: read_csv_columns(gz, {"price_value": float}), results)
+
+    print(f"rows={args.rows}")
+    print("\n".join(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Single-title latency and worker memory: sklearn pipeline vs compiled scorer.
+
+Usage: python benchmarks/bench_scorer.py --rows 20000
+       python benchmarks/bench_scorer.py --pipeline models/day12_pipeline.joblib --scorer models/day12_scorer.npz
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+WORDS = "metal wall art tree life gold ring gift poster print canvas modern custom vintage boho minimal mug sticker".split()
+
+# Run in a fresh interpreter: import, load, score one title, report resident memory in KiB.
+WORKER = """
+import resource, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+{load}
+model.predict_proba({{model.text_col: ["metal tree of life wall art"], "price_value": [45.0]}})
+elapsed = time.perf_counter() - start
+try:
+    with open("/proc/self/status") as f:
+        rss = next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+except OSError:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss)
+"""
+LOAD_PIPELINE = "from src.models.pipeline import load_pipeline\nmodel = load_pipeline({path!r})"
+LOAD_SCORER = "from src.models.compiled import CompiledScorer\nmodel = CompiledScorer.load({path!r})"
+
+
+def make_titles(n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.sample(WORDS, rng.randint(3, 8))) + f" {rng.randint(1, 5000)}" for _ in range(n)]
+
+
+def train_sample(rows: int, tmp: str) -> tuple:
+    import pandas as pd
+
+    from src.models.compiled import save_compiled
+    from src.models.pipeline import save_pipeline
+    from src.models.training import TrainConfig, train_pipeline
+
+    titles = make_titles(rows)
+    rng = random.Random(1)
+    df = pd.DataFrame(
+        {
+            "title": titles,
+            "price_value": [rng.uniform(5, 300) for _ in titles],
+            "label_high_sales": [int("gold" in t or "wall" in t) for t in titles],
+        }
+    )
+    pipe = train_pipeline(df, TrainConfig(min_df=1)).pipeline
+    pipeline_path, scorer_path = os.path.join(tmp, "pipeline.joblib"), os.path.join(tmp, "scorer.npz")
+    save_pipeline(pipe, pipeline_path)
+    save_compiled(pipe, scorer_path)
+    return pipeline_path, scorer_path
+
+
+def latency(fn: Callable[[str], object], titles: List[str]) -> tuple:
+    samples = []
+    for t in titles:
+        start = time.perf_counter()
+        fn(t)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1e6, samples[int(len(samples) * 0.99)] * 1e6
+
+
+def cold_start(load: str, path: str) -> tuple:
+    code = WORKER.format(root=PROJECT_ROOT, load=load.format(path=path))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), int(out[1]) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="scorer micro-benchmarks")
+    parser.add_argument("--rows", type=int, default=20_000, help="Synthetic training rows when no model is given")
+    parser.add_argument("--pipeline", default="")
+    parser.add_argument("--scorer", default="")
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    from src.models.compiled import CompiledScorer
+    from src.models.pipeline import load_pipeline
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline_path, scorer_path = args.pipeline, args.scorer
+        if not (pipeline_path and scorer_path):
+            pipeline_path, scorer_path = train_sample(args.rows, tmp)
+        pipe, scorer = load_pipeline(pipeline_path), CompiledScorer.load(scorer_path)
+        titles = make_titles(args.calls, seed=2)
+        col = pipe.text_col
+
+        pipe_p50, pipe_p99 = latency(lambda t: pipe.predict_proba({col: [t], "price_value": [45.0]}), titles)
+        comp_p50, comp_p99 = latency(lambda t: scorer.proba_one(t, [45.0]), titles)
+        pipe_cold, pipe_rss = cold_start(LOAD_PIPELINE, pipeline_path)
+        comp_cold, comp_rss = cold_start(LOAD_SCORER, scorer_path)
+
+    print(f"vocabulary={len(scorer.weights)} calls={args.calls}")
+    print("| Path | p50 (µs) | p99 (µs) | cold start (s) | worker RSS (MiB) |")
+    print("|---|---|---|---|---|")
+    print(f"| sklearn pipeline | {pipe_p50:.1f} | {pipe_p99:.1f} | {pipe_cold:.2f} | {pipe_rss:.0f} |")
+    print(f"| compiled scorer | {comp_p50:.1f} | {comp_p99:.1f} | {comp_cold:.2f} | {comp_rss:.0f} |")
+
+
+if __name__ == "__main__":
+    main()
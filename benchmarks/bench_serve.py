@@ -0,0 +1,169 @@
+"""Throughput of the Flask dev server vs the production servers (days/serve.py).
+
+Each mode is started as a subprocess, awaited on /readyz, then driven by
+``--clients`` keep-alive connections posting one-item /api/v1/generate
+requests for ``--seconds``. Memory is summed over the server's process tree;
+PSS counts pages shared between preforked workers once. The same title is
+posted every time, so after the first request this measures generation
+cache hits; ``--distinct`` appends a counter to each title to measure misses.
+
+Usage: python benchmarks/bench_serve.py --workers 4 --threads 4 --clients 16 --seconds 15
+"""
+
+import argparse
+import http.client
+import itertools
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+BODY = json.dumps([{"title": "Metal Tree of Life Wall Art", "ptype": "metal_wall_art"}]).encode("utf-8")
+
+
+def commands(port: int, workers: int, threads: int) -> Dict[str, List[str]]:
+    serve = [sys.executable, os.path.join(PROJECT_ROOT, "days", "serve.py"), "--bind", f"127.0.0.1:{port}"]
+    pool = ["--workers", str(workers), "--threads", str(threads)]
+    return {
+        "flask dev server": [sys.executable, os.path.join(PROJECT_ROOT, "days", "day14_flask_app.py")],
+        "gunicorn (preload)": serve + ["--server", "gunicorn"] + pool,
+        "gunicorn (no preload)": serve + ["--server", "gunicorn", "--no_preload"] + pool,
+        "waitress": serve + ["--server", "waitress", "--threads", str(threads)],
+    }
+
+
+def wait_ready(port: int, timeout: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/readyz")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} not ready after {timeout}s")
+
+
+def body(n: int) -> bytes:
+    return json.dumps([{"title": f"Metal Tree of Life Wall Art {n}", "ptype": "metal_wall_art"}]).encode("utf-8")
+
+
+def drive(port: int, clients: int, seconds: float, distinct: bool = False) -> Tuple[int, int, List[float]]:
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    stop = time.monotonic() + seconds
+    counter = itertools.count()
+
+    def client() -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        local: List[float] = []
+        while time.monotonic() < stop:
+            start = time.perf_counter()
+            try:
+                conn.request("POST", "/api/v1/generate", body=body(next(counter)) if distinct else BODY, headers={"Content-Type": "application/json"})
+                resp = conn.getresponse()
+                resp.read()
+                ok = resp.status == 200
+            except OSError:
+                ok = False
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            if ok:
+                local.append(time.perf_counter() - start)
+            else:
+                with lock:
+                    errors[0] += 1
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return len(latencies), errors[0], sorted(latencies)
+
+
+def tree_memory(pid: int) -> Tuple[float, float]:
+    """``(RSS, PSS)`` in MiB summed over ``pid`` and its descendants (Linux only)."""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+                children.setdefault(ppid, []).append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+    rss = pss = 0
+    todo = [pid]
+    while todo:
+        p = todo.pop()
+        todo.extend(children.get(p, []))
+        try:
+            with open(f"/proc/{p}/smaps_rollup") as f:
+                for line in f:
+                    if line.startswith("Rss:"):
+                        rss += int(line.split()[1])
+                    elif line.startswith("Pss:"):
+                        pss += int(line.split()[1])
+        except OSError:
+            continue
+    return rss / 1024, pss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="web serving throughput benchmark")
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument("--distinct", action="store_true", help="Unique title per request (generation cache misses)")
+    parser.add_argument("--modes", nargs="*", default=None, help="Subset of modes to run")
+    args = parser.parse_args()
+
+    rows = []
+    for name, cmd in commands(args.port, args.workers, args.threads).items():
+        if args.modes and name.split()[0] not in args.modes and name not in args.modes:
+            continue
+        env = {**os.environ, "PORT": str(args.port), "PYTHONPATH": PROJECT_ROOT}
+        proc = subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            started = time.monotonic()
+            wait_ready(args.port)
+            ready_s = time.monotonic() - started
+            drive(args.port, 2, 1.0)  # warm-up
+            n, errors, lat = drive(args.port, args.clients, args.seconds, args.distinct)
+            rss, pss = tree_memory(proc.pid)
+        finally:
+            proc.send_signal(signal.SIGTERM)
+            try:
+                proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        p50 = lat[len(lat) // 2] * 1000 if lat else float("nan")
+        p99 = lat[int(len(lat) * 0.99)] * 1000 if lat else float("nan")
+        rows.append((name, n / args.seconds, p50, p99, errors, ready_s, rss, pss))
+
+    print(
+        f"workers={args.workers} threads={args.threads} clients={args.clients} seconds={args.seconds} "
+        f"distinct={args.distinct} cpus={os.cpu_count()}"
+    )
+    print("| Server | req/s | p50 (ms) | p99 (ms) | errors | ready (s) | RSS (MiB) | PSS (MiB) |")
+    print("|---|---|---|---|---|---|---|---|")
+    for name, rps, p50, p99, errors, ready_s, rss, pss in rows:
+        print(f"| {name} | {rps:.0f} | {p50:.1f} | {p99:.1f} | {errors} | {ready_s:.1f} | {rss:.0f} | {pss:.0f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Cold-start cost: module import times (``python -X importtime``), CLI ``--help``
+latency and web app time-to-listen / time-to-ready.
+
+Every measurement runs in a fresh interpreter. For imports, the
+``-X importtime`` log is parsed and the heaviest top-level packages are
+listed, which is where to look when a new import slows startup down.
+
+Usage: python benchmarks/bench_startup.py --repeat 5 --top 8
+"""
+
+import argparse
+import http.client
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+MODULES = (
+    "src.web",
+    "src.web.service",
+    "src.models.pipeline",
+    "src.models.training",
+    "src.utils.stats",
+    "src.utils.advanced_scrape",
+)
+
+SCRIPTS = (
+    "days/serve.py",
+    "days/batch_score.py",
+    "days/day12_train_eval.py",
+    "days/incremental_train.py",
+    "days/day08_top_sellers_common_terms.py",
+    "days/advanced_scraper.py",
+)
+
+
+def _env() -> Dict[str, str]:
+    return {**os.environ, "PYTHONPATH": PROJECT_ROOT}
+
+
+def _imports(code: str) -> List[Tuple[int, str, float]]:
+    """``(depth, name, cumulative ms)`` for every import ``-X importtime`` logs while running ``code``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, env=_env(), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+            rows.append((depth, name.strip(), int(cumulative) / 1000.0))
+    return rows
+
+
+def import_profile(module: str, baseline: frozenset) -> Tuple[float, Dict[str, float]]:
+    """``(total_ms, {third-party package: cumulative ms})``, excluding interpreter startup imports.
+
+    A package's figure is its most expensive entry point, which includes
+    whatever it imports in turn, so the figures overlap.
+    """
+    total = 0.0
+    packages: Dict[str, float] = {}
+    for depth, name, ms in _imports(f"import {module}"):
+        if name in baseline:
+            continue
+        if depth == 0:
+            total += ms
+        top = name.split(".")[0]
+        if top != "src" and not top.startswith("_"):
+            packages[top] = max(packages.get(top, 0.0), ms)
+    return total, packages
+
+
+def wall_ms(cmd: List[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(cmd, cwd=PROJECT_ROOT, env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def _status(port: int, path: str) -> int:
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+        conn.request("GET", path)
+        return conn.getresponse().status
+    except OSError:
+        return 0
+
+
+def app_cold_start(port: int, timeout: float = 120.0) -> Tuple[float, float]:
+    """Seconds until the dev server answers ``/healthz`` and until ``/readyz`` is 200."""
+    cmd = [sys.executable, os.path.join(PROJECT_ROOT, "days", "day14_flask_app.py")]
+    started = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=PROJECT_ROOT, env={**_env(), "PORT": str(port)}, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    listening = ready = float("nan")
+    try:
+        deadline = started + timeout
+        while time.perf_counter() < deadline:
+            if listening != listening and _status(port, "/healthz") == 200:
+                listening = time.perf_counter() - started
+            if _status(port, "/readyz") == 200:
+                ready = time.perf_counter() - started
+                listening = ready if listening != listening else listening
+                break
+            time.sleep(0.02)
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    return listening, ready
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="startup time benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (median reported)")
+    parser.add_argument("--top", type=int, default=6, help="Heaviest top-level packages listed per module")
+    parser.add_argument("--port", type=int, default=5098)
+    parser.add_argument("--no_app", action="store_true", help="Skip the web app cold start")
+    args = parser.parse_args()
+
+    baseline = frozenset(name for _, name, _ in _imports("pass"))
+    print("| Module | import (ms) | heaviest packages (ms) |")
+    print("|---|---|---|")
+    for module in MODULES:
+        runs = [import_profile(module, baseline) for _ in range(args.repeat)]
+        total = statistics.median(t for t, _ in runs)
+        packages = min(runs, key=lambda r: abs(r[0] - total))[1]
+        heavy = sorted(packages.items(), key=lambda kv: -kv[1])[: args.top]
+        print(f"| {module} | {total:.0f} | {', '.join(f'{k} {v:.0f}' for k, v in heavy)} |")
+
+    print()
+    print("| Script | --help (ms) |")
+    print("|---|---|")
+    for script in SCRIPTS:
+        ms = statistics.median(wall_ms([sys.executable, script, "--help"]) for _ in range(args.repeat))
+        print(f"| {script} | {ms:.0f} |")
+
+    if not args.no_app:
+        listening, ready = app_cold_start(args.port)
+        print()
+        print(f"web app (days/day14_flask_app.py): listening after {listening:.2f}s, ready after {ready:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -58,6 +58,7 @@ def main() -> None:
     parser.add_argument("--delay", type=float, default=1.5, help="Delay between requests (seconds)")
     parser.add_argument("--output", default="data/raw/advanced_products", help="Output file prefix")
     parser.add_argument("--format", choices=["csv", "json", "both"], default="both", help="Output format")
+    parser.add_argument("--json-array", action="store_true", help="Write JSON as a single array instead of JSONL")
     parser.add_argument("--async", action="store_true", dest="use_async", help="Use async scraping (faster)")
     parser.add_argument("--categories", help="YAML file with multiple categories")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
@@ -129,8 +130,8 @@ def main() -> None:
             console.print(f"[green]Saved CSV: {csv_file}[/green]")
         
         if args.format in ["json", "both"]:
-            json_file = f"{args.output}.json"
-            save_products_json(all_products, json_file)
+            json_file = f"{args.output}.json" if args.json_array else f"{args.output}.jsonl"
+            save_products_json(all_products, json_file, lines=not args.json_array)
             console.print(f"[green]Saved JSON: {json_file}[/green]")
         
         # Also save in the old format for compatibility
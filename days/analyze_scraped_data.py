@@ -2,9 +2,10 @@
 """Gelişmiş veri analizi ve görselleştirme."""
 
 import argparse
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Optional, Sequence
 
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -15,16 +16,17 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from src.utils.analytics import compute_analytics, compute_pricing, compute_titles
+from src.utils.io import load_json_frame
+
 console = Console()
 
 def load_data(file_path: str) -> pd.DataFrame:
-    """Load data from CSV or JSON file."""
+    """Load data from CSV, JSON array or JSONL file (JSON is streamed in batches)."""
     path = Path(file_path)
     
-    if path.suffix == '.json':
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return pd.DataFrame(data)
+    if path.suffix in ('.json', '.jsonl'):
+        return load_json_frame(file_path)
     else:
         return pd.read_csv(file_path)
 
@@ -42,142 +44,161 @@ def analyze_pricing(df: pd.DataFrame) -> Dict[str, Any]:
     """Analyze pricing patterns."""
     if 'price_clean' not in df.columns:
         return {}
-    
-    price_stats = df['price_clean'].describe()
-    
-    # Price ranges
-    price_ranges = {
-        'Under $10': len(df[df['price_clean'] < 10]),
-        '$10-$25': len(df[(df['price_clean'] >= 10) & (df['price_clean'] < 25)]),
-        '$25-$50': len(df[(df['price_clean'] >= 25) & (df['price_clean'] < 50)]),
-        '$50-$100': len(df[(df['price_clean'] >= 50) & (df['price_clean'] < 100)]),
-        'Over $100': len(df[df['price_clean'] >= 100]),
-    }
-    
-    return {
-        'stats': price_stats.to_dict(),
-        'ranges': price_ranges,
-        'median': df['price_clean'].median(),
-        'mean': df['price_clean'].mean(),
-    }
+    return compute_pricing(df['price_clean'])
 
 def analyze_titles(df: pd.DataFrame) -> Dict[str, Any]:
     """Analyze product titles for common words and patterns."""
     if 'title' not in df.columns:
         return {}
-    
-    # Combine all titles
-    all_titles = ' '.join(df['title'].fillna('').astype(str))
-    
-    # Common words analysis
-    words = all_titles.lower().split()
-    word_freq = pd.Series(words).value_counts().head(20)
-    
-    # Title length analysis
-    title_lengths = df['title'].str.len()
-    
-    return {
-        'word_frequency': word_freq.to_dict(),
-        'avg_title_length': title_lengths.mean(),
-        'title_length_stats': title_lengths.describe().to_dict(),
-    }
-
-def create_visualizations(df: pd.DataFrame, output_dir: str) -> None:
-    """Create comprehensive visualizations."""
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-    
-    # Set style
+    return compute_titles(df['title'])
+
+def _save_figure(fig: Any, out_base: Path, dpi: int, formats: Sequence[str]) -> List[str]:
+    paths = []
+    for fmt in formats:
+        path = out_base.with_suffix(f'.{fmt}')
+        fig.savefig(path, dpi=dpi, bbox_inches='tight')
+        paths.append(str(path))
+    plt.close(fig)
+    return paths
+
+def _plot_price_analysis(payload: Dict[str, Any]) -> Any:
+    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+
+    # Price histogram
+    axes[0, 0].hist(payload['prices'], bins=30, alpha=0.7)
+    axes[0, 0].set_title('Price Distribution')
+    axes[0, 0].set_xlabel('Price ($)')
+    axes[0, 0].set_ylabel('Frequency')
+
+    # Price box plot
+    axes[0, 1].boxplot(payload['prices'])
+    axes[0, 1].set_title('Price Box Plot')
+    axes[0, 1].set_ylabel('Price ($)')
+
+    # Price vs Rating (if available)
+    if payload.get('price_rating') is not None and len(payload['price_rating']):
+        pr = payload['price_rating']
+        axes[1, 0].scatter(pr[:, 0], pr[:, 1], alpha=0.6)
+        axes[1, 0].set_title('Price vs Rating')
+        axes[1, 0].set_xlabel('Price ($)')
+        axes[1, 0].set_ylabel('Rating')
+
+    # Top sellers by product count
+    if payload.get('top_sellers'):
+        names, counts = zip(*payload['top_sellers'])
+        axes[1, 1].bar(range(len(counts)), counts)
+        axes[1, 1].set_title('Top Sellers by Product Count')
+        axes[1, 1].set_xlabel('Seller Rank')
+        axes[1, 1].set_ylabel('Product Count')
+        axes[1, 1].set_xticks(range(len(counts)))
+        axes[1, 1].set_xticklabels(names, rotation=45, ha='right')
+
+    fig.tight_layout()
+    return fig
+
+def _plot_wordcloud(payload: Dict[str, Any]) -> Any:
+    wordcloud = WordCloud(
+        width=800, height=400,
+        background_color='white',
+        max_words=100,
+        colormap='viridis'
+    ).generate_from_frequencies(payload['frequencies'])
+
+    fig = plt.figure(figsize=(10, 5))
+    plt.imshow(wordcloud, interpolation='bilinear')
+    plt.axis('off')
+    plt.title('Most Common Words in Product Titles', fontsize=16)
+    fig.tight_layout()
+    return fig
+
+def _plot_seller_analysis(payload: Dict[str, Any]) -> Any:
+    fig, ax = plt.subplots(figsize=(12, 8))
+    pd.Series(payload['counts'], index=payload['sellers']).plot(kind='bar', ax=ax)
+    ax.set_title('Top 20 Sellers by Product Count')
+    ax.set_xlabel('Seller')
+    ax.set_ylabel('Product Count')
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    return fig
+
+_PLOTTERS = {
+    'price_analysis': _plot_price_analysis,
+    'wordcloud': _plot_wordcloud,
+    'seller_analysis': _plot_seller_analysis,
+}
+
+def _render_chart(name: str, payload: Dict[str, Any], out_base: Path, dpi: int, formats: Sequence[str]) -> List[str]:
+    """Render one chart; runs in a worker process, so it only sees its payload."""
+    plt.switch_backend('Agg')
     plt.style.use('seaborn-v0_8')
     sns.set_palette("husl")
-    
+    return _save_figure(_PLOTTERS[name](payload), out_base, dpi, formats)
+
+def build_chart_jobs(df: pd.DataFrame, analytics: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Extract the small per-chart payloads from the precomputed analytics."""
+    jobs: Dict[str, Dict[str, Any]] = {}
+    sellers = analytics.get('sellers')
+
     # 1. Price distribution
-    if 'price_clean' in df.columns:
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        
-        # Price histogram
-        axes[0, 0].hist(df['price_clean'].dropna(), bins=30, alpha=0.7)
-        axes[0, 0].set_title('Price Distribution')
-        axes[0, 0].set_xlabel('Price ($)')
-        axes[0, 0].set_ylabel('Frequency')
-        
-        # Price box plot
-        axes[0, 1].boxplot(df['price_clean'].dropna())
-        axes[0, 1].set_title('Price Box Plot')
-        axes[0, 1].set_ylabel('Price ($)')
-        
-        # Price vs Rating (if available)
+    if 'pricing' in analytics:
+        payload: Dict[str, Any] = {'prices': df['price_clean'].dropna().to_numpy()}
         if 'rating' in df.columns:
-            df_clean = df.dropna(subset=['price_clean', 'rating'])
-            if not df_clean.empty:
-                axes[1, 0].scatter(df_clean['price_clean'], df_clean['rating'], alpha=0.6)
-                axes[1, 0].set_title('Price vs Rating')
-                axes[1, 0].set_xlabel('Price ($)')
-                axes[1, 0].set_ylabel('Rating')
-        
-        # Top sellers by product count
-        if 'seller' in df.columns:
-            top_sellers = df['seller'].value_counts().head(10)
-            axes[1, 1].bar(range(len(top_sellers)), top_sellers.values)
-            axes[1, 1].set_title('Top Sellers by Product Count')
-            axes[1, 1].set_xlabel('Seller Rank')
-            axes[1, 1].set_ylabel('Product Count')
-            axes[1, 1].set_xticks(range(len(top_sellers)))
-            axes[1, 1].set_xticklabels(top_sellers.index, rotation=45, ha='right')
-        
-        plt.tight_layout()
-        plt.savefig(output_path / 'price_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
-    
-    # 2. Word cloud from titles
-    if 'title' in df.columns:
+            pr = pd.DataFrame({'p': df['price_clean'], 'r': pd.to_numeric(df['rating'], errors='coerce')}).dropna()
+            payload['price_rating'] = pr.to_numpy()
+        if sellers is not None:
+            payload['top_sellers'] = list(sellers['count'].head(10).items())
+        jobs['price_analysis'] = payload
+
+    # 2. Word cloud: tokenize once here so workers only receive the top frequencies
+    if 'titles' in analytics:
         all_titles = ' '.join(df['title'].fillna('').astype(str))
-        if all_titles.strip():
-            wordcloud = WordCloud(
-                width=800, height=400, 
-                background_color='white',
-                max_words=100,
-                colormap='viridis'
-            ).generate(all_titles)
-            
-            plt.figure(figsize=(10, 5))
-            plt.imshow(wordcloud, interpolation='bilinear')
-            plt.axis('off')
-            plt.title('Most Common Words in Product Titles', fontsize=16)
-            plt.tight_layout()
-            plt.savefig(output_path / 'wordcloud.png', dpi=300, bbox_inches='tight')
-            plt.close()
-    
+        freqs = WordCloud().process_text(all_titles)
+        top = sorted(freqs.items(), key=lambda item: item[1], reverse=True)[:100]
+        if top:
+            jobs['wordcloud'] = {'frequencies': dict(top)}
+
     # 3. Seller analysis
-    if 'seller' in df.columns:
-        seller_stats = df.groupby('seller').agg({
-            'price_clean': ['count', 'mean', 'median'] if 'price_clean' in df.columns else 'count',
-            'title': 'count'
-        }).round(2)
-        
-        # Flatten column names
-        seller_stats.columns = ['_'.join(col).strip() for col in seller_stats.columns]
-        seller_stats = seller_stats.sort_values('title_count', ascending=False).head(20)
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
-        seller_stats['title_count'].plot(kind='bar', ax=ax)
-        ax.set_title('Top 20 Sellers by Product Count')
-        ax.set_xlabel('Seller')
-        ax.set_ylabel('Product Count')
-        ax.tick_params(axis='x', rotation=45)
-        plt.tight_layout()
-        plt.savefig(output_path / 'seller_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
-
-def generate_report(df: pd.DataFrame, output_dir: str) -> str:
+    if sellers is not None:
+        top = sellers['count'].head(20)
+        jobs['seller_analysis'] = {'sellers': top.index.tolist(), 'counts': top.tolist()}
+
+    return jobs
+
+def create_visualizations(
+    df: pd.DataFrame,
+    output_dir: str,
+    analytics: Optional[Dict[str, Any]] = None,
+    dpi: int = 300,
+    formats: Sequence[str] = ('png',),
+    workers: int = 1,
+) -> List[str]:
+    """Create comprehensive visualizations, optionally in parallel processes."""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    if analytics is None:
+        analytics = compute_analytics(df)
+
+    jobs = build_chart_jobs(df, analytics)
+    args = [(name, payload, output_path / name, dpi, tuple(formats)) for name, payload in jobs.items()]
+    if workers <= 1 or len(args) <= 1:
+        results = [_render_chart(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(args))) as pool:
+            results = list(pool.map(_render_chart, *zip(*args)))
+    return [p for paths in results for p in paths]
+
+def generate_report(df: pd.DataFrame, output_dir: str, analytics: Optional[Dict[str, Any]] = None) -> str:
     """Generate comprehensive analysis report."""
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
-    
+    if analytics is None:
+        analytics = compute_analytics(df)
+    total = analytics['total']
+
     report_lines = [
         "# Etsy Scraped Data Analysis Report",
         "",
-        f"**Total Products:** {len(df)}",
+        f"**Total Products:** {total}",
         f"**Analysis Date:** {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}",
         "",
         "## Data Overview",
@@ -185,13 +206,13 @@ def generate_report(df: pd.DataFrame, output_dir: str) -> str:
     ]
     
     # Basic stats
-    report_lines.append(f"- **Columns:** {', '.join(df.columns.tolist())}")
-    report_lines.append(f"- **Missing Data:** {df.isnull().sum().sum()} cells")
+    report_lines.append(f"- **Columns:** {', '.join(analytics['columns'])}")
+    report_lines.append(f"- **Missing Data:** {analytics['missing_cells']} cells")
     report_lines.append("")
     
     # Price analysis
-    if 'price_clean' in df.columns:
-        price_analysis = analyze_pricing(df)
+    if 'pricing' in analytics:
+        price_analysis = analytics['pricing']
         report_lines.extend([
             "## Price Analysis",
             "",
@@ -202,13 +223,13 @@ def generate_report(df: pd.DataFrame, output_dir: str) -> str:
         ])
         
         for range_name, count in price_analysis.get('ranges', {}).items():
-            percentage = (count / len(df)) * 100
+            percentage = (count / total) * 100
             report_lines.append(f"- **{range_name}:** {count} products ({percentage:.1f}%)")
         report_lines.append("")
     
     # Title analysis
-    if 'title' in df.columns:
-        title_analysis = analyze_titles(df)
+    if 'titles' in analytics:
+        title_analysis = analytics['titles']
         report_lines.extend([
             "## Title Analysis",
             "",
@@ -222,8 +243,8 @@ def generate_report(df: pd.DataFrame, output_dir: str) -> str:
         report_lines.append("")
     
     # Seller analysis
-    if 'seller' in df.columns:
-        top_sellers = df['seller'].value_counts().head(10)
+    if 'sellers' in analytics:
+        top_sellers = analytics['sellers']['count'].head(10)
         report_lines.extend([
             "## Top Sellers",
             "",
@@ -243,9 +264,12 @@ def generate_report(df: pd.DataFrame, output_dir: str) -> str:
 
 def main():
     parser = argparse.ArgumentParser(description="Gelişmiş veri analizi")
-    parser.add_argument("--input", required=True, help="Input CSV or JSON file")
+    parser.add_argument("--input", required=True, help="Input CSV, JSON or JSONL file")
     parser.add_argument("--output", default="outputs/analysis", help="Output directory")
     parser.add_argument("--format", choices=["csv", "json"], default="csv", help="Input format")
+    parser.add_argument("--dpi", type=int, default=300, help="Chart resolution")
+    parser.add_argument("--plot-formats", default="png", help="Comma-separated chart formats (png,svg,pdf)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Chart rendering processes")
     
     args = parser.parse_args()
     
@@ -266,13 +290,18 @@ def main():
         console.print("[yellow]Cleaning data...[/yellow]")
         df = clean_price_data(df)
         
+        # Compute statistics once for both report and charts
+        console.print("[yellow]Computing statistics...[/yellow]")
+        analytics = compute_analytics(df)
+
         # Create visualizations
         console.print("[yellow]Creating visualizations...[/yellow]")
-        create_visualizations(df, args.output)
+        formats = [f.strip() for f in args.plot_formats.split(',') if f.strip()]
+        create_visualizations(df, args.output, analytics, dpi=args.dpi, formats=formats, workers=args.workers)
         
         # Generate report
         console.print("[yellow]Generating report...[/yellow]")
-        report_file = generate_report(df, args.output)
+        report_file = generate_report(df, args.output, analytics)
         
         # Display summary
         console.print("\n[bold green]Analysis Complete![/bold green]")
@@ -280,16 +309,16 @@ def main():
         console.print(f"Visualizations saved to: {args.output}/")
         
         # Show basic stats
-        if 'price_clean' in df.columns:
-            price_stats = analyze_pricing(df)
+        if 'pricing' in analytics:
+            price_stats = analytics['pricing']
             table = Table(title="Price Statistics")
             table.add_column("Metric", style="cyan")
             table.add_column("Value", style="green")
             
             table.add_row("Mean", f"${price_stats.get('mean', 0):.2f}")
             table.add_row("Median", f"${price_stats.get('median', 0):.2f}")
-            table.add_row("Min", f"${df['price_clean'].min():.2f}")
-            table.add_row("Max", f"${df['price_clean'].max():.2f}")
+            table.add_row("Min", f"${price_stats.get('min', 0):.2f}")
+            table.add_row("Max", f"${price_stats.get('max', 0):.2f}")
             
             console.print(table)
         
@@ -0,0 +1,41 @@
+import argparse
+import os
+import sys
+
+# Ensure project root is on sys.path when running from days/
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.models.scoring import score_file
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Toplu başlık puanlama (CSV/JSONL/Parquet)")
+    parser.add_argument("--input", required=True, help="Aday başlıklar (title ve isteğe bağlı price_value sütunları)")
+    parser.add_argument("--pipeline", default="models/day12_pipeline.joblib", help="Model paketi (Day 12)")
+    parser.add_argument("--out", default="outputs/batch_scores.csv", help="Çıktı CSV (.gz destekli)")
+    parser.add_argument("--title_col", default="title", help="Modelin metin sütunu yoksa kullanılacak başlık sütunu")
+    parser.add_argument("--chunksize", type=int, default=50000, help="Parça başına satır")
+    parser.add_argument("--workers", type=int, default=0, help="Süreç sayısı (0 = tüm çekirdekler, 1 = tek süreç)")
+    parser.add_argument("--top_k", type=int, default=5, help="Satır başına en etkili terim sayısı")
+    args = parser.parse_args()
+
+    stats = score_file(
+        args.pipeline,
+        args.input,
+        args.out,
+        chunksize=args.chunksize,
+        workers=args.workers or None,
+        top_k=args.top_k,
+        title_col=args.title_col,
+    )
+    print(
+        f"Scored {stats['rows']} titles in {stats['seconds']:.2f}s "
+        f"({stats['titles_per_second']:.0f} titles/s) -> {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 import argparse
 import re
+from typing import Iterator, Optional
 
 import pandas as pd
 
+from src.utils.dedupe import HashedKeyIndex, NearDuplicateIndex
+from src.utils.io import iter_table_chunks, read_table, write_csv_chunks
+from src.utils.stats import snapshot_from_csv
+
 
 def parse_price_to_float(price_str: str) -> float:
     if not isinstance(price_str, str):
@@ -16,29 +21,77 @@ def parse_price_to_float(price_str: str) -> float:
         return float("nan")
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Day 04: Veri temizleme")
-    parser.add_argument("--input", required=True, help="Ham CSV yolu (Day 02/03 çıktısı)")
-    parser.add_argument("--output", default="data/processed/day04_clean.csv", help="Temiz CSV çıktısı")
-    args = parser.parse_args()
-
-    df = pd.read_csv(args.input)
+def clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Row-local cleaning steps shared by the in-memory and chunked paths."""
     # Drop completely empty rows
-    df = df.dropna(how="all")
+    df = df.dropna(how="all").copy()
     # Basic trims
     df["title"] = df["title"].fillna("").astype(str).str.strip()
     df["url"] = df["url"].fillna("").astype(str).str.strip()
     # Price to float
     df["price_value"] = df["price"].apply(parse_price_to_float)
     # Remove rows without title or url
-    df = df[(df["title"] != "") & (df["url"] != "")]
+    return df[(df["title"] != "") & (df["url"] != "")]
+
+
+def mark_near_duplicates(df: pd.DataFrame, index: Optional[NearDuplicateIndex], mode: str) -> pd.DataFrame:
+    """Cluster near-duplicate titles/URLs; "drop" keeps the first row of each cluster."""
+    if index is None or df.empty:
+        return df
+    assigned = [index.assign(t, u) for t, u in zip(df["title"], df["url"])]
+    if mode == "drop":
+        return df[[not dup for _, dup in assigned]]
+    df = df.copy()
+    df["dup_cluster"] = [cluster for cluster, _ in assigned]
+    return df
+
+
+def clean_in_memory(path: str, near_index: Optional[NearDuplicateIndex] = None, near_mode: str = "off") -> pd.DataFrame:
+    df = clean_frame(read_table(path))
     # Drop duplicates by url
-    df = df.drop_duplicates(subset=["url"]) 
+    df = df.drop_duplicates(subset=["url"])
+    return mark_near_duplicates(df, near_index, near_mode)
 
-    df.to_csv(args.output, index=False)
-    print(f"Saved cleaned data: {args.output} (rows={len(df)})")
+
+def iter_clean_chunks(
+    path: str, chunksize: int, near_index: Optional[NearDuplicateIndex] = None, near_mode: str = "off"
+) -> Iterator[pd.DataFrame]:
+    """Stream cleaned chunks; URL dedupe spans chunks via a hashed index."""
+    seen = HashedKeyIndex()
+    for chunk in iter_table_chunks(path, chunksize):
+        chunk = clean_frame(chunk)
+        yield mark_near_duplicates(chunk[seen.mark_new(chunk["url"])], near_index, near_mode)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Day 04: Veri temizleme")
+    parser.add_argument("--input", required=True, help="Ham CSV/JSONL yolu (Day 02/03 veya gelişmiş scraper çıktısı)")
+    parser.add_argument("--output", default="data/processed/day04_clean.csv", help="Temiz CSV çıktısı")
+    parser.add_argument("--chunksize", type=int, default=0, help="Parça başına satır (0 = tümünü belleğe al)")
+    parser.add_argument("--near_dupes", choices=["off", "drop", "cluster"], default="off", help="Benzer başlık/URL tespiti (MinHash-LSH)")
+    parser.add_argument("--similarity", type=float, default=0.8, help="Benzerlik eşiği (tahmini Jaccard)")
+    parser.add_argument("--num_perm", type=int, default=64, help="MinHash imza uzunluğu")
+    parser.add_argument(
+        "--stats_out", default="data/processed/day04_stats.json", help="Web uygulaması için istatistik özeti ('' = yazma)"
+    )
+    args = parser.parse_args()
+
+    near_index = None
+    if args.near_dupes != "off":
+        near_index = NearDuplicateIndex(threshold=args.similarity, num_perm=args.num_perm)
+
+    if args.chunksize > 0:
+        chunks = iter_clean_chunks(args.input, args.chunksize, near_index, args.near_dupes)
+        rows = write_csv_chunks(args.output, chunks)
+    else:
+        df = clean_in_memory(args.input, near_index, args.near_dupes)
+        df.to_csv(args.output, index=False)
+        rows = len(df)
+    print(f"Saved cleaned data: {args.output} (rows={rows})")
+    if args.stats_out:
+        stats = snapshot_from_csv(args.output, args.stats_out)
+        print(f"Saved stats snapshot: {args.stats_out} (version={stats['version']})")
 
 
 if __name__ == "__main__":
     main()
-
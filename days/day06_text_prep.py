@@ -2,25 +2,32 @@ import argparse
 
 import pandas as pd
 
+from src.utils.io import iter_table_chunks, read_table, write_csv_chunks
 from src.utils.text import preprocess_text
 
 
+def prep_frame(df: pd.DataFrame) -> pd.DataFrame:
+    if "title" in df.columns:
+        df["title_clean"] = df["title"].fillna("").astype(str).apply(preprocess_text)
+    if "description" in df.columns:
+        df["description_clean"] = df["description"].fillna("").astype(str).apply(preprocess_text)
+    return df
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Day 06: Metin ön işleme (title/description)")
     parser.add_argument("--input", required=True, help="Temiz CSV (Day 04)")
     parser.add_argument("--output", default="data/processed/day06_text.csv", help="Ön işlenmiş CSV")
+    parser.add_argument("--chunksize", type=int, default=0, help="Parça başına satır (0 = tümünü belleğe al)")
     args = parser.parse_args()
 
-    df = pd.read_csv(args.input)
-    if "title" in df.columns:
-        df["title_clean"] = df["title"].fillna("").astype(str).apply(preprocess_text)
-    if "description" in df.columns:
-        df["description_clean"] = df["description"].fillna("").astype(str).apply(preprocess_text)
-
-    df.to_csv(args.output, index=False)
+    if args.chunksize > 0:
+        write_csv_chunks(args.output, (prep_frame(c) for c in iter_table_chunks(args.input, args.chunksize)))
+    else:
+        df = prep_frame(read_table(args.input))
+        df.to_csv(args.output, index=False)
     print(f"Saved preprocessed text to {args.output}")
 
 
 if __name__ == "__main__":
     main()
-
@@ -1,31 +1,45 @@
 import argparse
 import json
+import os
+from typing import Iterable, Iterator, List, Tuple, Union
 
 import pandas as pd
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+from src.utils.io import file_digest, iter_csv_chunks
+from src.utils.tfidf import (
+    DocFreqStore,
+    HashedDocFreqStore,
+    StreamingTfidf,
+    build_analyzer,
+    column_maxima,
+    hashing_vectorizer,
+    resolve_hashed_terms,
+    save_chunked_matrix,
+    top_k_indices,
+)
 
-def top_terms_from_tfidf(vectorizer: TfidfVectorizer, matrix, top_k: int = 50):
-    import numpy as np
+
+def top_terms_from_tfidf(
+    vectorizer: TfidfVectorizer, matrix: Union[sparse.spmatrix, Iterable[sparse.spmatrix]], top_k: int = 50
+) -> List[Tuple[str, float]]:
     terms = vectorizer.get_feature_names_out()
-    scores = matrix.max(axis=0).toarray().ravel()
-    idx = np.argsort(scores)[::-1][:top_k]
-    return [(terms[i], float(scores[i])) for i in idx]
+    chunks = [matrix] if sparse.issparse(matrix) else matrix
+    scores = column_maxima(chunks)
+    return [(terms[i], float(scores[i])) for i in top_k_indices(scores, top_k)]
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Day 07: TF-IDF hesaplama (title_clean)")
-    parser.add_argument("--input", required=True, help="Ön işlenmiş CSV (Day 06)")
-    parser.add_argument("--top_k", type=int, default=50, help="Listelenecek en önemli kelime sayısı")
-    parser.add_argument("--out_terms", default="outputs/day07_top_terms.json", help="Top terms JSON")
-    parser.add_argument("--out_matrix", default="data/processed/day07_tfidf.npz", help="TF-IDF matris (sparse)")
-    parser.add_argument("--out_vocab", default="data/processed/day07_vocab.json", help="Vocab JSON")
-    args = parser.parse_args()
+def iter_corpus(path: str, chunksize: int) -> Iterator[List[str]]:
+    for chunk in iter_csv_chunks(path, chunksize):
+        yield chunk["title_clean"].fillna("").astype(str).tolist()
+
 
-    df = pd.read_csv(args.input)
+def run_in_memory(args: argparse.Namespace) -> None:
+    df = pd.read_csv(args.input, dtype=str)
     corpus = df["title_clean"].fillna("").astype(str).tolist()
 
-    vectorizer = TfidfVectorizer(ngram_range=(1, 2), min_df=2)
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), min_df=args.min_df)
     X = vectorizer.fit_transform(corpus)
 
     top_terms = top_terms_from_tfidf(vectorizer, X, top_k=args.top_k)
@@ -33,7 +47,6 @@ def main() -> None:
         json.dump({"top_terms": top_terms}, f, ensure_ascii=False, indent=2)
 
     # Save matrix and vocab
-    from scipy import sparse
     sparse.save_npz(args.out_matrix, X)
     with open(args.out_vocab, "w", encoding="utf-8") as f:
         json.dump({"vocab": vectorizer.vocabulary_}, f, ensure_ascii=False)
@@ -41,6 +54,69 @@ def main() -> None:
     print(f"Saved TF-IDF: {args.out_matrix}, vocab: {args.out_vocab}, top terms: {args.out_terms}")
 
 
+def run_streaming(args: argparse.Namespace) -> None:
+    batch_id = file_digest(args.input)
+    analyzer = build_analyzer()
+    if args.hashing:
+        hstore = HashedDocFreqStore(args.df_store or "data/processed/day07_df_hashed.npz", n_features=args.n_features)
+        if not hstore.has_batch(batch_id):
+            hv = hashing_vectorizer(hstore.n_features)
+            for docs in iter_corpus(args.input, args.chunksize):
+                hstore.update_counts(batch_id, hv.transform(docs))
+            hstore.save()
+        tfidf = StreamingTfidf.from_hashed_store(hstore, min_df=args.min_df)
+        n_docs = hstore.n_docs
+    else:
+        store = DocFreqStore(args.df_store or "data/processed/day07_df.sqlite")
+        store.update(batch_id, (d for docs in iter_corpus(args.input, args.chunksize) for d in docs), analyzer)
+        tfidf = StreamingTfidf.from_store(store, min_df=args.min_df)
+        n_docs = store.n_docs
+        store.close()
+
+    prefix = os.path.splitext(args.out_matrix)[0]
+    matrices = (tfidf.transform(docs) for docs in iter_corpus(args.input, args.chunksize))
+    scores = column_maxima(save_chunked_matrix(prefix, matrices))
+    idx = top_k_indices(scores, args.top_k)
+
+    if tfidf.terms is not None:
+        names = {int(i): tfidf.terms[i] for i in idx}
+        vocab_path = os.path.splitext(args.out_vocab)[0] + ".txt"
+        with open(vocab_path, "w", encoding="utf-8") as f:
+            for term in tfidf.terms:
+                f.write(term + "\n")
+    else:
+        # Hashed columns have no names; one extra pass recovers them for the top-k only.
+        docs_iter = (d for docs in iter_corpus(args.input, args.chunksize) for d in docs)
+        names = resolve_hashed_terms(docs_iter, analyzer, idx, hstore.n_features)
+        vocab_path = "—"
+
+    top_terms = [(names.get(int(i), f"#{int(i)}"), float(scores[i])) for i in idx]
+    with open(args.out_terms, "w", encoding="utf-8") as f:
+        json.dump({"top_terms": top_terms}, f, ensure_ascii=False, indent=2)
+
+    print(f"Saved TF-IDF chunks: {prefix}.part*.npz, vocab: {vocab_path}, top terms: {args.out_terms} (docs in store={n_docs})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Day 07: TF-IDF hesaplama (title_clean)")
+    parser.add_argument("--input", required=True, help="Ön işlenmiş CSV (Day 06)")
+    parser.add_argument("--top_k", type=int, default=50, help="Listelenecek en önemli kelime sayısı")
+    parser.add_argument("--min_df", type=int, default=2, help="Terimin geçmesi gereken en az belge sayısı")
+    parser.add_argument("--out_terms", default="outputs/day07_top_terms.json", help="Top terms JSON")
+    parser.add_argument("--out_matrix", default="data/processed/day07_tfidf.npz", help="TF-IDF matris (sparse)")
+    parser.add_argument("--out_vocab", default="data/processed/day07_vocab.json", help="Vocab JSON")
+    parser.add_argument("--stream", action="store_true", help="Parçalı (out-of-core) TF-IDF; belge frekansları diskte")
+    parser.add_argument("--chunksize", type=int, default=50_000, help="--stream için parça başına satır")
+    parser.add_argument("--df_store", default=None, help="Birleştirilebilir belge frekansı deposu (sqlite/npz)")
+    parser.add_argument("--hashing", action="store_true", help="--stream ile HashingVectorizer (sabit bellek)")
+    parser.add_argument("--n_features", type=int, default=2**20, help="--hashing için kova sayısı")
+    args = parser.parse_args()
+
+    if args.stream:
+        run_streaming(args)
+    else:
+        run_in_memory(args)
+
+
 if __name__ == "__main__":
     main()
-
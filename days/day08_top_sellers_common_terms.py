@@ -1,7 +1,32 @@
 import argparse
-from collections import Counter
+import os
+from typing import Optional
 
-import pandas as pd
+from src.utils.termfreq import BUCKET_REST, BUCKET_TOP, TermCounts, count_csv
+
+
+def write_report(path: str, counts: TermCounts, args: argparse.Namespace, ptype: Optional[str]) -> None:
+    has_sales = any(b in (BUCKET_TOP, BUCKET_REST) for b in counts.buckets())
+    filtered = has_sales and args.threshold is not None
+    buckets = [BUCKET_TOP] if filtered else None
+    unigrams, rows = counts.select(ptype=ptype, buckets=buckets, n=1)
+    bigrams, _ = counts.select(ptype=ptype, buckets=buckets, n=2)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Day 08: Ortak Kelimeler\n\n")
+        if ptype:
+            f.write(f"Kategori: {ptype}\n\n")
+        if filtered:
+            f.write(f"Filtre: {args.sales_col} >= {args.threshold} (satır={rows})\n\n")
+        else:
+            f.write(f"Filtre: Yok (satır={rows})\n\n")
+        f.write("| Kelime | Frekans |\n|---|---|\n")
+        for w, c in unigrams.most_common(args.top_n):
+            f.write(f"| {w} | {c} |\n")
+        if bigrams:
+            f.write("\n## İkili Kelime Grupları\n\n| Kelime | Frekans |\n|---|---|\n")
+            for w, c in bigrams.most_common(args.top_n):
+                f.write(f"| {w} | {c} |\n")
 
 
 def main() -> None:
@@ -12,38 +37,33 @@ def main() -> None:
     parser.add_argument("--threshold", type=float, default=None, help="Üst eşik (örn. satış >= eşik)")
     parser.add_argument("--out", default="outputs/day08_common_terms.md", help="Rapor çıktısı")
     parser.add_argument("--ptype", default=None, help="Kategori filtresi (poster, canvas, vb.)")
+    parser.add_argument("--all_ptypes", action="store_true", help="Her kategori için ayrı rapor (tek geçiş)")
+    parser.add_argument("--counts_out", default="data/processed/day08_counts.sqlite", help="Sayım tablosu çıktısı")
+    parser.add_argument("--chunksize", type=int, default=50_000, help="Parça başına satır")
+    parser.add_argument("--workers", type=int, default=1, help="Paralel süreç sayısı")
     args = parser.parse_args()
 
-    df = pd.read_csv(args.input)
-    has_sales = args.sales_col in df.columns and df[args.sales_col].notna().any()
-    subset = df
-    if has_sales and args.threshold is not None:
-        subset = df[df[args.sales_col] >= args.threshold]
-    if args.ptype and "ptype" in df.columns:
-        subset = subset[subset["ptype"] == args.ptype]
+    counts = count_csv(
+        args.input, chunksize=args.chunksize, workers=args.workers, sales_col=args.sales_col, threshold=args.threshold
+    )
+    if args.counts_out:
+        counts.save(args.counts_out)
 
-    tokens = []
-    if "title_clean" in subset.columns:
-        tokens += " ".join(subset["title_clean"].fillna("").astype(str)).split()
-    if "description_clean" in subset.columns:
-        tokens += " ".join(subset["description_clean"].fillna("").astype(str)).split()
+    ptypes = [p for p in counts.ptypes() if p]
+    written = []
+    if args.all_ptypes and ptypes:
+        stem, ext = os.path.splitext(args.out)
+        for ptype in ptypes:
+            path = f"{stem}_{ptype}{ext}"
+            write_report(path, counts, args, ptype)
+            written.append(path)
+    else:
+        only: Optional[str] = args.ptype if args.ptype and ptypes else None
+        write_report(args.out, counts, args, only)
+        written.append(args.out)
 
-    freq = Counter(tokens)
-    common = freq.most_common(args.top_n)
-
-    with open(args.out, "w", encoding="utf-8") as f:
-        f.write("# Day 08: Ortak Kelimeler\n\n")
-        if has_sales and args.threshold is not None:
-            f.write(f"Filtre: {args.sales_col} >= {args.threshold} (satır={len(subset)})\n\n")
-        else:
-            f.write(f"Filtre: Yok (satır={len(subset)})\n\n")
-        f.write("| Kelime | Frekans |\n|---|---|\n")
-        for w, c in common:
-            f.write(f"| {w} | {c} |\n")
-
-    print(f"Saved report to {args.out}")
+    print(f"Saved report to {', '.join(written)}")
 
 
 if __name__ == "__main__":
     main()
-
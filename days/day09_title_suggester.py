@@ -1,23 +1,30 @@
 import argparse
 import json
-import random
+import os
+import sys
+
+# Ensure project root is on sys.path when running from days/
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.models.titles import TitleRanker
+from src.utils.erank import get_keyword_store
 
 
 def load_top_terms(path: str):
     with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)
     # list[(term, score)]
-    return [t for t, s in data.get("top_terms", [])]
+    return [(t, float(s)) for t, s in data.get("top_terms", [])]
 
 
-def suggest_titles(terms, k=5, length=6):
-    suggestions = []
-    pool = [t for t in terms if " " not in t]  # use unigrams primarily
-    for _ in range(k):
-        chosen = random.sample(pool, min(length, len(pool)))
-        title = " ".join(chosen).title()
-        suggestions.append(title)
-    return suggestions
+def suggest_titles(terms, k=5, length=6, ptype="metal_wall_art", model=None, erank=(), budget_ms=50.0, seed=None):
+    """Sample candidate titles and keep the ``k`` best by model score and eRank coverage."""
+    ranker = TitleRanker(terms, erank, seed=seed)
+    n = max(3, length)
+    ranked = ranker.suggest(ptype, k=k, model=model, budget_ms=budget_ms, length=(max(3, n - 2), n + 2))
+    return [c.title for c in ranked]
 
 
 def main() -> None:
@@ -26,10 +33,24 @@ def main() -> None:
     parser.add_argument("--out", default="outputs/day09_suggestions.txt", help="Öneriler çıktısı")
     parser.add_argument("--k", type=int, default=10, help="Öneri sayısı")
     parser.add_argument("--length", type=int, default=6, help="Başlıktaki kelime sayısı")
+    parser.add_argument("--ptype", default="metal_wall_art", help="Ürün türü (kategori kelimesi başlığın sonuna eklenir)")
+    parser.add_argument("--pipeline", default="", help="Adayları puanlayan model hattı (ör. models/day12_pipeline.joblib)")
+    parser.add_argument("--erank_csv", default="data/erank_keywords.csv", help="eRank anahtar kelime CSV (varsa kapsama puanı)")
+    parser.add_argument("--budget_ms", type=float, default=200.0, help="Aday üretme/puanlama için süre bütçesi (ms)")
+    parser.add_argument("--seed", type=int, default=None, help="Tekrarlanabilir örnekleme için tohum")
     args = parser.parse_args()
 
     terms = load_top_terms(args.top_terms)
-    suggestions = suggest_titles(terms, k=args.k, length=args.length)
+    model = None
+    if args.pipeline:
+        from src.models.pipeline import load_pipeline
+
+        model = load_pipeline(args.pipeline)
+    store = get_keyword_store(args.erank_csv)
+    erank = [(r["keyword"], int(r["volume"])) for r in store.rows(limit=200, min_volume=100)]
+    suggestions = suggest_titles(
+        terms, k=args.k, length=args.length, ptype=args.ptype, model=model, erank=erank, budget_ms=args.budget_ms, seed=args.seed
+    )
 
     with open(args.out, "w", encoding="utf-8") as f:
         for s in suggestions:
@@ -40,4 +61,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-
@@ -1,9 +1,28 @@
 import argparse
+from typing import Tuple
 
 import joblib
 import pandas as pd
 
-from src.models.training import TrainConfig, train_model
+from src.models.compiled import save_compiled
+from src.models.feature_store import FeatureSpec, FeatureStore, dataset_hash
+from src.models.pipeline import NUMERIC_COLS, save_pipeline
+from src.models.registry import ModelRegistry
+from src.models.selection import SearchGrid, grid_search, write_leaderboard
+from src.models.training import TrainConfig, train_pipeline
+
+
+def _floats(value: str) -> Tuple[float, ...]:
+    return tuple(float(v) for v in value.split(","))
+
+
+def _ngram(part: str) -> Tuple[int, int]:
+    lo, hi = part.split("-")
+    return int(lo), int(hi)
+
+
+def _ngrams(value: str) -> Tuple[Tuple[int, int], ...]:
+    return tuple(_ngram(part) for part in value.split(","))
 
 
 def main() -> None:
@@ -13,26 +32,94 @@ def main() -> None:
     parser.add_argument("--price_col", default="price_value", help="Fiyat sütunu")
     parser.add_argument("--label_col", default="label_high_sales", help="Etiket sütunu")
     parser.add_argument("--C", type=float, default=1.0, help="LogReg C")
+    parser.add_argument(
+        "--numeric_cols", default=",".join(NUMERIC_COLS), help="Sayısal sütunlar (virgülle; olmayanlar atlanır)"
+    )
+    parser.add_argument("--raw_numeric", action="store_true", help="Sayısal sütunları ölçeklemeden kullan (eski davranış)")
+    parser.add_argument("--skip_baseline", action="store_true", help="Ölçeklenmemiş fiyatla karşılaştırma eğitimini atla")
     parser.add_argument("--out_model", default="models/day12_logreg.joblib")
     parser.add_argument("--out_vec", default="models/day12_vectorizer.joblib")
+    parser.add_argument("--out_pipeline", default="models/day12_pipeline.joblib", help="Tek dosyalık model paketi")
+    parser.add_argument("--registry", default="models/registry", help="Model kayıt defteri klasörü ('' = kaydetme)")
+    parser.add_argument("--promote", action="store_true", help="Yeni sürümü kayıt defterinde hemen yayına al")
+    parser.add_argument("--out_scorer", default="models/day12_scorer.npz", help="sklearn'süz derlenmiş puanlayıcı ('' = yazma)")
     parser.add_argument("--report", default="outputs/day12_report.txt")
+    parser.add_argument("--features_dir", default="data/features", help="Özellik deposu ('' = kapalı)")
+    parser.add_argument("--search", action="store_true", help="Çapraz doğrulamalı hiperparametre araması yap")
+    parser.add_argument("--grid_C", default="0.01,0.1,1,10", help="Aranacak C değerleri (virgülle)")
+    parser.add_argument("--grid_penalty", default="l2,l1", help="Aranacak cezalar (l1, l2)")
+    parser.add_argument("--grid_ngrams", default="1-1,1-2", help="Aranacak n-gram aralıkları (ör. 1-1,1-2)")
+    parser.add_argument("--grid_min_df", default="1,2", help="Aranacak min_df değerleri")
+    parser.add_argument("--cv", type=int, default=5, help="Katman (fold) sayısı")
+    parser.add_argument("--n_jobs", type=int, default=-1, help="Paralel iş sayısı (-1 = tüm çekirdekler)")
+    parser.add_argument("--search_cache", default="models/cache/search", help="Katman sonuç önbelleği")
+    parser.add_argument("--search_report", default="outputs/day12_search.md", help="Sıralama tablosu")
     args = parser.parse_args()
 
     df = pd.read_csv(args.input)
-    cfg = TrainConfig(text_col=args.text_col, price_col=args.price_col, label_col=args.label_col, C=args.C)
-    clf, vec, acc, cm, report = train_model(df, cfg)
+    cfg = TrainConfig(
+        text_col=args.text_col,
+        price_col=args.price_col,
+        label_col=args.label_col,
+        C=args.C,
+        numeric_cols=tuple(c for c in args.numeric_cols.split(",") if c) if not args.raw_numeric else None,
+        scale_numeric=not args.raw_numeric,
+    )
+    if args.search:
+        grid = SearchGrid(
+            C=_floats(args.grid_C),
+            penalty=tuple(args.grid_penalty.split(",")),
+            ngram_range=_ngrams(args.grid_ngrams),
+            min_df=tuple(int(v) for v in args.grid_min_df.split(",")),
+        )
+        board = grid_search(df, cfg, grid, cv=args.cv, n_jobs=args.n_jobs, cache_dir=args.search_cache)
+        write_leaderboard(board, args.search_report)
+        best = board.iloc[0]
+        cfg.C, cfg.penalty = float(best.C), best.penalty
+        cfg.ngram_range, cfg.min_df = tuple(best.ngram_range), int(best.min_df)
+        print(
+            f"Best: penalty={cfg.penalty} C={cfg.C:g} ngram_range={cfg.ngram_range} min_df={cfg.min_df} "
+            f"(cv accuracy {best.accuracy_mean:.4f}); leaderboard -> {args.search_report}"
+        )
+    store = FeatureStore(args.features_dir) if args.features_dir else None
+    res = train_pipeline(df, cfg, store=store)
+    baseline = None
+    if cfg.scale_numeric and not args.skip_baseline:
+        base_cfg = TrainConfig(**{**cfg.__dict__, "numeric_cols": None, "scale_numeric": False})
+        baseline = train_pipeline(df, base_cfg, store=store)
 
-    joblib.dump(clf, args.out_model)
-    joblib.dump(vec, args.out_vec)
+    pipe = res.pipeline
+    joblib.dump(pipe.classifier, args.out_model)
+    joblib.dump(pipe.vectorizer, args.out_vec)
+    spec = FeatureSpec(text_col=cfg.text_col, numeric_cols=(*pipe.numeric.columns, cfg.label_col))
+    manifest = save_pipeline(pipe, args.out_pipeline, dataset_hash=dataset_hash(df, spec))
+    if args.out_scorer:
+        save_compiled(pipe, args.out_scorer)
 
     with open(args.report, "w", encoding="utf-8") as f:
-        f.write(f"Accuracy: {acc:.4f}\n\n")
-        f.write("Confusion Matrix:\n")
-        f.write(str(cm) + "\n\n")
+        f.write(f"Accuracy: {res.accuracy:.4f}\n")
+        f.write(f"Numeric features: {', '.join(pipe.numeric.columns)} ({'log1p + standardised' if cfg.scale_numeric else 'raw'})\n")
+        f.write(f"Solver iterations: {res.n_iter} (max_iter={pipe.classifier.max_iter}), fit time: {res.fit_seconds:.3f}s\n")
+        if baseline is not None:
+            f.write(
+                f"Baseline (raw {cfg.price_col}): accuracy {baseline.accuracy:.4f}, "
+                f"iterations {baseline.n_iter}, fit time {baseline.fit_seconds:.3f}s\n"
+            )
+        f.write("\nConfusion Matrix:\n")
+        f.write(str(res.confusion) + "\n\n")
         f.write("Classification Report:\n")
-        f.write(report + "\n")
+        f.write(res.report + "\n")
 
     print(f"Saved model to {args.out_model}, vectorizer to {args.out_vec}, report to {args.report}")
+    print(f"Saved pipeline {manifest['version']} to {args.out_pipeline}")
+    if args.out_scorer:
+        print(f"Saved compiled scorer to {args.out_scorer}")
+    if args.registry:
+        metrics = {"accuracy": res.accuracy, "n_iter": res.n_iter, "fit_seconds": res.fit_seconds, "C": cfg.C, "penalty": cfg.penalty}
+        registry = ModelRegistry(args.registry)
+        version = registry.register(pipe, metrics, dataset_hash=manifest["dataset_hash"], promote=args.promote)
+        state = "current" if registry.current() == version else "registered"
+        print(f"Registry: {version} ({state}) in {args.registry}")
 
 
 if __name__ == "__main__":
@@ -1,30 +1,62 @@
 import argparse
+import os
+import re
+from collections import Counter
+from typing import List, Optional, Tuple
 
 import matplotlib.pyplot as plt
-import pandas as pd
 from wordcloud import WordCloud
 
+from src.utils.analytics import PRICE_LABELS
+from src.utils.termfreq import TermCounts, cached_counts
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Day 17: Görselleri derleme (word cloud vs.)")
-    parser.add_argument("--input", default="data/processed/day06_text.csv")
-    parser.add_argument("--out_cloud", default="outputs/plots/day17_wordcloud.png")
-    args = parser.parse_args()
 
-    df = pd.read_csv(args.input)
-    text = " ".join(df.get("title_clean", pd.Series(dtype=str)).fillna("").astype(str).tolist())
-
-    wc = WordCloud(width=1000, height=600, background_color="white").generate(text)
+def render_cloud(freq: Counter, path: str, max_words: int = 200) -> None:
+    wc = WordCloud(width=1000, height=600, background_color="white", max_words=max_words)
+    wc.generate_from_frequencies(dict(freq.most_common(max_words)))
     plt.figure(figsize=(10, 6))
     plt.imshow(wc, interpolation="bilinear")
     plt.axis("off")
     plt.tight_layout()
-    plt.savefig(args.out_cloud, dpi=150)
+    plt.savefig(path, dpi=150)
     plt.close()
 
-    print(f"Saved word cloud to {args.out_cloud}")
+
+def slug(label: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
+
+
+def cloud_jobs(counts: TermCounts, by: List[str]) -> List[Tuple[str, Optional[str], Optional[List[str]]]]:
+    """(suffix, ptype, buckets) for every cloud requested."""
+    jobs: List[Tuple[str, Optional[str], Optional[List[str]]]] = [("", None, None)]
+    if "ptype" in by:
+        jobs += [(f"_{p}", p, None) for p in counts.ptypes() if p]
+    if "price_band" in by:
+        jobs += [(f"_{slug(b)}", None, [b]) for b in PRICE_LABELS if b in counts.buckets()]
+    return jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Day 17: Görselleri derleme (word cloud vs.)")
+    parser.add_argument("--input", default="data/processed/day06_text.csv")
+    parser.add_argument("--out_cloud", default="outputs/plots/day17_wordcloud.png")
+    parser.add_argument("--by", nargs="*", default=[], choices=["ptype", "price_band"], help="Ek bulutlar: kategori ve/veya fiyat bandı")
+    parser.add_argument("--cache_dir", default="data/cache", help="Terim sayım önbelleği (veri özetine göre)")
+    args = parser.parse_args()
+
+    counts = cached_counts(args.input, cache_dir=args.cache_dir, fields=["title_clean"], ngrams=[1], price_col="price_value")
+    stem, ext = os.path.splitext(args.out_cloud)
+    saved = []
+    for suffix, ptype, buckets in cloud_jobs(counts, args.by):
+        freq, _ = counts.select(ptype=ptype, buckets=buckets, n=1)
+        if not freq:
+            continue
+        path = f"{stem}{suffix}{ext}"
+        render_cloud(freq, path)
+        saved.append(path)
+
+    print(f"Saved word cloud to {', '.join(saved) if saved else '—'}")
 
 
 if __name__ == "__main__":
     main()
-
@@ -2,6 +2,7 @@ import argparse
 from typing import List, Dict, Any
 
 from src.utils.advanced_scrape import EtsyScraper, save_products_csv, save_products_json
+from src.utils.logger import setup_logging
 
 
 def main() -> None:
@@ -13,6 +14,7 @@ def main() -> None:
     parser.add_argument("--summary", default="outputs/day20_wrapup.md", help="Özet rapor yolu")
     parser.add_argument("--format", choices=["csv", "json", "both"], default="both", help="Çıktı formatı")
     args = parser.parse_args()
+    setup_logging()
 
     # Scrape
     scraper = EtsyScraper(delay_range=(args.delay, args.delay + 1.0))
@@ -25,7 +27,7 @@ def main() -> None:
         save_products_csv(products, csv_path)
         saved_paths.append(csv_path)
     if args.format in ("json", "both") and products:
-        json_path = f"{args.out_prefix}.json"
+        json_path = f"{args.out_prefix}.jsonl"
         save_products_json(products, json_path)
         saved_paths.append(json_path)
 
@@ -2,9 +2,10 @@ import argparse
 import csv
 import json
 import random
-from typing import List
+from typing import List, Tuple
 
-from src.utils.erank import top_keywords_only
+from src.utils.erank import get_keyword_store
+from src.utils.tags import TagIndex
 
 
 def enforce_title_limit(s: str, limit: int = 140) -> str:
@@ -16,55 +17,10 @@ def enforce_title_limit(s: str, limit: int = 140) -> str:
     return cut.strip()
 
 
-def build_tag_suggestions(top_terms: List[str], erank_path: str, limit: int = 13, ptype: str = "poster") -> List[str]:
-    uni = [t.strip().lower() for t in top_terms if " " not in t]
-    try:
-        erank_terms = top_keywords_only(erank_path, min_volume=100, limit=150)
-    except Exception:
-        erank_terms = []
-    for kw in erank_terms:
-        k = kw.strip().lower()
-        if " " not in k and k not in uni:
-            uni.append(k)
-
-    base_by_type = {
-        "metal_wall_art": ["metal", "wall", "art", "decor", "custom", "gift", "modern", "home", "minimal"],
-        "poster": ["poster", "print", "wall", "art", "decor", "digital", "download", "gift"],
-        "jewelry": ["jewelry", "necklace", "ring", "gift", "handmade", "women"],
-        "bag": ["bag", "tote", "leather", "gift", "handmade", "travel"],
-        "canvas": ["canvas", "wall", "art", "decor", "print"],
-        "mug": ["coffee", "mug", "gift", "kitchen"],
-        "tshirt": ["tshirt", "tee", "graphic", "gift"],
-        "sticker": ["sticker", "vinyl", "laptop", "waterproof"],
-    }
-    for t in base_by_type.get(ptype, []):
-        if t not in uni:
-            uni.append(t)
-
-    def ok(tag: str) -> bool:
-        letters = len(tag.replace(" ", ""))
-        return (" " in tag) and (letters <= 13)
-
-    tags: List[str] = []
-    for a in uni:
-        if len(tags) >= limit:
-            break
-        for b in uni:
-            if a == b:
-                continue
-            candidate = f"{a} {b}"
-            if ok(candidate) and candidate not in tags:
-                tags.append(candidate)
-                if len(tags) >= limit:
-                    break
-    if len(tags) < limit:
-        for a in uni:
-            candidate = f"{a} art"
-            if ok(candidate) and candidate not in tags:
-                tags.append(candidate)
-            if len(tags) >= limit:
-                break
-    return tags[:limit]
+def build_tag_index(top_terms: List[Tuple[str, float]], erank_path: str) -> TagIndex:
+    store = get_keyword_store(erank_path)
+    erank = [(r["keyword"], int(r["volume"])) for r in store.rows(limit=150, min_volume=100)]
+    return TagIndex.build(top_terms=top_terms, erank=erank)
 
 
 def build_description(title: str, tags: List[str], ptype: str) -> str:
@@ -85,13 +41,13 @@ def build_description(title: str, tags: List[str], ptype: str) -> str:
     return desc
 
 
-def load_top_terms(path: str) -> List[str]:
+def load_top_terms(path: str) -> List[Tuple[str, float]]:
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
-        return [t for t, _ in data.get("top_terms", [])]
+        return [(t, float(s)) for t, s in data.get("top_terms", [])]
     except FileNotFoundError:
-        return ["modern", "metal", "wall", "art", "decor", "custom", "gift"]
+        return [(t, 1.0) for t in ["modern", "metal", "wall", "art", "decor", "custom", "gift"]]
 
 
 def main() -> None:
@@ -104,14 +60,15 @@ def main() -> None:
     args = p.parse_args()
 
     top_terms = load_top_terms(args.top_terms)
-    uni = [t for t in top_terms if " " not in t]
+    uni = [t for t, _ in top_terms if " " not in t]
+    tag_index = build_tag_index(top_terms, args.erank_csv)
 
     rows = []
     for _ in range(args.count):
         chosen = random.sample(uni, min(6, len(uni)))
         raw_title = " ".join(chosen).title()
         title = enforce_title_limit(raw_title, limit=140)
-        tags = build_tag_suggestions(top_terms, args.erank_csv, limit=13, ptype=args.ptype)
+        tags = tag_index.suggest(args.ptype, limit=13, title=title)
         description = build_description(title, tags, args.ptype)
         rows.append({"title": title, "description": description, "tags": ", ".join(tags)})
 
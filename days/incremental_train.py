@@ -0,0 +1,79 @@
+import argparse
+import glob
+import os
+import sys
+from typing import List, Sequence
+
+# Ensure project root is on sys.path when running from days/
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.models.incremental import IncrementalTrainer
+from src.models.pipeline import NUMERIC_COLS, save_pipeline
+from src.utils.io import file_digest, iter_table_chunks
+
+
+def expand_inputs(paths: Sequence[str]) -> List[str]:
+    """Files as given; directories expand to their CSV/JSON/JSONL files in name order."""
+    out: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            found: List[str] = []
+            for ext in ("*.csv", "*.csv.gz", "*.json", "*.jsonl"):
+                found.extend(glob.glob(os.path.join(path, ext)))
+            out.extend(sorted(found))
+        else:
+            out.append(path)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Artımlı model eğitimi (HashingVectorizer + SGD partial_fit)")
+    parser.add_argument("--input", nargs="+", required=True, help="Etiketli yeni parti dosyaları veya klasörleri")
+    parser.add_argument("--checkpoint_dir", default="models/incremental", help="Kontrol noktası klasörü")
+    parser.add_argument("--text_col", default="title_clean", help="Metin sütunu")
+    parser.add_argument("--label_col", default="label_high_sales", help="Etiket sütunu")
+    parser.add_argument("--numeric_cols", default=",".join(NUMERIC_COLS), help="Sayısal sütunlar (virgülle)")
+    parser.add_argument("--chunksize", type=int, default=50000, help="Parti başına satır")
+    parser.add_argument("--n_features", type=int, default=2**20, help="Hashing boyutu")
+    parser.add_argument("--alpha", type=float, default=1e-3, help="SGD düzenlileştirme katsayısı")
+    parser.add_argument("--holdout_frac", type=float, default=0.1, help="Her partiden değerlendirmeye ayrılan oran")
+    parser.add_argument("--holdout_size", type=int, default=5000, help="Kayan değerlendirme kümesi boyutu")
+    parser.add_argument("--keep", type=int, default=3, help="Saklanacak kontrol noktası sayısı")
+    parser.add_argument("--out_pipeline", default="", help="Son modeli ayrıca bu yola yaz ('' = yazma)")
+    args = parser.parse_args()
+
+    trainer = IncrementalTrainer(
+        args.checkpoint_dir,
+        label_col=args.label_col,
+        holdout_frac=args.holdout_frac,
+        holdout_size=args.holdout_size,
+        keep=args.keep,
+        text_col=args.text_col,
+        numeric_cols=tuple(c for c in args.numeric_cols.split(",") if c),
+        n_features=args.n_features,
+        alpha=args.alpha,
+    )
+    trained = 0
+    for path in expand_inputs(args.input):
+        digest = file_digest(path)
+        for i, chunk in enumerate(iter_table_chunks(path, args.chunksize)):
+            metrics = trainer.update(f"{digest}:{i}", chunk)
+            if metrics is None:
+                continue
+            trained += 1
+            score = f"accuracy={metrics['accuracy']:.4f} log_loss={metrics['log_loss']:.4f}" if "accuracy" in metrics else "no holdout yet"
+            print(f"{os.path.basename(path)}[{i}]: {metrics['train_rows']} rows, {score}")
+
+    if trained == 0:
+        print("No new batches")
+    if args.out_pipeline and trainer.state["latest"]:
+        manifest = save_pipeline(trainer.pipeline, args.out_pipeline, dataset_hash=trainer.state["batches"][-1].split(":")[0])
+        print(f"Saved pipeline {manifest['version']} to {args.out_pipeline}")
+    print(f"Checkpoints in {args.checkpoint_dir} ({len(trainer.state['batches'])} batches total)")
+
+
+if __name__ == "__main__":
+    main()
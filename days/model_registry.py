@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+
+# Ensure project root is on sys.path when running from days/
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.models.registry import ModelRegistry, RegistryError
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Model kayıt defteri: listele, yayına al, sabitle, geri al, A/B")
+    parser.add_argument("--registry", default="models/registry", help="Kayıt defteri klasörü")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("list", help="Sürümleri ve metrikleri listele")
+    p = sub.add_parser("promote", help="Bir sürümü yayına al")
+    p.add_argument("version")
+    p.add_argument("--force", action="store_true", help="Sabitlenmiş olsa bile yayına al")
+    p = sub.add_parser("pin", help="Geçerli (veya verilen) sürümü sabitle")
+    p.add_argument("version", nargs="?")
+    sub.add_parser("unpin", help="Sabitlemeyi kaldır")
+    sub.add_parser("rollback", help="Bir önceki sürüme dön")
+    p = sub.add_parser("ab", help="Trafiğin bir kısmını başka sürüme yönlendir")
+    p.add_argument("version", nargs="?", help="B sürümü (boş = A/B kapat)")
+    p.add_argument("--weight", type=float, default=0.1, help="B sürümüne giden trafik oranı (0-1)")
+    args = parser.parse_args()
+
+    reg = ModelRegistry(args.registry)
+    try:
+        if args.cmd == "promote":
+            if not reg.promote(args.version, force=args.force):
+                sys.exit("Registry is pinned; use --force")
+        elif args.cmd == "pin":
+            reg.pin(args.version)
+        elif args.cmd == "unpin":
+            reg.unpin()
+        elif args.cmd == "rollback":
+            reg.rollback()
+        elif args.cmd == "ab":
+            reg.set_ab(args.version, args.weight) if args.version else reg.clear_ab()
+    except RegistryError as e:
+        sys.exit(str(e))
+
+    pointer = reg.pointer()
+    for version in reg.versions():
+        marks = []
+        if version == pointer["version"]:
+            marks.append("current" + (", pinned" if pointer["pinned"] else ""))
+        if pointer.get("ab") and pointer["ab"]["version"] == version:
+            marks.append(f"B {pointer['ab']['weight']:.0%}")
+        acc = reg.metrics(version).get("accuracy")
+        acc_s = f"accuracy={acc:.4f}" if isinstance(acc, (int, float)) else ""
+        print(f"{version:32s} {acc_s:18s} {' '.join(f'[{m}]' for m in marks)}")
+
+
+if __name__ == "__main__":
+    main()
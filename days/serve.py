@@ -0,0 +1,111 @@
+import argparse
+import gc
+import os
+import sys
+
+# Ensure project root is on sys.path when running from days/
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from typing import Any, Dict
+
+from src.config import AppConfig, load_config
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _preloaded_app(cfg: AppConfig) -> Any:
+    """Build the app without background threads and freeze the heap before forking.
+
+    ``gc.freeze`` moves everything allocated so far (models, indexes) out of
+    the collector's reach, so collections in the workers do not write to
+    those pages and they stay shared copy-on-write.
+    """
+    from src.web import create_app
+
+    app = create_app(cfg, start=False)
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+def serve_gunicorn(cfg: AppConfig, bind: str, options: Dict[str, Any]) -> None:
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError as e:
+        raise ImportError("gunicorn is required for --server gunicorn (pip install gunicorn)") from e
+
+    def post_worker_init(worker: Any) -> None:
+        # threads do not survive fork: start registry polling in every worker
+        worker.wsgi.extensions["listing"].start()
+
+    class ListingApplication(BaseApplication):
+        def load_config(self) -> None:
+            for key, value in {**options, "bind": bind, "post_worker_init": post_worker_init}.items():
+                self.cfg.set(key, value)
+
+        def load(self) -> Any:
+            if options.get("preload_app"):
+                return _preloaded_app(cfg)
+            from src.web import create_app
+
+            return create_app(cfg)
+
+    ListingApplication().run()
+
+
+def serve_waitress(cfg: AppConfig, bind: str, threads: int) -> None:
+    try:
+        from waitress import serve
+    except ImportError as e:
+        raise ImportError("waitress is required for --server waitress (pip install waitress)") from e
+    from src.web import create_app
+
+    serve(create_app(cfg), listen=bind, threads=threads)
+
+
+def main() -> None:
+    cfg = load_config()
+    parser = argparse.ArgumentParser(description="Web uygulamasını üretim sunucusuyla çalıştır (gunicorn veya waitress)")
+    parser.add_argument("--server", choices=["auto", "gunicorn", "waitress"], default=cfg.serve.server, help="WSGI sunucusu")
+    parser.add_argument("--bind", default=f"{cfg.flask.host}:{os.environ.get('PORT', cfg.flask.port)}", help="Dinlenecek adres:port")
+    parser.add_argument("--workers", type=int, default=cfg.serve.workers, help="İşçi süreç sayısı (0 = CPU başına bir)")
+    parser.add_argument("--threads", type=int, default=cfg.serve.threads, help="İşçi başına iş parçacığı")
+    parser.add_argument("--timeout", type=int, default=cfg.serve.timeout, help="İstek zaman aşımı (sn, gunicorn)")
+    parser.add_argument("--max_requests", type=int, default=cfg.serve.max_requests, help="İşçi bu kadar istekten sonra yenilenir (0 = hiç)")
+    parser.add_argument("--no_preload", action="store_true", help="Modelleri her işçide ayrı yükle (paylaşımlı bellek yok)")
+    args = parser.parse_args()
+
+    server = args.server
+    if server == "auto":
+        try:
+            import gunicorn  # noqa: F401
+
+            server = "gunicorn"
+        except ImportError:
+            server = "waitress"
+
+    if server == "waitress":
+        logger.info("Serving with waitress on %s (%d threads)", args.bind, args.threads)
+        serve_waitress(cfg, args.bind, args.threads)
+        return
+
+    workers = args.workers or os.cpu_count() or 1
+    options = {
+        "workers": workers,
+        "threads": args.threads,
+        "worker_class": "gthread" if args.threads > 1 else "sync",
+        "timeout": args.timeout,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": args.max_requests // 10,
+        "preload_app": cfg.serve.preload and not args.no_preload,
+        "accesslog": None,
+    }
+    logger.info("Serving with gunicorn on %s (%d workers x %d threads, preload=%s)", args.bind, workers, args.threads, options["preload_app"])
+    serve_gunicorn(cfg, args.bind, options)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,37 @@ class FlaskConfig:
     port: int = 5000
     debug: bool = False
     secret_key: str = "change-me-in-production"
+    max_content_length: int = 4 * 1024 * 1024
+    api_max_items: int = 5000
+    api_chunk_size: int = 500
+    title_budget_ms: float = 25.0
+    api_title_budget_ms: float = 2.0
+    warmup_timeout: float = 60.0  # seconds a request waits for background artifact loading
+
+
+@dataclass
+class ServeConfig:
+    server: str = "auto"  # gunicorn | waitress | auto (gunicorn when importable)
+    workers: int = 0  # 0 = one per CPU
+    threads: int = 4
+    timeout: int = 30
+    max_requests: int = 0  # recycle workers after this many requests (0 = never)
+    preload: bool = True
+
+
+@dataclass
+class CacheConfig:
+    enabled: bool = True
+    max_entries: int = 10_000
+    ttl: float = 3600.0  # seconds; 0 = no expiry
+    shared_path: Optional[str] = None  # SQLite file shared by workers on one host
+
+
+@dataclass
+class MetricsConfig:
+    enabled: bool = True  # per-stage timing and /metrics
+    slow_request_ms: float = 0.0  # log the stage breakdown of slower requests (0 = off)
+    slow_log_file: Optional[str] = None  # JSON lines; None = application log
 
 
 @dataclass
@@ -29,6 +60,10 @@ class ScrapingConfig:
 class ModelsConfig:
     model_path: str = "models/day12_logreg.joblib"
     vectorizer_path: str = "models/day12_vectorizer.joblib"
+    pipeline_path: str = "models/day12_pipeline.joblib"
+    scorer_path: str = "models/day12_scorer.npz"
+    registry_dir: str = "models/registry"
+    reload_interval: float = 5.0
 
 
 @dataclass
@@ -53,6 +88,9 @@ class LoggingConfig:
 @dataclass
 class AppConfig:
     flask: FlaskConfig = field(default_factory=FlaskConfig)
+    serve: ServeConfig = field(default_factory=ServeConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
     scraping: ScrapingConfig = field(default_factory=ScrapingConfig)
     models: ModelsConfig = field(default_factory=ModelsConfig)
     output: OutputConfig = field(default_factory=OutputConfig)
@@ -85,6 +123,31 @@ def load_config(path: Optional[str] = None) -> AppConfig:
         cfg.flask.port = int(flask_data.get("port", cfg.flask.port))
         cfg.flask.debug = flask_data.get("debug", cfg.flask.debug)
         cfg.flask.secret_key = os.environ.get("SECRET_KEY", cfg.flask.secret_key)
+        cfg.flask.max_content_length = int(flask_data.get("max_content_length", cfg.flask.max_content_length))
+        cfg.flask.api_max_items = int(flask_data.get("api_max_items", cfg.flask.api_max_items))
+        cfg.flask.api_chunk_size = int(flask_data.get("api_chunk_size", cfg.flask.api_chunk_size))
+        cfg.flask.title_budget_ms = float(flask_data.get("title_budget_ms", cfg.flask.title_budget_ms))
+        cfg.flask.api_title_budget_ms = float(flask_data.get("api_title_budget_ms", cfg.flask.api_title_budget_ms))
+        cfg.flask.warmup_timeout = float(flask_data.get("warmup_timeout", cfg.flask.warmup_timeout))
+
+    if serve_data := data.get("serve"):
+        cfg.serve.server = serve_data.get("server", cfg.serve.server)
+        cfg.serve.workers = int(serve_data.get("workers", cfg.serve.workers))
+        cfg.serve.threads = int(serve_data.get("threads", cfg.serve.threads))
+        cfg.serve.timeout = int(serve_data.get("timeout", cfg.serve.timeout))
+        cfg.serve.max_requests = int(serve_data.get("max_requests", cfg.serve.max_requests))
+        cfg.serve.preload = bool(serve_data.get("preload", cfg.serve.preload))
+
+    if cache_data := data.get("cache"):
+        cfg.cache.enabled = bool(cache_data.get("enabled", cfg.cache.enabled))
+        cfg.cache.max_entries = int(cache_data.get("max_entries", cfg.cache.max_entries))
+        cfg.cache.ttl = float(cache_data.get("ttl", cfg.cache.ttl))
+        cfg.cache.shared_path = cache_data.get("shared_path", cfg.cache.shared_path) or None
+
+    if metrics_data := data.get("metrics"):
+        cfg.metrics.enabled = bool(metrics_data.get("enabled", cfg.metrics.enabled))
+        cfg.metrics.slow_request_ms = float(metrics_data.get("slow_request_ms", cfg.metrics.slow_request_ms))
+        cfg.metrics.slow_log_file = metrics_data.get("slow_log_file", cfg.metrics.slow_log_file) or None
 
     if scraping_data := data.get("scraping"):
         cfg.scraping.default_delay = float(scraping_data.get("default_delay", cfg.scraping.default_delay))
@@ -94,6 +157,10 @@ def load_config(path: Optional[str] = None) -> AppConfig:
     if models_data := data.get("models"):
         cfg.models.model_path = models_data.get("model_path", cfg.models.model_path)
         cfg.models.vectorizer_path = models_data.get("vectorizer_path", cfg.models.vectorizer_path)
+        cfg.models.pipeline_path = models_data.get("pipeline_path", cfg.models.pipeline_path)
+        cfg.models.scorer_path = models_data.get("scorer_path", cfg.models.scorer_path)
+        cfg.models.registry_dir = models_data.get("registry_dir", cfg.models.registry_dir)
+        cfg.models.reload_interval = float(models_data.get("reload_interval", cfg.models.reload_interval))
 
     if output_data := data.get("output"):
         cfg.output.output_dir = output_data.get("output_dir", cfg.output.output_dir)
@@ -0,0 +1,238 @@
+"""Compiled scorer: a trained TF-IDF + linear pipeline without scikit-learn.
+
+:func:`compile_pipeline` flattens a :class:`ListingPipeline` into plain
+arrays (vocabulary, idf weights, coefficients, numeric scaling) plus the
+tokenizer settings, saved as an uncompressed ``.npz``. :class:`CompiledScorer`
+loads that file with numpy only and scores titles in pure Python, giving
+the same probabilities as ``pipeline.predict_proba`` at a fraction of the
+import and per-call cost.
+"""
+
+import json
+import math
+import os
+import re
+import unicodedata
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from src.utils.io import ensure_dir
+from src.utils.metrics import span
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FORMAT_VERSION = 1
+
+
+def compile_pipeline(pipe: Any) -> Dict[str, Any]:
+    """Arrays and settings describing ``pipe``; raises ValueError for unsupported setups."""
+    import numpy as np
+
+    vec, clf, numeric = pipe.vectorizer, pipe.classifier, pipe.numeric
+    params = vec.get_params()
+    if not hasattr(vec, "vocabulary_") or params.get("analyzer") != "word":
+        raise ValueError("Only fitted word-level TfidfVectorizer/CountVectorizer pipelines can be compiled")
+    if params.get("tokenizer") is not None or params.get("preprocessor") is not None:
+        raise ValueError("Custom tokenizer/preprocessor callables cannot be compiled")
+    coef = np.asarray(clf.coef_, dtype=np.float64)
+    if coef.shape[0] != 1:
+        raise ValueError("Only binary linear classifiers can be compiled")
+
+    n_text = len(vec.vocabulary_)
+    terms = [""] * n_text
+    for term, idx in vec.vocabulary_.items():
+        terms[idx] = term
+    idf = np.asarray(getattr(vec, "idf_", np.ones(n_text)), dtype=np.float64)
+    if not params.get("use_idf", False):
+        idf = np.ones(n_text)
+    n_num = len(numeric.columns)
+    scaled = bool(numeric.scale)
+    stop_words = vec.get_stop_words()
+    settings = {
+        "format_version": FORMAT_VERSION,
+        "version": getattr(pipe, "version", ""),
+        "text_col": pipe.text_col,
+        "numeric_cols": list(numeric.columns),
+        "numeric_scaled": scaled,
+        "lowercase": bool(params["lowercase"]),
+        "strip_accents": params.get("strip_accents"),
+        "token_pattern": params["token_pattern"],
+        "ngram_range": list(params["ngram_range"]),
+        "stop_words": sorted(stop_words) if stop_words else [],
+        "binary": bool(params.get("binary", False)),
+        "sublinear_tf": bool(params.get("sublinear_tf", False)),
+        "norm": params.get("norm"),
+        "classes": [int(c) for c in clf.classes_],
+    }
+    return {
+        "terms": np.frombuffer("\n".join(terms).encode("utf-8"), dtype=np.uint8),
+        "idf": idf,
+        "coef_text": coef[0, :n_text],
+        "coef_num": coef[0, n_text : n_text + n_num],
+        "intercept": np.asarray(clf.intercept_, dtype=np.float64)[:1],
+        "num_fill": np.asarray(numeric.fill_ if scaled else np.zeros(n_num), dtype=np.float64),
+        "num_mean": np.asarray(numeric.mean_ if scaled else np.zeros(n_num), dtype=np.float64),
+        "num_std": np.asarray(numeric.std_ if scaled else np.ones(n_num), dtype=np.float64),
+        "settings": np.array(json.dumps(settings)),
+    }
+
+
+def save_compiled(pipe: Any, path: str) -> Dict[str, Any]:
+    """Compile ``pipe`` and write it to ``path`` (``.npz``); returns the settings."""
+    import numpy as np
+
+    arrays = compile_pipeline(pipe)
+    ensure_dir(os.path.dirname(path) or ".")
+    tmp = f"{path}.tmp-{os.getpid()}.npz"
+    try:
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    settings: Dict[str, Any] = json.loads(str(arrays["settings"]))
+    return settings
+
+
+def _strip_accents_unicode(s: str) -> str:
+    try:
+        s.encode("ASCII", errors="strict")
+        return s
+    except UnicodeEncodeError:
+        normalized = unicodedata.normalize("NFKD", s)
+        return "".join(c for c in normalized if not unicodedata.combining(c))
+
+
+def _strip_accents_ascii(s: str) -> str:
+    return unicodedata.normalize("NFKD", s).encode("ASCII", "ignore").decode("ASCII")
+
+
+class CompiledScorer:
+    """Pure-Python scorer for a compiled pipeline; mirrors ``ListingPipeline.predict*``."""
+
+    def __init__(self, arrays: Mapping[str, Any]) -> None:
+        import numpy as np
+
+        settings = json.loads(str(arrays["settings"]))
+        if settings.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported compiled scorer format {settings.get('format_version')!r}")
+        self.settings = settings
+        self.text_col: str = settings["text_col"]
+        self.numeric_cols: List[str] = settings["numeric_cols"]
+        self.manifest: Dict[str, str] = {"version": settings.get("version", "")}
+        terms = bytes(np.asarray(arrays["terms"], dtype=np.uint8)).decode("utf-8").split("\n")
+        # term -> (idf, coefficient): one dict lookup per token at score time
+        self.weights: Dict[str, Tuple[float, float]] = dict(
+            zip(terms, zip(np.asarray(arrays["idf"]).tolist(), np.asarray(arrays["coef_text"]).tolist()))
+        )
+        self.coef_num: List[float] = np.asarray(arrays["coef_num"]).tolist()
+        self.intercept = float(np.asarray(arrays["intercept"])[0])
+        self.num_fill: List[float] = np.asarray(arrays["num_fill"]).tolist()
+        self.num_mean: List[float] = np.asarray(arrays["num_mean"]).tolist()
+        self.num_std: List[float] = np.asarray(arrays["num_std"]).tolist()
+        self.classes: List[int] = settings["classes"]
+
+        self._token_re = re.compile(settings["token_pattern"])
+        self._min_n, self._max_n = settings["ngram_range"]
+        self._stop = frozenset(settings["stop_words"])
+        self._accents = {"unicode": _strip_accents_unicode, "ascii": _strip_accents_ascii}.get(settings["strip_accents"])
+
+    @classmethod
+    def load(cls, path: str) -> "CompiledScorer":
+        import numpy as np
+
+        with np.load(path, allow_pickle=False) as data:
+            return cls({k: data[k] for k in data.files})
+
+    @property
+    def version(self) -> str:
+        return self.manifest["version"]
+
+    def tokens(self, text: str) -> List[str]:
+        """Same n-grams as the vectorizer's ``build_analyzer()``."""
+        if self.settings["lowercase"]:
+            text = text.lower()
+        if self._accents is not None:
+            text = self._accents(text)
+        words = [w for w in self._token_re.findall(text) if w not in self._stop]
+        min_n, max_n = self._min_n, self._max_n
+        out = list(words) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(words)) + 1):
+            out.extend(" ".join(words[i : i + n]) for i in range(len(words) - n + 1))
+        return out
+
+    def _numeric_score(self, values: Sequence[Any]) -> float:
+        scaled = self.settings["numeric_scaled"]
+        z = 0.0
+        for j, coef in enumerate(self.coef_num):
+            v = _to_float(values[j] if j < len(values) else None)
+            if scaled:
+                if v is None:
+                    v = self.num_fill[j]
+                v = (math.log1p(max(v, 0.0)) - self.num_mean[j]) / self.num_std[j]
+            elif v is None:
+                v = 0.0
+            z += coef * v
+        return z
+
+    def decision(self, title: str, numeric: Sequence[Any] = ()) -> float:
+        counts: Dict[str, int] = {}
+        weights = self.weights
+        for tok in self.tokens(title or ""):
+            if tok in weights:
+                counts[tok] = counts.get(tok, 0) + 1
+        dot = 0.0
+        sq = 0.0
+        norm = self.settings["norm"]
+        binary, sublinear = self.settings["binary"], self.settings["sublinear_tf"]
+        for tok, count in counts.items():
+            idf, coef = weights[tok]
+            tf = 1.0 if binary else (1.0 + math.log(count) if sublinear else float(count))
+            w = tf * idf
+            dot += w * coef
+            sq += w * w if norm == "l2" else abs(w)
+        if norm == "l2" and sq > 0:
+            dot /= math.sqrt(sq)
+        elif norm == "l1" and sq > 0:
+            dot /= sq
+        return dot + self._numeric_score(numeric) + self.intercept
+
+    def proba_one(self, title: str, numeric: Sequence[Any] = ()) -> float:
+        """Probability of the positive class for a single title."""
+        z = self.decision(title, numeric)
+        if z >= 0:
+            return 1.0 / (1.0 + math.exp(-z))
+        e = math.exp(z)
+        return e / (1.0 + e)
+
+    def _rows(self, data: Any) -> Iterable[Tuple[str, List[Any]]]:
+        titles = list(data[self.text_col]) if self.text_col in data else None
+        cols = [list(data[c]) if c in data else None for c in self.numeric_cols]
+        n = len(titles) if titles is not None else max((len(c) for c in cols if c is not None), default=0)
+        for i in range(n):
+            title = titles[i] if titles is not None else ""
+            yield ("" if title is None or title != title else str(title)), [c[i] if c is not None else None for c in cols]
+
+    def predict_proba(self, data: Any) -> "np.ndarray":
+        """``(n, 2)`` probabilities for a DataFrame or mapping of column -> values."""
+        import numpy as np
+
+        with span("predict"):  # tokenizing and scoring are fused here
+            p = np.fromiter((self.proba_one(t, v) for t, v in self._rows(data)), dtype=np.float64)
+            return np.column_stack([1.0 - p, p])
+
+    def predict(self, data: Any) -> "np.ndarray":
+        import numpy as np
+
+        p = self.predict_proba(data)[:, 1]
+        return np.where(p > 0.5, self.classes[1], self.classes[0])
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        v = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if v != v else v
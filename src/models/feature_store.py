@@ -0,0 +1,159 @@
+"""Versioned feature matrices keyed by dataset hash and feature-spec hash.
+
+Each entry is a directory of plain ``.npy`` arrays (the CSR components of
+the text block plus the dense numeric block), so a later load can
+memory-map them instead of refitting or copying. pandas, scipy and
+scikit-learn are imported on first use so the serving path can import
+:func:`transform_features` without paying for them at startup.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, Optional, Tuple
+
+from src.utils.io import ensure_dir
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from scipy.sparse import csr_matrix
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    text_col: str = "title"
+    numeric_cols: Tuple[str, ...] = ("price_value",)
+    ngram_range: Tuple[int, int] = (1, 2)
+    min_df: int = 2
+
+    def key(self) -> str:
+        payload = json.dumps(asdict(self), sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def dataset_hash(df: "pd.DataFrame", spec: FeatureSpec) -> str:
+    """Content hash of the columns ``spec`` reads, independent of file formatting."""
+    import pandas as pd
+
+    cols = [c for c in (spec.text_col, *spec.numeric_cols) if c in df.columns]
+    h = hashlib.blake2b(",".join(cols).encode("utf-8"), digest_size=8)
+    h.update(pd.util.hash_pandas_object(df[cols], index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def numeric_block(df: "pd.DataFrame", cols: Tuple[str, ...], fill: float = 0.0) -> "np.ndarray":
+    """Dense float block of ``cols``; missing columns and unparsable values become ``fill``."""
+    import numpy as np
+    import pandas as pd
+
+    out = np.full((len(df), len(cols)), fill, dtype=np.float64)
+    for j, col in enumerate(cols):
+        if col in df.columns:
+            out[:, j] = pd.to_numeric(df[col], errors="coerce").fillna(fill).to_numpy()
+    return out
+
+
+def transform_features(vectorizer: Any, titles: Any, numeric: Any) -> "csr_matrix":
+    """Text block next to the numeric block, as used by training and serving alike."""
+    import numpy as np
+    from scipy.sparse import csr_matrix, hstack
+
+    return hstack([vectorizer.transform(titles), csr_matrix(np.asarray(numeric, dtype=np.float64))], format="csr")
+
+
+@dataclass
+class FeatureSet:
+    text: "csr_matrix"
+    numeric: "np.ndarray"
+    vectorizer: "TfidfVectorizer"
+    spec: FeatureSpec
+    dataset_hash: str
+    manifest: dict = field(default_factory=dict)
+
+    def matrix(self) -> "csr_matrix":
+        from scipy.sparse import csr_matrix, hstack
+
+        return hstack([self.text, csr_matrix(self.numeric)], format="csr")
+
+
+def build_feature_set(df: "pd.DataFrame", spec: FeatureSpec) -> FeatureSet:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    text = df[spec.text_col].fillna("").astype(str).tolist()
+    vec = TfidfVectorizer(ngram_range=spec.ngram_range, min_df=spec.min_df)
+    X_text = vec.fit_transform(text).tocsr()
+    return FeatureSet(X_text, numeric_block(df, spec.numeric_cols), vec, spec, dataset_hash(df, spec))
+
+
+class FeatureStore:
+    """Directory of materialised feature sets: ``{root}/{dataset_hash}/{spec_key}/``."""
+
+    def __init__(self, root: str = "data/features") -> None:
+        self.root = root
+
+    def path_for(self, data_hash: str, spec: FeatureSpec) -> str:
+        return os.path.join(self.root, data_hash, spec.key())
+
+    def save(self, fs: FeatureSet) -> str:
+        import joblib
+        import numpy as np
+
+        target = self.path_for(fs.dataset_hash, fs.spec)
+        tmp = f"{target}.tmp-{os.getpid()}"
+        ensure_dir(tmp)
+        np.save(os.path.join(tmp, "text_data.npy"), fs.text.data)
+        np.save(os.path.join(tmp, "text_indices.npy"), fs.text.indices)
+        np.save(os.path.join(tmp, "text_indptr.npy"), fs.text.indptr)
+        np.save(os.path.join(tmp, "numeric.npy"), fs.numeric)
+        joblib.dump(fs.vectorizer, os.path.join(tmp, "vectorizer.joblib"))
+        manifest = {
+            "dataset_hash": fs.dataset_hash,
+            "spec": asdict(fs.spec),
+            "spec_key": fs.spec.key(),
+            "shape": list(fs.text.shape),
+            "n_numeric": int(fs.numeric.shape[1]),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        if os.path.exists(target):
+            shutil.rmtree(target)
+        os.replace(tmp, target)
+        fs.manifest = manifest
+        return target
+
+    def load(self, data_hash: str, spec: FeatureSpec, mmap: bool = True) -> Optional[FeatureSet]:
+        import joblib
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        path = self.path_for(data_hash, spec)
+        manifest_path = os.path.join(path, "manifest.json")
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        mode: Optional[Literal["r"]] = "r" if mmap else None
+
+        def arr(name: str) -> np.ndarray:
+            loaded: np.ndarray = np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode)
+            return loaded
+
+        text = csr_matrix((arr("text_data"), arr("text_indices"), arr("text_indptr")), shape=tuple(manifest["shape"]), copy=False)
+        vec = joblib.load(os.path.join(path, "vectorizer.joblib"))
+        return FeatureSet(text, arr("numeric"), vec, spec, data_hash, manifest)
+
+    def get_or_build(self, df: "pd.DataFrame", spec: FeatureSpec) -> FeatureSet:
+        """Load the feature set for this data version, materialising it on first use."""
+        data_hash = dataset_hash(df, spec)
+        cached = self.load(data_hash, spec)
+        if cached is not None:
+            return cached
+        fs = build_feature_set(df, spec)
+        self.save(fs)
+        return fs
@@ -0,0 +1,188 @@
+"""Online training over streamed labelled batches with ``partial_fit``.
+
+Text goes through a stateless HashingVectorizer and the classifier is an
+``SGDClassifier(loss="log_loss")``, so a new crawl delta only costs one pass
+over its own rows. After every batch the pipeline is checkpointed with
+:func:`save_pipeline` and scored on a rolling holdout drawn from the batches
+seen so far (rows are assigned to it by a stable hash and never trained on).
+"""
+
+import glob
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+import numpy as np
+import pandas as pd
+
+from src.models.feature_store import numeric_block
+from src.models.pipeline import NUMERIC_COLS, ListingPipeline, NumericTransformer, load_pipeline, save_pipeline
+from src.utils.io import atomic_open, ensure_dir
+
+CLASSES = np.array([0, 1])
+
+
+@dataclass
+class RunningNumericTransformer(NumericTransformer):
+    """NumericTransformer whose scaling statistics accumulate batch by batch.
+
+    Fill values are the first batch's medians; mean and std are recomputed
+    from running sums of the ``log1p`` values after every batch.
+    """
+
+    scale: bool = True
+    n_seen_: int = 0
+    sum_: Optional[np.ndarray] = None
+    sumsq_: Optional[np.ndarray] = None
+
+    def partial_fit_array(self, raw: np.ndarray) -> "RunningNumericTransformer":
+        if not self.scale or not len(raw):
+            return self
+        if self.fill_ is None or self.sum_ is None or self.sumsq_ is None:
+            self.fit_array(raw)
+            self.sum_ = np.zeros(raw.shape[1])
+            self.sumsq_ = np.zeros(raw.shape[1])
+        fill = cast("np.ndarray", self.fill_)  # set by fit_array on the first batch
+        logged = np.log1p(np.clip(np.where(np.isnan(raw), fill, raw), 0.0, None))
+        self.n_seen_ += len(raw)
+        self.sum_ = self.sum_ + logged.sum(axis=0)
+        self.sumsq_ = self.sumsq_ + (logged**2).sum(axis=0)
+        self.mean_ = self.sum_ / self.n_seen_
+        std = np.sqrt(np.maximum(self.sumsq_ / self.n_seen_ - self.mean_**2, 0.0))
+        self.std_ = np.where(std > 1e-12, std, 1.0)
+        return self
+
+
+def new_pipeline(
+    text_col: str = "title",
+    numeric_cols: Tuple[str, ...] = NUMERIC_COLS,
+    n_features: int = 2**20,
+    ngram_range: Tuple[int, int] = (1, 2),
+    alpha: float = 1e-3,
+    random_state: int = 42,
+) -> ListingPipeline:
+    from sklearn.feature_extraction.text import HashingVectorizer
+    from sklearn.linear_model import SGDClassifier
+
+    vec = HashingVectorizer(n_features=n_features, ngram_range=ngram_range, alternate_sign=False, norm="l2")
+    clf = SGDClassifier(loss="log_loss", alpha=alpha, random_state=random_state)
+    return ListingPipeline(vec, RunningNumericTransformer(tuple(numeric_cols)), clf, text_col=text_col)
+
+
+def holdout_mask(df: pd.DataFrame, col: str, frac: float) -> np.ndarray:
+    """Stable row assignment to the holdout, based on a hash of ``col``."""
+    if frac <= 0 or col not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    h = pd.util.hash_pandas_object(df[col].fillna(""), index=False).to_numpy()
+    mask: np.ndarray = (h % 10_000) < int(frac * 10_000)
+    return mask
+
+
+class IncrementalTrainer:
+    """Checkpointed ``partial_fit`` loop; state lives in ``checkpoint_dir``.
+
+    ``state.json`` records the consumed batch ids (so re-running over the
+    same files is a no-op), the latest checkpoint and the metric history;
+    ``holdout.csv`` keeps the most recent ``holdout_size`` holdout rows.
+    """
+
+    def __init__(
+        self,
+        checkpoint_dir: str = "models/incremental",
+        label_col: str = "label_high_sales",
+        holdout_frac: float = 0.1,
+        holdout_size: int = 5000,
+        keep: int = 3,
+        **pipeline_kwargs: Any,
+    ) -> None:
+        self.checkpoint_dir = checkpoint_dir
+        self.label_col = label_col
+        self.holdout_frac = holdout_frac
+        self.holdout_size = holdout_size
+        self.keep = keep
+        self.state: Dict[str, Any] = {"seq": 0, "batches": [], "latest": None, "history": []}
+        self.holdout: Optional[pd.DataFrame] = None
+        ensure_dir(checkpoint_dir)
+
+        state_path = os.path.join(checkpoint_dir, "state.json")
+        if os.path.exists(state_path):
+            with open(state_path, "r", encoding="utf-8") as f:
+                self.state = json.load(f)
+        if self.state["latest"]:
+            self.pipeline = load_pipeline(os.path.join(checkpoint_dir, self.state["latest"]), mmap=False)
+        else:
+            self.pipeline = new_pipeline(**pipeline_kwargs)
+        holdout_path = os.path.join(checkpoint_dir, "holdout.csv")
+        if os.path.exists(holdout_path):
+            self.holdout = pd.read_csv(holdout_path, dtype=str)
+
+    def seen(self, batch_id: str) -> bool:
+        return batch_id in self.state["batches"]
+
+    def _labels(self, df: pd.DataFrame) -> np.ndarray:
+        labels: np.ndarray = pd.to_numeric(df[self.label_col], errors="coerce").astype(int).to_numpy()
+        return labels
+
+    def evaluate(self) -> Dict[str, float]:
+        from sklearn.metrics import accuracy_score, log_loss
+
+        if self.holdout is None or not len(self.holdout) or not hasattr(self.pipeline.classifier, "coef_"):
+            return {}
+        y = self._labels(self.holdout)
+        proba = self.pipeline.predict_proba(self.holdout)[:, 1]
+        return {
+            "holdout_rows": int(len(y)),
+            "accuracy": float(accuracy_score(y, (proba >= 0.5).astype(int))),
+            "log_loss": float(log_loss(y, proba, labels=CLASSES)),
+        }
+
+    def update(self, batch_id: str, df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """Train on one batch and checkpoint; returns its metrics, or None if already consumed."""
+        if self.seen(batch_id):
+            return None
+        df = df[pd.to_numeric(df[self.label_col], errors="coerce").notna()]
+        pipe = self.pipeline
+        numeric = pipe.numeric
+        if not isinstance(numeric, RunningNumericTransformer):
+            raise TypeError(f"Incremental training needs a RunningNumericTransformer, got {type(numeric).__name__}")
+        mask = holdout_mask(df, pipe.text_col, self.holdout_frac)
+        train = df[~mask]
+        if len(train):
+            numeric.partial_fit_array(numeric_block(train, numeric.columns, fill=np.nan))
+            pipe.classifier.partial_fit(pipe.features(train), self._labels(train), classes=CLASSES)
+        if mask.any():
+            held = df[mask]
+            self.holdout = held if self.holdout is None else pd.concat([self.holdout, held], ignore_index=True)
+            self.holdout = self.holdout.tail(self.holdout_size).reset_index(drop=True)
+
+        metrics = {"batch": batch_id, "train_rows": int(len(train)), **self.evaluate()}
+        self._checkpoint(batch_id, metrics)
+        return metrics
+
+    def _checkpoint(self, batch_id: str, metrics: Dict[str, Any]) -> None:
+        self.state["seq"] += 1
+        name = f"ckpt-{self.state['seq']:05d}.joblib"
+        save_pipeline(self.pipeline, os.path.join(self.checkpoint_dir, name), dataset_hash=batch_id.split(":")[0])
+        if self.holdout is not None:
+            with atomic_open(os.path.join(self.checkpoint_dir, "holdout.csv")) as f:
+                self.holdout.to_csv(f, index=False)
+        self.state["latest"] = name
+        self.state["batches"].append(batch_id)
+        self.state["history"].append(metrics)
+        with atomic_open(os.path.join(self.checkpoint_dir, "state.json")) as f:
+            json.dump(self.state, f, indent=2)
+        self._prune()
+
+    def _prune(self) -> None:
+        ckpts = sorted(glob.glob(os.path.join(self.checkpoint_dir, "ckpt-*.joblib")))
+        for path in ckpts[: -self.keep] if self.keep > 0 else []:
+            os.remove(path)
+            json_path = os.path.splitext(path)[0] + ".json"
+            if os.path.exists(json_path):
+                os.remove(json_path)
+
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        history: List[Dict[str, Any]] = self.state["history"]
+        return history
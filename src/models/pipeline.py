@@ -0,0 +1,182 @@
+"""Single-file model artifact: vectorizer, numeric transformer and classifier.
+
+The pipeline is saved with uncompressed joblib, so its numpy arrays (idf
+weights, coefficients) are stored as raw buffers that :func:`load_pipeline`
+can memory-map. Worker processes then share one copy of those pages
+through the OS page cache. A JSON manifest next to the artifact records the
+input schema and training-data hash and can be read without unpickling (or
+importing joblib, pandas or scikit-learn, which are loaded on first use).
+"""
+
+import json
+import os
+import platform
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from src.models.feature_store import numeric_block, transform_features
+from src.utils.io import atomic_open, ensure_dir
+from src.utils.metrics import span
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from scipy.sparse import csr_matrix
+
+FORMAT_VERSION = 1
+
+# Numeric inputs considered by default; columns absent from the training data are dropped.
+NUMERIC_COLS = ("price_value", "rating", "reviews", "review_count", "favorites")
+
+
+@dataclass
+class NumericTransformer:
+    """Numeric feature block appended after the text features.
+
+    With ``scale`` the block is ``log1p`` of the (non-negative) values,
+    standardised with the training mean/std; missing values take the
+    training median. Without it the raw values are used with 0 for missing,
+    which is what artifacts saved before scaling was added expect.
+    """
+
+    columns: Tuple[str, ...] = ("price_value",)
+    scale: bool = False
+    fill_: "Optional[np.ndarray]" = None
+    mean_: "Optional[np.ndarray]" = None
+    std_: "Optional[np.ndarray]" = None
+
+    def fit(self, df: "pd.DataFrame") -> "NumericTransformer":
+        import numpy as np
+
+        return self.fit_array(numeric_block(df, self.columns, fill=np.nan))
+
+    def transform(self, df: "pd.DataFrame") -> "np.ndarray":
+        import numpy as np
+
+        return self.transform_array(numeric_block(df, self.columns, fill=np.nan))
+
+    def fit_array(self, raw: "np.ndarray") -> "NumericTransformer":
+        import numpy as np
+
+        if not self.scale:
+            return self
+        present = ~np.isnan(raw)
+        counts = present.sum(axis=0)
+        fill = np.zeros(raw.shape[1])
+        for j in np.flatnonzero(counts):
+            fill[j] = np.median(raw[present[:, j], j])
+        self.fill_ = fill
+        logged = np.log1p(np.clip(np.where(present, raw, fill), 0.0, None))
+        self.mean_ = logged.mean(axis=0) if len(raw) else np.zeros(raw.shape[1])
+        std = logged.std(axis=0) if len(raw) else np.ones(raw.shape[1])
+        self.std_ = np.where(std > 0, std, 1.0)
+        return self
+
+    def transform_array(self, raw: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        if not self.scale:
+            out: np.ndarray = np.nan_to_num(raw, nan=0.0)
+            return out
+        if self.fill_ is None:
+            raise ValueError("NumericTransformer.fit must be called before transform when scale=True")
+        filled = np.where(np.isnan(raw), self.fill_, raw)
+        scaled: np.ndarray = (np.log1p(np.clip(filled, 0.0, None)) - self.mean_) / self.std_
+        return scaled
+
+
+@dataclass
+class ListingPipeline:
+    vectorizer: Any
+    numeric: NumericTransformer
+    classifier: Any
+    text_col: str = "title"
+    manifest: Dict[str, Any] = field(default_factory=dict)
+
+    def features(self, data: Any) -> "csr_matrix":
+        """Feature matrix for a DataFrame or a mapping of column -> values."""
+        import pandas as pd
+
+        with span("vectorize"):
+            df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+            titles = df[self.text_col].fillna("").astype(str).tolist() if self.text_col in df.columns else [""] * len(df)
+            return transform_features(self.vectorizer, titles, self.numeric.transform(df))
+
+    def predict(self, data: Any) -> "np.ndarray":
+        X = self.features(data)
+        with span("predict"):
+            pred: np.ndarray = self.classifier.predict(X)
+            return pred
+
+    def predict_proba(self, data: Any) -> "np.ndarray":
+        X = self.features(data)
+        with span("predict"):
+            proba: np.ndarray = self.classifier.predict_proba(X)
+            return proba
+
+    @property
+    def version(self) -> str:
+        return str(self.manifest.get("version", ""))
+
+
+def manifest_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".json"
+
+
+def save_pipeline(pipe: ListingPipeline, path: str, dataset_hash: str = "") -> Dict[str, Any]:
+    """Write ``pipe`` to ``path`` (uncompressed joblib) plus its JSON manifest."""
+    import joblib
+    import sklearn
+
+    ensure_dir(os.path.dirname(path) or ".")
+    created = time.strftime("%Y%m%dT%H%M%S")
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "version": f"{created}-{dataset_hash[:8]}" if dataset_hash else created,
+        "created": created,
+        "dataset_hash": dataset_hash,
+        "text_col": pipe.text_col,
+        "numeric_cols": list(pipe.numeric.columns),
+        "numeric_scaled": bool(pipe.numeric.scale),
+        "n_text_features": len(pipe.vectorizer.vocabulary_)
+        if hasattr(pipe.vectorizer, "vocabulary_")
+        else int(getattr(pipe.vectorizer, "n_features", 0)),
+        "classes": [int(c) for c in getattr(pipe.classifier, "classes_", [])],
+        "estimator": type(pipe.classifier).__name__,
+        "sklearn_version": sklearn.__version__,
+        "python_version": platform.python_version(),
+    }
+    pipe.manifest = manifest
+    tmp = f"{path}.tmp-{os.getpid()}"
+    try:
+        joblib.dump(pipe, tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    with atomic_open(manifest_path(path)) as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_manifest(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(manifest_path(path), "r", encoding="utf-8") as f:
+            manifest: Dict[str, Any] = json.load(f)
+            return manifest
+    except FileNotFoundError:
+        return None
+
+
+def load_pipeline(path: str, mmap: bool = True) -> ListingPipeline:
+    """Load a pipeline; with ``mmap`` its arrays are read-only views of the file."""
+    import joblib
+
+    manifest = read_manifest(path)
+    if manifest is not None and manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported pipeline format {manifest.get('format_version')!r} in {path}")
+    pipe: ListingPipeline = joblib.load(path, mmap_mode="r" if mmap else None)
+    if manifest is not None:
+        pipe.manifest = manifest
+    return pipe
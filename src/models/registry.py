@@ -0,0 +1,251 @@
+"""Local model registry with a "current" pointer, pinning, rollback and A/B split.
+
+Layout under ``root``::
+
+    versions/<version>/pipeline.joblib   pipeline artifact (+ pipeline.json manifest)
+    versions/<version>/scorer.npz        compiled scorer, when the pipeline supports it
+    versions/<version>/metrics.json      training metrics
+    CURRENT.json                         {"version", "pinned", "history", "ab"}
+
+``CURRENT.json`` is replaced atomically, so a reader sees either the old or
+the new pointer. :class:`ModelHolder` polls it from a background thread,
+loads the new version off the request path and swaps it in with a single
+reference assignment.
+"""
+
+import json
+import os
+import shutil
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.models.compiled import CompiledScorer, save_compiled
+from src.models.pipeline import ListingPipeline, load_pipeline, read_manifest, save_pipeline
+from src.utils.io import atomic_open, ensure_dir
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RegistryError(RuntimeError):
+    pass
+
+
+class ModelRegistry:
+    def __init__(self, root: str = "models/registry") -> None:
+        self.root = root
+        self.versions_dir = os.path.join(root, "versions")
+        self.pointer_path = os.path.join(root, "CURRENT.json")
+
+    # -- versions -------------------------------------------------------
+    def version_dir(self, version: str) -> str:
+        return os.path.join(self.versions_dir, version)
+
+    def versions(self) -> List[str]:
+        if not os.path.isdir(self.versions_dir):
+            return []
+        return sorted(v for v in os.listdir(self.versions_dir) if not v.startswith("."))
+
+    def register(
+        self, pipe: ListingPipeline, metrics: Optional[Dict[str, Any]] = None, dataset_hash: str = "", promote: bool = False
+    ) -> str:
+        """Store ``pipe`` as a new version; optionally make it current."""
+        ensure_dir(self.versions_dir)
+        tmp = os.path.join(self.versions_dir, f".tmp-{os.getpid()}")
+        if os.path.exists(tmp):
+            shutil.rmtree(tmp)
+        ensure_dir(tmp)
+        manifest = save_pipeline(pipe, os.path.join(tmp, "pipeline.joblib"), dataset_hash=dataset_hash)
+        try:
+            save_compiled(pipe, os.path.join(tmp, "scorer.npz"))
+        except ValueError as e:
+            logger.info("Pipeline not compiled: %s", e)
+        with open(os.path.join(tmp, "metrics.json"), "w", encoding="utf-8") as f:
+            json.dump(metrics or {}, f, indent=2)
+
+        version: str = manifest["version"]
+        n = 1
+        while os.path.exists(self.version_dir(version)):
+            n += 1
+            version = f"{manifest['version']}.{n}"
+        os.replace(tmp, self.version_dir(version))
+        if promote:
+            self.promote(version)
+        return version
+
+    def manifest(self, version: str) -> Optional[Dict[str, Any]]:
+        return read_manifest(os.path.join(self.version_dir(version), "pipeline.joblib"))
+
+    def metrics(self, version: str) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(self.version_dir(version), "metrics.json"), "r", encoding="utf-8") as f:
+                metrics: Dict[str, Any] = json.load(f)
+                return metrics
+        except FileNotFoundError:
+            return {}
+
+    def load(self, version: str) -> Any:
+        """Compiled scorer when present, else the memory-mapped pipeline."""
+        path = self.version_dir(version)
+        scorer_path = os.path.join(path, "scorer.npz")
+        if os.path.exists(scorer_path):
+            scorer = CompiledScorer.load(scorer_path)
+            scorer.manifest = {"version": version}
+            return scorer
+        pipe = load_pipeline(os.path.join(path, "pipeline.joblib"))
+        pipe.manifest = {**pipe.manifest, "version": version}
+        return pipe
+
+    # -- pointer ---------------------------------------------------------
+    def pointer(self) -> Dict[str, Any]:
+        try:
+            with open(self.pointer_path, "r", encoding="utf-8") as f:
+                pointer: Dict[str, Any] = json.load(f)
+                return pointer
+        except FileNotFoundError:
+            return {"version": None, "pinned": False, "history": [], "ab": None}
+
+    def _write_pointer(self, pointer: Dict[str, Any]) -> None:
+        with atomic_open(self.pointer_path) as f:
+            json.dump(pointer, f, indent=2)
+
+    def current(self) -> Optional[str]:
+        version: Optional[str] = self.pointer()["version"]
+        return version
+
+    def _require(self, version: str) -> None:
+        if not os.path.isdir(self.version_dir(version)):
+            raise RegistryError(f"Unknown model version: {version}")
+
+    def promote(self, version: str, force: bool = False) -> bool:
+        """Point CURRENT at ``version``; refused while pinned unless ``force``."""
+        self._require(version)
+        pointer = self.pointer()
+        if pointer["pinned"] and not force:
+            logger.warning("Registry pinned to %s; not promoting %s", pointer["version"], version)
+            return False
+        if pointer["version"] != version:
+            if pointer["version"]:
+                pointer["history"].append(pointer["version"])
+            pointer["version"] = version
+        if pointer.get("ab") and pointer["ab"]["version"] == version:
+            pointer["ab"] = None
+        self._write_pointer(pointer)
+        return True
+
+    def pin(self, version: Optional[str] = None) -> None:
+        if version is not None:
+            self.promote(version, force=True)
+        pointer = self.pointer()
+        if not pointer["version"]:
+            raise RegistryError("Nothing to pin: no current version")
+        pointer["pinned"] = True
+        self._write_pointer(pointer)
+
+    def unpin(self) -> None:
+        pointer = self.pointer()
+        pointer["pinned"] = False
+        self._write_pointer(pointer)
+
+    def rollback(self) -> str:
+        """Return CURRENT to the previously promoted version."""
+        pointer = self.pointer()
+        if not pointer["history"]:
+            raise RegistryError("No earlier version to roll back to")
+        pointer["version"] = pointer["history"].pop()
+        self._write_pointer(pointer)
+        version: str = pointer["version"]
+        return version
+
+    def set_ab(self, version: str, weight: float) -> None:
+        """Send ``weight`` (0-1) of traffic to ``version``, the rest to CURRENT."""
+        self._require(version)
+        if not 0.0 <= weight <= 1.0:
+            raise RegistryError("A/B weight must be between 0 and 1")
+        pointer = self.pointer()
+        pointer["ab"] = {"version": version, "weight": weight}
+        self._write_pointer(pointer)
+
+    def clear_ab(self) -> None:
+        pointer = self.pointer()
+        pointer["ab"] = None
+        self._write_pointer(pointer)
+
+
+def ab_bucket(key: str) -> float:
+    """Stable position of ``key`` in [0, 1) for traffic splitting."""
+    return (zlib.crc32(key.encode("utf-8")) & 0xFFFFFFFF) / 2**32
+
+
+class ModelHolder:
+    """Serves the registry's current model(s) and hot-swaps them when the pointer changes."""
+
+    def __init__(
+        self, registry: ModelRegistry, poll_interval: float = 5.0, loader: Optional[Callable[[str], Any]] = None
+    ) -> None:
+        self.registry = registry
+        self.poll_interval = poll_interval
+        self.loader = loader or registry.load
+        # (pointer stamp, pointer, {version: model}); replaced as a whole on reload
+        self._state: Tuple[Any, Dict[str, Any], Dict[str, Any]] = (None, {}, {})
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stamp(self) -> Any:
+        try:
+            st = os.stat(self.registry.pointer_path)
+            return (st.st_mtime_ns, st.st_size, st.st_ino)
+        except FileNotFoundError:
+            return None
+
+    def refresh(self) -> bool:
+        """Reload if the pointer changed; returns True when a new state was swapped in."""
+        with self._lock:
+            stamp = self._stamp()
+            if stamp == self._state[0]:
+                return False
+            pointer = self.registry.pointer()
+            wanted = [v for v in (pointer["version"], (pointer.get("ab") or {}).get("version")) if v]
+            loaded = self._state[2]
+            models = {}
+            try:
+                for version in wanted:
+                    models[version] = loaded[version] if version in loaded else self.loader(version)
+            except Exception as e:
+                logger.warning("Model reload failed (%s); keeping %s", e, self._state[1].get("version"))
+                return False
+            self._state = (stamp, pointer, models)
+            logger.info("Serving model %s (A/B: %s)", pointer["version"], pointer.get("ab"))
+            return True
+
+    def get(self, key: str = "") -> Tuple[Optional[str], Any]:
+        """``(version, model)`` for a request; ``key`` keeps A/B assignment stable per client."""
+        _, pointer, models = self._state
+        version: Optional[str] = pointer.get("version")
+        ab = pointer.get("ab")
+        if ab and ab["version"] in models and ab_bucket(key) < ab["weight"]:
+            version = ab["version"]
+        return version, models.get(version) if version is not None else None
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._state[1].get("version")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception as e:  # keep polling; the current model stays in place
+                logger.warning("Registry poll failed: %s", e)
+
+    def start(self) -> "ModelHolder":
+        self.refresh()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="model-reloader", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,139 @@
+"""Batch scoring of candidate titles with a saved pipeline.
+
+Input is streamed in chunks (CSV, JSON/JSONL or Parquet). Each chunk is
+vectorized as one sparse matrix and scored in a worker process that holds
+a memory-mapped copy of the pipeline. The output keeps the input columns
+and adds the probability, the predicted label and the terms that
+contributed most to the score.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.models.pipeline import ListingPipeline, load_pipeline
+from src.utils.io import atomic_open, iter_table_chunks
+from src.utils.text import preprocess_text
+from src.utils.tfidf import hashed_bucket
+
+SCORE_COLS = ["score", "pred", "top_terms"]
+
+
+def prepare_frame(df: pd.DataFrame, pipe: ListingPipeline, title_col: str = "title") -> pd.DataFrame:
+    """Derive the pipeline's text column from ``title_col`` when the input lacks it.
+
+    ``*_clean`` text columns get the same preprocessing as ``day06_text_prep.py``.
+    """
+    if pipe.text_col in df.columns or title_col not in df.columns:
+        return df
+    titles = df[title_col].fillna("").astype(str)
+    df = df.copy()
+    df[pipe.text_col] = titles.map(preprocess_text) if pipe.text_col.endswith("_clean") else titles
+    return df
+
+
+def _term_namer(pipe: ListingPipeline) -> Callable[[str], Callable[[int], str]]:
+    """Per-title lookup from feature index to term (hashed features are resolved via the title)."""
+    vec = pipe.vectorizer
+    if hasattr(vec, "vocabulary_"):
+        names = vec.get_feature_names_out()
+        return lambda title: names.__getitem__
+    analyzer = vec.build_analyzer()
+    n_features = vec.n_features
+
+    def for_title(title: str) -> Callable[[int], str]:
+        buckets = {hashed_bucket(t, n_features): t for t in analyzer(title)}
+        return lambda idx: buckets.get(idx, f"#{idx}")
+
+    return for_title
+
+
+def score_frame(pipe: ListingPipeline, df: pd.DataFrame, top_k: int = 5, title_col: str = "title") -> pd.DataFrame:
+    """``df`` plus score/pred/top_terms columns."""
+    df = prepare_frame(df, pipe, title_col)
+    X = pipe.features(df)
+    clf = pipe.classifier
+    proba = clf.predict_proba(X)[:, 1]
+    out = df.copy()
+    out["score"] = np.round(proba, 6)
+    out["pred"] = clf.classes_[(proba > 0.5).astype(int)]
+    if top_k <= 0:
+        out["top_terms"] = ""
+        return out
+
+    coef = np.asarray(clf.coef_[0])
+    n_text = X.shape[1] - len(pipe.numeric.columns)
+    namer = _term_namer(pipe)
+    titles = df[pipe.text_col].fillna("").astype(str).tolist() if pipe.text_col in df.columns else [""] * len(df)
+    terms: List[str] = []
+    for i in range(X.shape[0]):
+        lo, hi = X.indptr[i], X.indptr[i + 1]
+        idx = X.indices[lo:hi]
+        keep = idx < n_text
+        idx = idx[keep]
+        contrib = X.data[lo:hi][keep] * coef[idx]
+        if not len(idx):
+            terms.append("")
+            continue
+        order = np.argsort(-np.abs(contrib))[:top_k]
+        name = namer(titles[i])
+        terms.append("; ".join(f"{name(idx[j])}:{contrib[j]:+.3f}" for j in order))
+    out["top_terms"] = terms
+    return out
+
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(pipeline_path: str, top_k: int, title_col: str) -> None:
+    _WORKER.update(pipe=load_pipeline(pipeline_path), top_k=top_k, title_col=title_col)
+
+
+def _score_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    return score_frame(_WORKER["pipe"], df, _WORKER["top_k"], _WORKER["title_col"])
+
+
+def _scored_chunks(
+    chunks: Iterator[pd.DataFrame], pipeline_path: str, workers: int, top_k: int, title_col: str
+) -> Iterator[pd.DataFrame]:
+    """Score chunks in order, keeping at most ``2 * workers`` in flight."""
+    if workers <= 1:
+        _init_worker(pipeline_path, top_k, title_col)
+        for chunk in chunks:
+            yield _score_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pipeline_path, top_k, title_col)) as ex:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(ex.submit(_score_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def score_file(
+    pipeline_path: str,
+    input_path: str,
+    output_path: str,
+    chunksize: int = 50_000,
+    workers: Optional[int] = None,
+    top_k: int = 5,
+    title_col: str = "title",
+) -> Dict[str, float]:
+    """Stream ``input_path`` through the pipeline into ``output_path`` (CSV, optionally .gz)."""
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    rows = 0
+    start = time.perf_counter()
+    with atomic_open(output_path) as f:
+        chunks = iter_table_chunks(input_path, chunksize)
+        for i, scored in enumerate(_scored_chunks(chunks, pipeline_path, workers, top_k, title_col)):
+            scored.to_csv(f, index=False, header=i == 0)
+            rows += len(scored)
+    seconds = time.perf_counter() - start
+    return {"rows": rows, "seconds": seconds, "titles_per_second": rows / seconds if seconds > 0 else 0.0}
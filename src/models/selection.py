@@ -0,0 +1,161 @@
+"""Cross-validated grid search over C, penalty, n-gram range and min_df.
+
+Work is split into one task per (fold, ngram_range, min_df): the TF-IDF
+vectorizer is fit once on the training fold, then every penalty walks the
+C grid in ascending order with ``warm_start`` so each fit starts from the
+previous solution. Task results are cached as JSON per fold, keyed by the
+dataset hash, so re-running a search only fits what changed. joblib,
+scipy and scikit-learn are imported when a search runs.
+"""
+
+import copy
+import json
+import os
+import time
+import warnings
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.models.feature_store import FeatureSpec, dataset_hash, numeric_block
+from src.models.pipeline import NumericTransformer
+from src.models.training import TrainConfig, make_logreg
+from src.utils.io import ensure_dir
+
+
+@dataclass
+class SearchGrid:
+    C: Sequence[float] = (0.01, 0.1, 1.0, 10.0)
+    penalty: Sequence[str] = ("l2", "l1")
+    ngram_range: Sequence[Tuple[int, int]] = ((1, 1), (1, 2))
+    min_df: Sequence[int] = (1, 2)
+
+
+def _fit_fold(
+    texts: List[str],
+    numeric: np.ndarray,
+    transformer: NumericTransformer,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    test_idx: np.ndarray,
+    ngram_range: Tuple[int, int],
+    min_df: int,
+    grid: SearchGrid,
+    max_iter: int,
+) -> List[Dict[str, Any]]:
+    from scipy.sparse import csr_matrix, hstack
+    from sklearn.exceptions import ConvergenceWarning
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics import accuracy_score
+
+    vec = TfidfVectorizer(ngram_range=ngram_range, min_df=min_df)
+    X_text_train = vec.fit_transform([texts[i] for i in train_idx])
+    X_text_test = vec.transform([texts[i] for i in test_idx])
+    transformer = copy.deepcopy(transformer).fit_array(numeric[train_idx])
+    X_train = hstack([X_text_train, csr_matrix(transformer.transform_array(numeric[train_idx]))], format="csr")
+    X_test = hstack([X_text_test, csr_matrix(transformer.transform_array(numeric[test_idx]))], format="csr")
+
+    rows = []
+    for penalty in grid.penalty:
+        clf = make_logreg(penalty=penalty, max_iter=max_iter, warm_start=True)
+        for C in sorted(grid.C):
+            clf.set_params(C=C)
+            start = time.perf_counter()
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", ConvergenceWarning)
+                clf.fit(X_train, y[train_idx])
+            rows.append(
+                {
+                    "C": C,
+                    "penalty": penalty,
+                    "ngram_range": list(ngram_range),
+                    "min_df": min_df,
+                    "accuracy": float(accuracy_score(y[test_idx], clf.predict(X_test))),
+                    "n_iter": int(np.max(clf.n_iter_)),
+                    "fit_seconds": time.perf_counter() - start,
+                }
+            )
+    return rows
+
+
+def grid_search(
+    df: pd.DataFrame,
+    cfg: TrainConfig,
+    grid: SearchGrid,
+    cv: int = 5,
+    n_jobs: int = -1,
+    max_iter: int = 200,
+    cache_dir: str = "models/cache/search",
+) -> pd.DataFrame:
+    """Return a leaderboard (mean/std accuracy per parameter set), best first."""
+    from joblib import Parallel, delayed
+    from sklearn.model_selection import StratifiedKFold
+
+    texts = df[cfg.text_col].fillna("").astype(str).tolist()
+    transformer = cfg.numeric_transformer(df)
+    numeric = numeric_block(df, transformer.columns, fill=np.nan)
+    y = df[cfg.label_col].astype(int).to_numpy()
+    folds = list(StratifiedKFold(n_splits=cv, shuffle=True, random_state=cfg.random_state).split(texts, y))
+
+    data_hash = dataset_hash(df.assign(_label=y), FeatureSpec(text_col=cfg.text_col, numeric_cols=(*transformer.columns, "_label")))
+    grid_key = json.dumps(
+        {
+            "C": sorted(grid.C),
+            "penalty": list(grid.penalty),
+            "cv": cv,
+            "max_iter": max_iter,
+            "seed": cfg.random_state,
+            "numeric": [list(transformer.columns), transformer.scale],
+        }
+    )
+    cache_root = os.path.join(cache_dir, data_hash)
+    ensure_dir(cache_root)
+
+    tasks, cached = [], []
+    for k, (train_idx, test_idx) in enumerate(folds):
+        for ngram_range in grid.ngram_range:
+            for min_df in grid.min_df:
+                path = os.path.join(cache_root, f"fold{k}-ng{ngram_range[0]}{ngram_range[1]}-df{min_df}.json")
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        payload = json.load(f)
+                    if payload.get("grid") == grid_key:
+                        cached.append(payload["rows"])
+                        continue
+                tasks.append((path, (texts, numeric, transformer, y, train_idx, test_idx, tuple(ngram_range), min_df, grid, max_iter)))
+
+    fresh = Parallel(n_jobs=n_jobs)(delayed(_fit_fold)(*args) for _, args in tasks)
+    for (path, _), rows in zip(tasks, fresh):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"grid": grid_key, "rows": rows}, f)
+
+    results = pd.DataFrame([r for rows in cached + list(fresh) for r in rows])
+    results["ngram_range"] = results["ngram_range"].map(tuple)
+    board = (
+        results.groupby(["penalty", "C", "ngram_range", "min_df"])
+        .agg(
+            accuracy_mean=("accuracy", "mean"),
+            accuracy_std=("accuracy", "std"),
+            n_iter=("n_iter", "mean"),
+            fit_seconds=("fit_seconds", "mean"),
+        )
+        .reset_index()
+        .sort_values(["accuracy_mean", "accuracy_std"], ascending=[False, True])
+        .reset_index(drop=True)
+    )
+    return board
+
+
+def write_leaderboard(board: pd.DataFrame, path: str, top: int = 20) -> None:
+    ensure_dir(os.path.dirname(path))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Day 12: Hiperparametre Araması\n\n")
+        f.write("| # | penalty | C | ngram_range | min_df | accuracy (mean ± std) | n_iter | fit (s) |\n")
+        f.write("|---|---|---|---|---|---|---|---|\n")
+        for i, row in board.head(top).iterrows():
+            f.write(
+                f"| {i + 1} | {row.penalty} | {row.C:g} | {row.ngram_range} | {row.min_df} | "
+                f"{row.accuracy_mean:.4f} ± {row.accuracy_std:.4f} | {row.n_iter:.0f} | {row.fit_seconds:.3f} |\n"
+            )
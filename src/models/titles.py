@@ -0,0 +1,170 @@
+"""Generate-and-rank title suggestions.
+
+:class:`TitleRanker` samples candidate titles from weighted terms (TF-IDF
+and eRank volume, plus words from the user's own title), scores each
+batch of candidates with one model call, adds how much eRank search
+volume the title covers, and keeps the best distinct titles. Sampling
+continues batch by batch until the latency budget is spent, so quality
+scales with the milliseconds allowed.
+"""
+
+import heapq
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.text import preprocess_text
+
+TITLE_LIMIT = 140
+
+CATEGORY_WORDS: Dict[str, str] = {
+    "metal_wall_art": "Wall Art",
+    "poster": "Poster",
+    "jewelry": "Jewelry",
+    "bag": "Bag",
+    "canvas": "Canvas",
+    "mug": "Mug",
+    "tshirt": "T-Shirt",
+    "sticker": "Sticker",
+}
+
+FALLBACK_TERMS = ["modern", "metal", "wall", "art", "decor", "custom", "gift"]
+
+
+def enforce_title_limit(s: str, limit: int = TITLE_LIMIT) -> str:
+    if len(s) <= limit:
+        return s
+    # Cut at last space before limit when possible
+    cut = s[:limit]
+    if " " in cut:
+        cut = cut[: cut.rfind(" ")]
+    return cut.strip()
+
+
+@dataclass
+class TitleCandidate:
+    title: str
+    score: float
+    model_score: Optional[float]
+    coverage: float
+
+
+class TitleRanker:
+    """Samples titles from ``terms`` and ranks them by model probability and eRank coverage.
+
+    ``terms`` are ``(term, weight)`` pairs (single words are used), and
+    ``erank`` is ``(keyword, volume)``. A candidate's score is
+    ``model_weight * p(high sales) + coverage_weight * coverage`` where
+    coverage is ``1 - exp(-sum)`` over the ``log1p`` volume share of every
+    eRank keyword the title contains.
+    """
+
+    def __init__(
+        self,
+        terms: Sequence[Tuple[str, float]] = (),
+        erank: Sequence[Tuple[str, int]] = (),
+        model_weight: float = 1.0,
+        coverage_weight: float = 0.5,
+        seed: Optional[int] = None,
+    ) -> None:
+        weights: Dict[str, float] = {}
+        for term, w in terms:
+            term = term.strip().lower()
+            if term and " " not in term:
+                weights[term] = max(weights.get(term, 0.0), float(w))
+        volume = {k.strip().lower(): int(v) for k, v in erank if k and k.strip()}
+        max_log = max((math.log1p(v) for v in volume.values()), default=0.0) or 1.0
+        for kw, v in volume.items():
+            if " " not in kw:  # searched words are worth sampling too
+                weights[kw] = weights.get(kw, 0.0) + math.log1p(v) / max_log
+        if not weights:
+            weights = dict.fromkeys(FALLBACK_TERMS, 1.0)
+        self.terms = list(weights)
+        self.weights = [max(w, 1e-6) for w in weights.values()]
+        # first word -> [(keyword words, volume share)] for coverage lookups
+        self._keywords: Dict[str, List[Tuple[Tuple[str, ...], float]]] = {}
+        for kw, v in volume.items():
+            words = tuple(kw.split())
+            self._keywords.setdefault(words[0], []).append((words, math.log1p(v) / max_log))
+        self.model_weight = model_weight
+        self.coverage_weight = coverage_weight
+        self.rng = random.Random(seed)
+
+    def _pick(self, n: int) -> List[str]:
+        """``n`` distinct terms, weighted (Efraimidis-Spirakis keys)."""
+        rng = self.rng
+        keyed = ((rng.random() ** (1.0 / w), t) for t, w in zip(self.terms, self.weights))
+        return [t for _, t in heapq.nlargest(n, keyed)]
+
+    def sample(self, ptype: str, n: int, title_terms: Sequence[str] = (), length: Tuple[int, int] = (3, 7)) -> List[str]:
+        """``n`` candidate titles ending with the ptype's category words."""
+        cat_word = CATEGORY_WORDS.get(ptype, "Art")
+        cat_tokens = set(cat_word.lower().replace("-", " ").split())
+        out = []
+        for _ in range(n):
+            size = self.rng.randint(*length)
+            chosen = [t for t in title_terms if t not in cat_tokens and self.rng.random() < 0.6][:size]
+            for t in self._pick(size + len(cat_tokens)):
+                if len(chosen) >= size:
+                    break
+                if t not in chosen and t not in cat_tokens:
+                    chosen.append(t)
+            out.append(enforce_title_limit((" ".join(chosen) + f" {cat_word}").title()))
+        return out
+
+    def coverage(self, title: str) -> float:
+        words = preprocess_text(title).split()
+        total = 0.0
+        seen = set()
+        for i, w in enumerate(words):
+            for kw, share in self._keywords.get(w, ()):
+                if kw not in seen and tuple(words[i : i + len(kw)]) == kw:
+                    seen.add(kw)
+                    total += share
+        return 1.0 - math.exp(-total)
+
+    def rank(self, titles: Sequence[str], model: Any = None, price: float = 0.0) -> List[TitleCandidate]:
+        """Score ``titles`` with one model call, best first."""
+        probs: List[Optional[float]] = [None] * len(titles)
+        if model is not None and titles:
+            col = model.text_col
+            texts = [preprocess_text(t) for t in titles] if col.endswith("_clean") else list(titles)
+            proba = model.predict_proba({col: texts, "price_value": [price] * len(titles)})
+            probs = [float(row[1]) for row in proba]
+        out = []
+        for title, p in zip(titles, probs):
+            cov = self.coverage(title)
+            score = self.coverage_weight * cov + (self.model_weight * p if p is not None else 0.0)
+            out.append(TitleCandidate(title, score, p, cov))
+        out.sort(key=lambda c: -c.score)
+        return out
+
+    def suggest(
+        self,
+        ptype: str,
+        k: int = 5,
+        model: Any = None,
+        price: float = 0.0,
+        title: str = "",
+        budget_ms: float = 20.0,
+        batch_size: int = 64,
+        max_candidates: int = 4096,
+        length: Tuple[int, int] = (3, 7),
+    ) -> List[TitleCandidate]:
+        """Best ``k`` distinct titles found within ``budget_ms`` (at least one batch is scored)."""
+        start = time.perf_counter()
+        title_terms = list(dict.fromkeys(preprocess_text(title).split()))
+        best: Dict[frozenset, TitleCandidate] = {}
+        sampled = 0
+        while True:
+            candidates = self.sample(ptype, batch_size, title_terms, length)
+            sampled += len(candidates)
+            for cand in self.rank(candidates, model, price):
+                key = frozenset(cand.title.lower().split())  # word order variants count once
+                if key not in best or cand.score > best[key].score:
+                    best[key] = cand
+            if sampled >= max_candidates or (time.perf_counter() - start) * 1000.0 >= budget_ms:
+                break
+        return heapq.nlargest(k, best.values(), key=lambda c: c.score)
@@ -1,11 +1,16 @@
+import time
 from dataclasses import dataclass
-from typing import Any, List, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
+
+from src.models.feature_store import FeatureSet, FeatureSpec, FeatureStore, build_feature_set
+from src.models.pipeline import NUMERIC_COLS, ListingPipeline, NumericTransformer
+
+if TYPE_CHECKING:  # scikit-learn and scipy are imported when training starts
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
 
 
 @dataclass
@@ -16,31 +21,102 @@ class TrainConfig:
     test_size: float = 0.2
     random_state: int = 42
     C: float = 1.0
+    penalty: str = "l2"
+    ngram_range: Tuple[int, int] = (1, 2)
+    min_df: int = 2
+    numeric_cols: Optional[Tuple[str, ...]] = None
+    scale_numeric: bool = True
 
+    def numeric_columns(self, df: Optional[pd.DataFrame] = None) -> Tuple[str, ...]:
+        """Configured numeric inputs (price first), limited to those present in ``df``."""
+        if self.numeric_cols is not None:
+            cols = tuple(self.numeric_cols)
+        elif self.scale_numeric:
+            cols = (self.price_col, *[c for c in NUMERIC_COLS if c != self.price_col])
+        else:
+            cols = (self.price_col,)
+        if df is None:
+            return cols
+        return tuple(c for c in cols if c == self.price_col or c in df.columns)
 
-def build_features(df: pd.DataFrame, text_col: str, price_col: str) -> Tuple[np.ndarray, TfidfVectorizer]:
-    text = df[text_col].fillna("").astype(str).tolist()
-    vec = TfidfVectorizer(ngram_range=(1, 2), min_df=2)
-    X_text = vec.fit_transform(text)
-    price = df[price_col].fillna(0.0).to_numpy().reshape(-1, 1)
-    from scipy.sparse import csr_matrix, hstack
-    X = hstack([X_text, csr_matrix(price)])
-    return X, vec
+    def numeric_transformer(self, df: Optional[pd.DataFrame] = None) -> NumericTransformer:
+        return NumericTransformer(self.numeric_columns(df), scale=self.scale_numeric)
 
+    def feature_spec(self) -> FeatureSpec:
+        return FeatureSpec(
+            text_col=self.text_col, numeric_cols=(self.price_col,), ngram_range=self.ngram_range, min_df=self.min_df
+        )
 
-def train_model(
-    df: pd.DataFrame, cfg: TrainConfig
-) -> Tuple[LogisticRegression, TfidfVectorizer, float, Any, str]:
-    X, vectorizer = build_features(df, cfg.text_col, cfg.price_col)
+
+@lru_cache(maxsize=1)
+def _has_penalty() -> bool:
+    # scikit-learn 1.8 deprecated ``penalty`` in favour of ``l1_ratio``.
+    from sklearn.linear_model import LogisticRegression
+
+    return bool(LogisticRegression().get_params().get("penalty") != "deprecated")
+
+
+def make_logreg(C: float = 1.0, penalty: str = "l2", max_iter: int = 200, **kwargs: Any) -> "LogisticRegression":
+    """LogisticRegression for an "l1" or "l2" penalty across scikit-learn versions."""
+    from sklearn.linear_model import LogisticRegression
+
+    if penalty == "l1":
+        kwargs.update(solver="saga", l1_ratio=1.0)
+        if _has_penalty():
+            kwargs["penalty"] = "elasticnet"
+    elif penalty != "l2":
+        raise ValueError(f"Unsupported penalty: {penalty!r}")
+    return LogisticRegression(C=C, max_iter=max_iter, **kwargs)
+
+
+def build_features(df: pd.DataFrame, text_col: str, price_col: str) -> Tuple[np.ndarray, "TfidfVectorizer"]:
+    fs = build_feature_set(df, FeatureSpec(text_col=text_col, numeric_cols=(price_col,)))
+    return fs.matrix(), fs.vectorizer
+
+
+@dataclass
+class TrainResult:
+    pipeline: ListingPipeline
+    accuracy: float
+    confusion: Any
+    report: str
+    n_iter: int
+    fit_seconds: float
+
+
+def train_pipeline(df: pd.DataFrame, cfg: TrainConfig, store: Optional[FeatureStore] = None) -> TrainResult:
+    """Fit vectorizer, numeric transformer and classifier; evaluate on a stratified holdout."""
+    from scipy.sparse import csr_matrix, hstack
+    from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+    from sklearn.model_selection import train_test_split
+
+    spec = cfg.feature_spec()
+    fs: FeatureSet = store.get_or_build(df, spec) if store is not None else build_feature_set(df, spec)
     y = df[cfg.label_col].astype(int).to_numpy()
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=cfg.test_size, random_state=cfg.random_state, stratify=y
+    train_idx, test_idx = train_test_split(
+        np.arange(len(df)), test_size=cfg.test_size, random_state=cfg.random_state, stratify=y
     )
-    clf = LogisticRegression(max_iter=200, C=cfg.C, n_jobs=1)
+    # Fill values and scaling come from the training rows only, so the holdout stays unseen.
+    numeric = cfg.numeric_transformer(df).fit(df.iloc[train_idx])
+    X = hstack([fs.text, csr_matrix(numeric.transform(df))], format="csr")
+    X_train, X_test, y_train, y_test = X[train_idx], X[test_idx], y[train_idx], y[test_idx]
+    clf = make_logreg(C=cfg.C, penalty=cfg.penalty)
+    start = time.perf_counter()
     clf.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
     y_pred = clf.predict(X_test)
-    acc = accuracy_score(y_test, y_pred)
-    cm = confusion_matrix(y_test, y_pred)
-    report = classification_report(y_test, y_pred)
-    return clf, vectorizer, acc, cm, report
+    return TrainResult(
+        pipeline=ListingPipeline(fs.vectorizer, numeric, clf, text_col=cfg.text_col),
+        accuracy=accuracy_score(y_test, y_pred),
+        confusion=confusion_matrix(y_test, y_pred),
+        report=classification_report(y_test, y_pred),
+        n_iter=int(np.max(clf.n_iter_)),
+        fit_seconds=fit_seconds,
+    )
 
+
+def train_model(
+    df: pd.DataFrame, cfg: TrainConfig, store: Optional[FeatureStore] = None
+) -> Tuple["LogisticRegression", "TfidfVectorizer", float, Any, str]:
+    res = train_pipeline(df, cfg, store=store)
+    return res.pipeline.classifier, res.pipeline.vectorizer, res.accuracy, res.confusion, res.report
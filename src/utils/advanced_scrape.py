@@ -1,24 +1,23 @@
-"""Gelişmiş web scraping utilities for Etsy product collection."""
+"""Gelişmiş web scraping utilities for Etsy product collection.
+
+requests, bs4, aiohttp and rich are imported where they are used, so
+importing this module is cheap; logging is configured by the calling script.
+"""
 
 import asyncio
 import json
-import logging
 import random
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
-import aiohttp
-import requests
-from bs4 import BeautifulSoup
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+from src.utils.logger import get_logger
 
-# Logging setup
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    import aiohttp
+    from bs4 import BeautifulSoup
 
-console = Console()
+logger = get_logger(__name__)
 
 # Gelişmiş User-Agent rotasyonu
 USER_AGENTS = [
@@ -33,6 +32,8 @@ class EtsyScraper:
     """Gelişmiş Etsy scraper with retry, rate limiting, and async support."""
     
     def __init__(self, delay_range: Tuple[float, float] = (1.0, 3.0), max_retries: int = 3):
+        import requests
+
         self.delay_range = delay_range
         self.max_retries = max_retries
         self.session = requests.Session()
@@ -59,8 +60,10 @@ class EtsyScraper:
         delay = random.uniform(*self.delay_range)
         time.sleep(delay)
     
-    def get_page(self, url: str, retries: int = None) -> Optional[BeautifulSoup]:
+    def get_page(self, url: str, retries: int = None) -> Optional["BeautifulSoup"]:
         """Get page with retry logic and error handling."""
+        from bs4 import BeautifulSoup
+
         if retries is None:
             retries = self.max_retries
             
@@ -187,6 +190,9 @@ class EtsyScraper:
     
     def scrape_multiple_pages(self, base_url: str, max_pages: int = 5) -> List[Dict[str, Any]]:
         """Scrape multiple pages with progress tracking."""
+        from rich.console import Console
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
         all_products = []
         
         with Progress(
@@ -195,7 +201,7 @@ class EtsyScraper:
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeElapsedColumn(),
-            console=console,
+            console=Console(),
         ) as progress:
             task = progress.add_task("Scraping pages...", total=max_pages)
             
@@ -259,7 +265,7 @@ class AsyncEtsyScraper:
         new_query = urlencode(query, doseq=True)
         return urlunparse((parts.scheme, parts.netloc, parts.path, parts.params, new_query, parts.fragment))
 
-    def scrape_search_page_from_soup(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def scrape_search_page_from_soup(self, soup: "BeautifulSoup") -> List[Dict[str, Any]]:
         """Parse products from an already-fetched BeautifulSoup object."""
         products = []
         selectors = [
@@ -280,8 +286,11 @@ class AsyncEtsyScraper:
                 break
         return products
 
-    async def get_page_async(self, session: aiohttp.ClientSession, url: str) -> Optional[BeautifulSoup]:
+    async def get_page_async(self, session: "aiohttp.ClientSession", url: str) -> Optional["BeautifulSoup"]:
         """Async page fetching."""
+        import aiohttp
+        from bs4 import BeautifulSoup
+
         async with self.semaphore:
             try:
                 await asyncio.sleep(random.uniform(*self.delay_range))
@@ -306,6 +315,9 @@ class AsyncEtsyScraper:
 
     async def scrape_pages_async(self, urls: List[str]) -> List[Dict[str, Any]]:
         """Scrape multiple pages concurrently."""
+        import aiohttp
+        from bs4 import BeautifulSoup
+
         async with aiohttp.ClientSession() as session:
             tasks = [self.get_page_async(session, url) for url in urls]
             soups = await asyncio.gather(*tasks, return_exceptions=True)
@@ -319,10 +331,15 @@ class AsyncEtsyScraper:
             return all_products
 
 
-def save_products_json(products: List[Dict[str, Any]], filename: str) -> None:
-    """Save products to JSON file."""
+def save_products_json(products: List[Dict[str, Any]], filename: str, lines: bool = True) -> None:
+    """Save products as JSONL (one record per line) or, with ``lines=False``, an indented JSON array."""
     with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(products, f, ensure_ascii=False, indent=2)
+        if lines:
+            for product in products:
+                f.write(json.dumps(product, ensure_ascii=False))
+                f.write("\n")
+        else:
+            json.dump(products, f, ensure_ascii=False, indent=2)
     logger.info(f"Saved {len(products)} products to {filename}")
 
 
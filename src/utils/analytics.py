@@ -0,0 +1,73 @@
+"""One-pass descriptive statistics over scraped product frames."""
+
+from collections import Counter
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+PRICE_BINS: List[float] = [-np.inf, 10, 25, 50, 100, np.inf]
+PRICE_LABELS: List[str] = ["Under $10", "$10-$25", "$25-$50", "$50-$100", "Over $100"]
+
+
+def price_bands(prices: pd.Series) -> pd.Series:
+    """Bucket prices into ``PRICE_LABELS`` (left-closed, NaN stays NaN)."""
+    return pd.cut(prices, bins=PRICE_BINS, labels=PRICE_LABELS, right=False)
+
+
+def word_counts(titles: pd.Series) -> Counter:
+    """Lower-cased whitespace token counts, built row by row."""
+    counts: Counter = Counter()
+    for title in titles.fillna("").astype(str):
+        counts.update(title.lower().split())
+    return counts
+
+
+def compute_pricing(prices: pd.Series) -> Dict[str, Any]:
+    ranges = price_bands(prices).value_counts(sort=False)
+    return {
+        "stats": prices.describe().to_dict(),
+        "ranges": {label: int(ranges.get(label, 0)) for label in PRICE_LABELS},
+        "median": prices.median(),
+        "mean": prices.mean(),
+        "min": prices.min(),
+        "max": prices.max(),
+    }
+
+
+def compute_titles(titles: pd.Series) -> Dict[str, Any]:
+    counts = word_counts(titles)
+    lengths = titles.str.len()
+    return {
+        "word_counts": counts,
+        "word_frequency": dict(counts.most_common(20)),
+        "avg_title_length": lengths.mean(),
+        "title_length_stats": lengths.describe().to_dict(),
+    }
+
+
+def compute_sellers(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-seller product count and price mean/median, largest sellers first."""
+    grouped = df.groupby("seller", sort=False)
+    stats = pd.DataFrame({"count": grouped.size()})
+    if "price_clean" in df.columns:
+        prices = grouped["price_clean"]
+        stats["price_mean"] = prices.mean().round(2)
+        stats["price_median"] = prices.median().round(2)
+    return stats.sort_values("count", ascending=False, kind="stable")
+
+
+def compute_analytics(df: pd.DataFrame) -> Dict[str, Any]:
+    """Compute every statistic the report and charts need, once."""
+    out: Dict[str, Any] = {
+        "total": len(df),
+        "columns": df.columns.tolist(),
+        "missing_cells": int(df.isnull().sum().sum()),
+    }
+    if "price_clean" in df.columns:
+        out["pricing"] = compute_pricing(df["price_clean"])
+    if "title" in df.columns:
+        out["titles"] = compute_titles(df["title"])
+    if "seller" in df.columns:
+        out["sellers"] = compute_sellers(df)
+    return out
@@ -0,0 +1,90 @@
+"""Request parsing and batching helpers for the JSON generation API.
+
+``parse_items`` validates a decoded request body (a list of
+``{"title", "ptype"}`` objects, or ``{"items": [...]}``) into
+:class:`BatchItem` records plus per-item errors, so one bad entry does not
+fail the whole batch. ``score_titles`` scores a chunk of titles with a
+single model call, which vectorizes them as one sparse matrix.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:  # optional fast encoder
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover - exercised only without orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class BatchError(ValueError):
+    """Request-level problem; ``status`` is the HTTP status to answer with."""
+
+    def __init__(self, message: str, status: int = 400) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class BatchItem:
+    index: int
+    title: str
+    ptype: str
+
+
+def parse_items(
+    payload: Any,
+    valid_ptypes: Iterable[str],
+    default_ptype: str = "metal_wall_art",
+    max_items: int = 5000,
+    title_limit: int = 140,
+) -> Tuple[List[BatchItem], List[Dict[str, Any]]]:
+    """``(items, errors)`` for a decoded JSON body; raises :class:`BatchError` for the body as a whole."""
+    if isinstance(payload, dict):
+        payload = payload.get("items")
+    if not isinstance(payload, list):
+        raise BatchError("Body must be a JSON array of {title, ptype} objects")
+    if len(payload) > max_items:
+        raise BatchError(f"Too many items: {len(payload)} > {max_items}", status=413)
+    valid = set(valid_ptypes)
+    items: List[BatchItem] = []
+    errors: List[Dict[str, Any]] = []
+    for i, raw in enumerate(payload):
+        if not isinstance(raw, dict):
+            errors.append({"index": i, "error": "item must be an object"})
+            continue
+        title = raw.get("title")
+        if not isinstance(title, str) or not title.strip():
+            errors.append({"index": i, "error": "title is required"})
+            continue
+        ptype = raw.get("ptype") or default_ptype
+        if ptype not in valid:
+            errors.append({"index": i, "error": f"unknown ptype: {ptype}"})
+            continue
+        items.append(BatchItem(i, title.strip()[:title_limit], ptype))
+    return items, errors
+
+
+def chunked(items: Sequence[BatchItem], size: int) -> Iterator[Sequence[BatchItem]]:
+    for start in range(0, len(items), max(1, size)):
+        yield items[start : start + size]
+
+
+def score_titles(model: Any, titles: List[str], prices: List[float]) -> Tuple[List[Optional[float]], float]:
+    """Positive-class probabilities for ``titles`` in one call, plus the elapsed seconds."""
+    if model is None or not titles:
+        return [None] * len(titles), 0.0
+    start = time.perf_counter()
+    proba = model.predict_proba({model.text_col: titles, "price_value": prices})
+    return [float(row[1]) for row in proba], time.perf_counter() - start
+
+
+def ndjson_line(obj: Any) -> bytes:
+    return _dumps(obj) + b"\n"
@@ -0,0 +1,159 @@
+"""Exact and near-duplicate detection helpers for the cleaning stage."""
+
+import hashlib
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+
+from src.utils.text import normalize_text
+
+
+def key_digest(key: str) -> int:
+    """Return a stable 64-bit digest of ``key``."""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class HashedKeyIndex:
+    """Set of 64-bit key digests for cross-chunk exact dedupe.
+
+    Storing digests instead of the keys themselves keeps memory at roughly
+    a few dozen bytes per distinct key, independent of URL length.
+    """
+
+    def __init__(self) -> None:
+        self._seen: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, key: str) -> bool:
+        return key_digest(key) in self._seen
+
+    def add(self, key: str) -> bool:
+        """Record ``key``; return True if it had not been seen before."""
+        digest = key_digest(key)
+        if digest in self._seen:
+            return False
+        self._seen.add(digest)
+        return True
+
+    def mark_new(self, keys: Iterable[str]) -> List[bool]:
+        """Record ``keys`` in order and flag first occurrences (keep="first")."""
+        return [self.add(k) for k in keys]
+
+
+_LISTING_ID = re.compile(r"/listing/(\d+)")
+_MERSENNE = (1 << 31) - 1
+
+
+def normalize_url(url: str) -> str:
+    """Canonical listing key: Etsy listing id when present, else host + path without query."""
+    parts = urlparse(url.strip())
+    match = _LISTING_ID.search(parts.path)
+    if match:
+        return f"listing:{match.group(1)}"
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{host}{parts.path.rstrip('/')}"
+
+
+def char_shingles(text: str, k: int = 4) -> Set[str]:
+    text = normalize_text(text)
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i : i + k] for i in range(len(text) - k + 1)}
+
+
+def choose_bands(num_perm: int, threshold: float) -> int:
+    """Band count whose LSH S-curve midpoint ``(1/b)^(1/r)`` is closest to ``threshold``."""
+    options = [b for b in range(1, num_perm + 1) if num_perm % b == 0]
+    return min(options, key=lambda b: abs((1.0 / b) ** (b / num_perm) - threshold))
+
+
+class MinHasher:
+    """MinHash signatures from universal hashes ``(a * crc32(x) + b) mod (2^31 - 1)``."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1) -> None:
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _MERSENNE, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingles: Set[str]) -> np.ndarray:
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) % _MERSENNE for s in shingles), dtype=np.uint64)
+        signature: np.ndarray = ((np.outer(hashes, self._a) + self._b) % _MERSENNE).min(axis=0).astype(np.uint32)
+        return signature
+
+
+class NearDuplicateIndex:
+    """Streaming near-duplicate clustering over (title, url) records.
+
+    A record joins an existing cluster when its normalized URL was seen
+    before, or when LSH banding finds a cluster representative whose
+    estimated title Jaccard similarity is at least ``threshold``. Only
+    representatives are indexed, so memory grows with the number of
+    distinct listings (about ``4 * num_perm`` bytes for the signature plus
+    one dict entry per band), not with the number of rows.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, shingle_size: int = 4, seed: int = 1) -> None:
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm=num_perm, seed=seed)
+        self.bands = choose_bands(num_perm, threshold)
+        self.rows = num_perm // self.bands
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(self.bands)]
+        self._signatures = np.zeros((1024, num_perm), dtype=np.uint32)
+        self._urls: Dict[int, int] = {}
+        self.n_clusters = 0
+
+    def _band_keys(self, sig: np.ndarray) -> List[int]:
+        r = self.rows
+        return [hash(sig[i * r : (i + 1) * r].tobytes()) for i in range(self.bands)]
+
+    def _find(self, sig: np.ndarray, band_keys: List[int]) -> Optional[int]:
+        checked: Set[int] = set()
+        for bucket, key in zip(self._buckets, band_keys):
+            for cluster in bucket.get(key, ()):
+                if cluster in checked:
+                    continue
+                checked.add(cluster)
+                if np.mean(self._signatures[cluster] == sig) >= self.threshold:
+                    return cluster
+        return None
+
+    def _new_cluster(self, sig: Optional[np.ndarray], band_keys: List[int]) -> int:
+        cluster = self.n_clusters
+        self.n_clusters += 1
+        if sig is not None:
+            if cluster >= self._signatures.shape[0]:
+                self._signatures = np.resize(self._signatures, (2 * self._signatures.shape[0], self.hasher.num_perm))
+            self._signatures[cluster] = sig
+            for bucket, key in zip(self._buckets, band_keys):
+                bucket.setdefault(key, []).append(cluster)
+        return cluster
+
+    def assign(self, title: str, url: str) -> Tuple[int, bool]:
+        """Return ``(cluster_id, is_duplicate)`` for the next record."""
+        url_key = key_digest(normalize_url(url)) if url else None
+        if url_key is not None and url_key in self._urls:
+            return self._urls[url_key], True
+
+        shingles = char_shingles(title, self.shingle_size)
+        sig: Optional[np.ndarray] = None
+        band_keys: List[int] = []
+        cluster: Optional[int] = None
+        if shingles:
+            sig = self.hasher.signature(shingles)
+            band_keys = self._band_keys(sig)
+            cluster = self._find(sig, band_keys)
+        duplicate = cluster is not None
+        if cluster is None:
+            cluster = self._new_cluster(sig, band_keys)
+        if url_key is not None:
+            self._urls[url_key] = cluster
+        return cluster, duplicate
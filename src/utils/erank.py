@@ -1,34 +1,190 @@
 import csv
-from typing import Dict, List
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _iter_erank_rows(csv_path: str) -> Iterator[Tuple[str, int, str]]:
+    """``(keyword, volume, competition)`` for each usable row of an eRank export."""
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        for r in reader:
+            keyword = r.get("Keyword") or r.get("keyword") or r.get("Term") or r.get("Query")
+            if not keyword:
+                continue
+            vol_str = r.get("Search Volume") or r.get("search_volume") or r.get("Volume") or "0"
+            try:
+                vol = int(str(vol_str).replace(",", "").strip())
+            except Exception:
+                vol = 0
+            yield keyword.strip(), vol, str(r.get("Competition") or r.get("competition") or "")
 
 
 def load_erank_keywords(csv_path: str, min_volume: int = 0, limit: int = 200) -> List[Dict[str, str]]:
     rows: List[Dict[str, str]] = []
     try:
-        with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
-            reader = csv.DictReader(f)
-            for r in reader:
-                keyword = r.get("Keyword") or r.get("keyword") or r.get("Term") or r.get("Query")
-                if not keyword:
-                    continue
-                vol_str = r.get("Search Volume") or r.get("search_volume") or r.get("Volume") or "0"
-                try:
-                    vol = int(str(vol_str).replace(",", "").strip())
-                except Exception:
-                    vol = 0
-                if vol < min_volume:
-                    continue
-                rows.append({
-                    "keyword": keyword.strip(),
-                    "volume": str(vol),
-                    "competition": str(r.get("Competition") or r.get("competition") or ""),
-                })
+        for keyword, vol, competition in _iter_erank_rows(csv_path):
+            if vol < min_volume:
+                continue
+            rows.append({"keyword": keyword, "volume": str(vol), "competition": competition})
         rows.sort(key=lambda x: (-int(x["volume"]), x["keyword"]))
         return rows[:limit]
     except FileNotFoundError:
         return []
 
 
-def top_keywords_only(csv_path: str, min_volume: int = 0, limit: int = 50) -> List[str]:
-    return [r["keyword"] for r in load_erank_keywords(csv_path, min_volume=min_volume, limit=limit)]
+@dataclass(frozen=True)
+class KeywordIndex:
+    """One loaded snapshot of the eRank files; never mutated after construction.
+
+    Keywords map to ids through a dict; volume and competition live in
+    arrays indexed by id, and ``order`` lists ids by descending volume (ties
+    by keyword), so ``top`` is a prefix slice. ``top_cache`` only ever holds
+    results computed from this snapshot.
+    """
+
+    ids: Dict[str, int]
+    keywords: List[str]
+    volume: "np.ndarray"
+    competition: "np.ndarray"
+    order: "np.ndarray"
+    sorted_volume: "np.ndarray"
+    stamp: Any = None
+    top_cache: Dict[Tuple[int, int], List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, ids: Dict[str, int], keywords: List[str], volume: List[int], competition: List[str], stamp: Any) -> "KeywordIndex":
+        import numpy as np
+
+        vol_arr = np.asarray(volume, dtype=np.int64)
+        order = np.lexsort((np.asarray(keywords, dtype=object), -vol_arr)) if keywords else np.zeros(0, dtype=np.int64)
+        return cls(ids, keywords, vol_arr, np.asarray(competition, dtype=str), order, vol_arr[order], stamp)
+
+    def top_ids(self, limit: int, min_volume: int) -> "np.ndarray":
+        import numpy as np
+
+        # volumes are sorted descending, so rows meeting min_volume form a prefix
+        n = int(np.searchsorted(-self.sorted_volume, -min_volume, side="right"))
+        return self.order[: min(limit, n)]
+
+
+class ErankKeywordStore:
+    """eRank keywords held in memory, ordered by volume, reloaded when the files change.
+
+    The loaded data is a :class:`KeywordIndex` replaced by a single
+    attribute store on reload; every reader takes one reference to it, so
+    concurrent lookups never mix two snapshots. Keywords that appear in
+    more than one file keep their highest volume. Source files are checked
+    with ``os.stat`` at most every ``check_interval`` seconds.
+    """
+
+    def __init__(self, paths: Union[str, Sequence[str]], check_interval: float = 5.0) -> None:
+        self.paths = [paths] if isinstance(paths, str) else list(paths)
+        self.check_interval = check_interval
+        self._index = KeywordIndex.build({}, [], [], [], stamp=None)
+        self._checked = float("-inf")
+        self._lock = threading.Lock()
+
+    def _stamps(self) -> Tuple[Optional[Tuple[int, int]], ...]:
+        out: List[Optional[Tuple[int, int]]] = []
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+                out.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                out.append(None)
+        return tuple(out)
 
+    def _load(self, stamp: Any) -> KeywordIndex:
+        ids: Dict[str, int] = {}
+        keywords: List[str] = []
+        volume: List[int] = []
+        competition: List[str] = []
+        for path in self.paths:
+            try:
+                for keyword, vol, comp in _iter_erank_rows(path):
+                    idx = ids.get(keyword)
+                    if idx is None:
+                        ids[keyword] = len(keywords)
+                        keywords.append(keyword)
+                        volume.append(vol)
+                        competition.append(comp)
+                    elif vol > volume[idx]:
+                        volume[idx], competition[idx] = vol, comp
+            except FileNotFoundError:
+                continue
+        return KeywordIndex.build(ids, keywords, volume, competition, stamp)
+
+    def refresh(self, force: bool = False) -> bool:
+        """Reload when any source file changed; returns True if reloaded."""
+        self._checked = time.monotonic()
+        stamp = self._stamps()
+        if not force and stamp == self._index.stamp:
+            return False
+        with self._lock:
+            if force or stamp != self._index.stamp:
+                self._index = self._load(stamp)
+        return True
+
+    def snapshot(self) -> KeywordIndex:
+        """The current index (reloaded first if the files changed and the check is due)."""
+        if time.monotonic() - self._checked >= self.check_interval:
+            self.refresh()
+        return self._index
+
+    @property
+    def version(self) -> Any:
+        """Stamp of the source files behind the loaded index; changes on every reload."""
+        return self.snapshot().stamp
+
+    def __len__(self) -> int:
+        return len(self.snapshot().keywords)
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.snapshot().ids
+
+    def volume_of(self, keyword: str) -> Optional[int]:
+        index = self.snapshot()
+        idx = index.ids.get(keyword)
+        return int(index.volume[idx]) if idx is not None else None
+
+    def top(self, limit: int = 50, min_volume: int = 0) -> List[str]:
+        """Keywords by descending volume (ties alphabetical), like ``top_keywords_only``."""
+        index = self.snapshot()
+        key = (limit, min_volume)
+        cached = index.top_cache.get(key)
+        if cached is None:
+            cached = [index.keywords[i] for i in index.top_ids(limit, min_volume)]
+            index.top_cache[key] = cached
+        return list(cached)
+
+    def rows(self, limit: int = 200, min_volume: int = 0) -> List[Dict[str, str]]:
+        """Same records as ``load_erank_keywords``."""
+        index = self.snapshot()
+        return [
+            {"keyword": index.keywords[i], "volume": str(int(index.volume[i])), "competition": str(index.competition[i])}
+            for i in index.top_ids(limit, min_volume)
+        ]
+
+
+_STORES: Dict[str, ErankKeywordStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_keyword_store(csv_path: str) -> ErankKeywordStore:
+    """Process-wide store for ``csv_path``, created on first use."""
+    key = os.path.abspath(csv_path)
+    store = _STORES.get(key)
+    if store is None:
+        with _STORES_LOCK:
+            store = _STORES.setdefault(key, ErankKeywordStore(key))
+    return store
+
+
+def top_keywords_only(csv_path: str, min_volume: int = 0, limit: int = 50) -> List[str]:
+    return get_keyword_store(csv_path).top(limit=limit, min_volume=min_volume)
@@ -0,0 +1,190 @@
+"""Cache for generated listings keyed on (normalized title, ptype, versions).
+
+Two tiers: an in-process LRU with a TTL, and an optional SQLite file that
+worker processes on the same host share. Keys carry the model version and
+a data epoch (eRank keywords + stats snapshot), so a reload makes old
+entries unreachable; the LRU is also cleared when the epoch changes.
+Values must be JSON-serializable.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.utils.io import ensure_dir
+from src.utils.logger import get_logger
+from src.utils.text import normalize_text
+
+logger = get_logger(__name__)
+
+
+def epoch_of(*parts: Any) -> str:
+    """Short stable digest of version stamps (same value in every process)."""
+    raw = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def cache_key(title: str, ptype: str, model_version: Optional[str], epoch: str, kind: str = "listing") -> str:
+    return "\x1f".join((kind, ptype, str(model_version or ""), epoch, normalize_text(title)))
+
+
+class LRUCache:
+    """Thread-safe LRU with a per-entry time-to-live (``ttl <= 0`` disables expiry)."""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._data: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expired = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if self.ttl > 0 and item[0] <= self.clock():
+                del self._data[key]
+                self.expired += 1
+                return None
+            self._data.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (self.clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """TTL key/value table in a local SQLite file shared by processes on one host."""
+
+    def __init__(self, path: str, ttl: float = 3600.0, prune_every: int = 1000) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.prune_every = prune_every
+        self._writes = 0
+        self._local = threading.local()
+        if os.path.dirname(path):
+            ensure_dir(os.path.dirname(path))
+        with self._conn() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():  # never reuse a connection across fork
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._conn().execute("SELECT value, expires FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or (self.ttl > 0 and row[1] <= time.time()):
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + self.ttl if self.ttl > 0 else float("inf")),
+            )
+        self._writes += 1
+        if self._writes % self.prune_every == 0:
+            self.prune()
+
+    def prune(self) -> int:
+        conn = self._conn()
+        with conn:
+            return conn.execute("DELETE FROM cache WHERE expires <= ?", (time.time(),)).rowcount
+
+    def clear(self) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM cache")
+
+
+class GenerationCache:
+    """In-process LRU in front of an optional shared SQLite tier, with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0, shared_path: Optional[str] = None) -> None:
+        self.local = LRUCache(maxsize, ttl)
+        self.shared = SQLiteCache(shared_path, ttl) if shared_path else None
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._epoch: Optional[str] = None
+
+    def observe_epoch(self, epoch: str) -> None:
+        """Drop the local tier when the data/model epoch changes (its keys are unreachable)."""
+        if epoch != self._epoch:
+            if self._epoch is not None:
+                self.local.clear()
+                self.invalidations += 1
+                logger.info("Generation cache invalidated (epoch %s -> %s)", self._epoch, epoch)
+            self._epoch = epoch
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        if self.shared is not None:
+            try:
+                value = self.shared.get(key)
+            except sqlite3.Error as e:
+                logger.warning("Shared cache read failed: %s", e)
+                value = None
+            if value is not None:
+                self.shared_hits += 1
+                self.local.set(key, value)
+                return value
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        self.local.set(key, value)
+        if self.shared is not None:
+            try:
+                self.shared.set(key, value)
+            except sqlite3.Error as e:
+                logger.warning("Shared cache write failed: %s", e)
+
+    def clear(self) -> None:
+        self.local.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+            "size": len(self.local),
+            "evictions": self.local.evictions,
+            "expired": self.local.expired,
+            "invalidations": self.invalidations,
+        }
@@ -1,6 +1,23 @@
 import csv
+import gzip
+import hashlib
+import json
 import os
-from typing import Any, Dict, List
+import re
+from contextlib import contextmanager
+from itertools import islice
+from operator import itemgetter
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, cast
+
+try:  # optional fast path
+    import orjson
+
+    _loads: Callable[[Any], Any] = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    _loads = json.loads
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def ensure_dir(path: str) -> None:
@@ -8,16 +25,324 @@ def ensure_dir(path: str) -> None:
         os.makedirs(path, exist_ok=True)
 
 
-def write_csv(path: str, rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
+def open_text(path: str, mode: str = "r", compression_path: Optional[str] = None) -> IO[str]:
+    """Open a text file, gzip/zstd-compressed when the name ends in ``.gz``/``.zst``.
+
+    ``compression_path`` picks the codec from another name, which lets a
+    temporary file be written with the codec of its final destination.
+    """
+    name = compression_path or path
+    kwargs: Dict[str, Any] = {"encoding": "utf-8", "newline": ""}
+    if name.endswith(".gz"):
+        return cast("IO[str]", gzip.open(path, mode + "t", **kwargs))
+    if name.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("Reading/writing .zst files requires the 'zstandard' package") from e
+        return cast("IO[str]", zstandard.open(path, mode + "t", **kwargs))
+    return open(path, mode, **kwargs)
+
+
+@contextmanager
+def atomic_open(path: str) -> Iterator[IO[str]]:
+    """Write to a temporary sibling and rename it over ``path`` only on success."""
     ensure_dir(os.path.dirname(path))
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    tmp = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open_text(tmp, "w", compression_path=path) as f:
+            yield f
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class CsvBatchWriter:
+    """Buffered CSV writer for row batches or column arrays, renamed into place on close.
+
+    Like ``csv.DictWriter``, rows with keys outside ``fieldnames`` raise
+    ValueError unless ``extrasaction="ignore"``.
+    """
+
+    def __init__(self, path: str, fieldnames: Sequence[str], extrasaction: str = "raise") -> None:
+        if extrasaction not in ("raise", "ignore"):
+            raise ValueError(f"extrasaction ({extrasaction}) must be 'raise' or 'ignore'")
+        self.path = path
+        self.fieldnames = list(fieldnames)
+        self.extrasaction = extrasaction
+        self.rows_written = 0
+        self._ctx = atomic_open(path)
+        self._writer: Any = None
+
+    def __enter__(self) -> "CsvBatchWriter":
+        self._writer = csv.writer(self._ctx.__enter__())
+        self._writer.writerow(self.fieldnames)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._ctx.__exit__(*exc)
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        fields = self.fieldnames
+        get = itemgetter(*fields) if fields else (lambda row: ())
+        single = len(fields) == 1
+        width = len(fields)
+        check = self.extrasaction == "raise"
+        write = self._writer.writerow
+        n = 0
         for row in rows:
-            writer.writerow(row)
+            try:
+                values = get(row)
+            except KeyError:  # missing keys are written empty, like DictWriter's restval
+                if check:
+                    self._check_extras(row)
+                values = [row.get(f, "") for f in fields]
+            else:
+                if check and len(row) > width:
+                    self._check_extras(row)
+                if single:
+                    values = (values,)
+            write(values)
+            n += 1
+        self.rows_written += n
+
+    def _check_extras(self, row: Dict[str, Any]) -> None:
+        extra = [k for k in row if k not in self.fieldnames]
+        if extra:
+            raise ValueError("dict contains fields not in fieldnames: " + ", ".join(repr(k) for k in extra))
+
+    def write_columns(self, columns: Dict[str, Sequence[Any]]) -> None:
+        cols = [columns[f] for f in self.fieldnames]
+        n = len(cols[0]) if cols else 0
+        self._writer.writerows(zip(*cols))
+        self.rows_written += n
+
+
+def write_csv(path: str, rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
+    with CsvBatchWriter(path, fieldnames) as writer:
+        writer.write_rows(rows)
 
 
 def read_csv(path: str) -> List[Dict[str, Any]]:
-    with open(path, "r", newline="", encoding="utf-8") as f:
+    with open_text(path) as f:
         return list(csv.DictReader(f))
 
+
+def _typed(values: List[str], dtype: Any) -> Any:
+    if dtype is None or dtype is str:
+        return values
+    import numpy as np
+
+    np_dtype = np.dtype(dtype)
+    if np_dtype.kind == "f":
+        return np.fromiter((float(v) if v else np.nan for v in values), dtype=np_dtype, count=len(values))
+    return np.array(values).astype(np_dtype)
+
+
+def iter_csv_batches(
+    path: str, batch_size: int = 100_000, dtypes: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield ``{column: values}`` batches; columns in ``dtypes`` become numpy arrays.
+
+    Float columns map empty cells to NaN. Other columns stay lists of str.
+    """
+    dtypes = dtypes or {}
+    with open_text(path) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        width = len(header)
+        while True:
+            columns: List[List[str]] = [[] for _ in header]
+            appenders = [c.append for c in columns]
+            n = 0
+            for row in islice(reader, batch_size):
+                if len(row) != width:
+                    row = (row + [""] * width)[:width]
+                for append, value in zip(appenders, row):
+                    append(value)
+                n += 1
+            if not n:
+                return
+            yield {name: _typed(col, dtypes.get(name)) for name, col in zip(header, columns)}
+
+
+def read_csv_columns(path: str, dtypes: Optional[Dict[str, Any]] = None, batch_size: int = 100_000) -> Dict[str, Any]:
+    """Whole-file column arrays built from ``iter_csv_batches``."""
+    import numpy as np
+
+    parts: Dict[str, List[Any]] = {}
+    for batch in iter_csv_batches(path, batch_size, dtypes):
+        for name, values in batch.items():
+            parts.setdefault(name, []).append(values)
+    out: Dict[str, Any] = {}
+    for name, chunks in parts.items():
+        if isinstance(chunks[0], np.ndarray):
+            out[name] = np.concatenate(chunks)
+        else:
+            out[name] = [v for chunk in chunks for v in chunk]
+    return out
+
+
+def iter_csv_chunks(path: str, chunksize: int) -> Iterator["pd.DataFrame"]:
+    """Yield DataFrame chunks of at most ``chunksize`` rows.
+
+    Every column is read as text so that values round-trip unchanged no
+    matter how rows are split across chunks.
+    """
+    import pandas as pd
+
+    with pd.read_csv(path, chunksize=chunksize, dtype=str) as reader:
+        yield from reader
+
+
+def write_csv_chunks(path: str, chunks: Iterable["pd.DataFrame"]) -> int:
+    """Write DataFrame chunks to one CSV incrementally (atomically); return the row count."""
+    total = 0
+    with atomic_open(path) as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, index=False, header=(i == 0))
+            total += len(chunk)
+    return total
+
+
+def file_digest(path: str, block_size: int = 1 << 20) -> str:
+    """Return a short content hash of ``path``, read in fixed-size blocks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            h.update(block)
+    return h.hexdigest()
+
+
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def _skip_separators(buf: str, idx: int) -> int:
+    match = _SEPARATORS.match(buf, idx)
+    return match.end() if match else idx
+
+
+def _iter_json_array(f: Any, block_size: int) -> Iterator[Any]:
+    """Incrementally decode the elements of a top-level JSON array.
+
+    A cursor walks the buffer; the consumed prefix is only dropped when the
+    next block is appended, so each record costs its own size, not the buffer's.
+    """
+    decoder = json.JSONDecoder()
+    buf = f.read(block_size)
+    while not buf.strip() and (block := f.read(block_size)):
+        buf += block
+    idx = len(buf) - len(buf.lstrip())
+    if not buf.startswith("[", idx):
+        raise ValueError("Expected a JSON array")
+    idx += 1
+    eof = False
+    while True:
+        idx = _skip_separators(buf, idx)
+        if idx < len(buf):
+            if buf[idx] == "]":
+                return
+            try:
+                obj, end = decoder.raw_decode(buf, idx)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A value ending exactly at the buffer end may be a truncated number.
+                if end < len(buf) or eof:
+                    yield obj
+                    idx = end
+                    continue
+        elif eof:
+            raise ValueError("Unterminated JSON array")
+        block = f.read(max(block_size, len(buf) - idx))
+        eof = not block
+        buf = buf[idx:] + block
+        idx = 0
+
+
+def iter_json_records(path: str, block_size: int = 1 << 20) -> Iterator[Dict[str, Any]]:
+    """Yield records from a JSON array file or a JSONL file without loading it whole."""
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(64).lstrip()
+        f.seek(0)
+        if head.startswith("["):
+            yield from _iter_json_array(f, block_size)
+            return
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+
+def iter_json_batches(
+    path: str, batch_size: int = 50_000, as_text: bool = False, dtypes: Optional[Dict[str, Any]] = None
+) -> Iterator["pd.DataFrame"]:
+    """Stream records into per-column buffers and yield one DataFrame per batch.
+
+    ``as_text`` stringifies non-null values to match ``iter_csv_chunks``;
+    ``dtypes`` is applied to each batch for compact typed columns.
+    """
+    import pandas as pd
+
+    columns: Dict[str, List[Any]] = {}
+    n = 0
+
+    def flush() -> "pd.DataFrame":
+        df = pd.DataFrame(columns)
+        return df.astype(dtypes) if dtypes else df
+
+    for record in iter_json_records(path):
+        for key in record:
+            if key not in columns:
+                columns[key] = [None] * n
+        for key, values in columns.items():
+            value = record.get(key)
+            values.append(str(value) if as_text and value is not None else value)
+        n += 1
+        if n >= batch_size:
+            yield flush()
+            columns = {k: [] for k in columns}
+            n = 0
+    if n or not columns:
+        yield flush()
+
+
+def load_json_frame(path: str, batch_size: int = 50_000, dtypes: Optional[Dict[str, Any]] = None) -> "pd.DataFrame":
+    import pandas as pd
+
+    return pd.concat(list(iter_json_batches(path, batch_size, dtypes=dtypes)), ignore_index=True)
+
+
+def iter_parquet_chunks(path: str, chunksize: int) -> Iterator["pd.DataFrame"]:
+    """Row-group batches of a Parquet file (column types as stored)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading .parquet files requires the 'pyarrow' package") from e
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+        yield batch.to_pandas()
+
+
+def iter_table_chunks(path: str, chunksize: int) -> Iterator["pd.DataFrame"]:
+    """Text-typed chunks from a CSV, JSON array or JSONL file, chosen by extension.
+
+    Parquet files are also accepted; their chunks keep the stored column types.
+    """
+    if path.endswith((".json", ".jsonl")):
+        yield from iter_json_batches(path, chunksize, as_text=True)
+    elif path.endswith(".parquet"):
+        yield from iter_parquet_chunks(path, chunksize)
+    else:
+        yield from iter_csv_chunks(path, chunksize)
+
+
+def read_table(path: str) -> "pd.DataFrame":
+    """Whole-file, text-typed counterpart of ``iter_table_chunks``."""
+    import pandas as pd
+
+    if path.endswith((".json", ".jsonl")):
+        return pd.concat(list(iter_json_batches(path, as_text=True)), ignore_index=True)
+    return pd.read_csv(path, dtype=str)
@@ -0,0 +1,148 @@
+"""Request stage timing and Prometheus text exposition.
+
+A :class:`RequestTimer` is bound to the current context for the duration of
+a request; code anywhere below it wraps work in ``with span("stage"):``.
+Outside a timed request ``span`` does nothing, and nested spans are folded
+into the outermost one so the stages of a request add up to (at most) its
+total. Finished timers are observed into :class:`Histogram` series of a
+:class:`MetricsRegistry`, which renders the Prometheus text format.
+Metrics are per process: each server worker exposes its own.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class RequestTimer:
+    """Stage durations (seconds) of one request."""
+
+    def __init__(self, route: str) -> None:
+        self.route = route
+        self.labels: Dict[str, str] = {}
+        self.stages: Dict[str, float] = {}
+        self.started = time.perf_counter()
+        self.total: Optional[float] = None
+        self._depth = 0
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def finish(self) -> float:
+        if self.total is None:
+            self.total = time.perf_counter() - self.started
+        return self.total
+
+    def breakdown_ms(self) -> Dict[str, float]:
+        return {stage: round(s * 1000.0, 3) for stage, s in sorted(self.stages.items(), key=lambda kv: -kv[1])}
+
+
+_current: ContextVar[Optional[RequestTimer]] = ContextVar("request_timer", default=None)
+
+
+def current_timer() -> Optional[RequestTimer]:
+    return _current.get()
+
+
+def bind_timer(timer: Optional[RequestTimer]) -> None:
+    _current.set(timer)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Time ``stage`` on the current request's timer (no-op without one)."""
+    timer = _current.get()
+    if timer is None or timer._depth:
+        yield
+        return
+    timer._depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer._depth -= 1
+        timer.add(stage, time.perf_counter() - start)
+
+
+def _labels_text(labels: Labels, extra: str = "") -> str:
+    parts = [f'{k}="{_escape(v)}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram, one series per label set."""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Labels, List[float]] = {}  # bucket counts..., +Inf count, sum
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            series[i] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        bounds = [f'le="{_number(b)}"' for b in self.buckets] + ['le="+Inf"']
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        for labels, series in items:
+            cumulative = 0.0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_labels_text(labels, bound)} {_number(cumulative)}")
+            lines.append(f"{self.name}_sum{_labels_text(labels)} {series[-1]!r}")
+            lines.append(f"{self.name}_count{_labels_text(labels)} {_number(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Request and stage latency histograms plus callback-backed counters/gauges."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.requests = Histogram("listing_request_seconds", "Request latency by route and ptype.", buckets)
+        self.stages = Histogram("listing_stage_seconds", "Time spent per request stage by route, stage and ptype.", buckets)
+        self._collectors: List[Tuple[str, str, str, Callable[[], Dict[Labels, float]]]] = []
+
+    def collector(self, name: str, kind: str, help_text: str, fn: Callable[[], Dict[Labels, float]]) -> None:
+        """Register a ``counter``/``gauge`` whose samples are read from ``fn`` at scrape time."""
+        self._collectors.append((name, kind, help_text, fn))
+
+    def observe(self, timer: RequestTimer) -> None:
+        labels = {"route": timer.route, **timer.labels}
+        self.requests.observe(timer.finish(), **labels)
+        for stage, seconds in timer.stages.items():
+            self.stages.observe(seconds, stage=stage, **labels)
+
+    def render(self) -> str:
+        lines = self.requests.render() + self.stages.render()
+        for name, kind, help_text, fn in self._collectors:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for labels, value in sorted(fn().items()):
+                lines.append(f"{name}{_labels_text(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
@@ -2,11 +2,11 @@
 
 import random
 import time
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from dataclasses import dataclass
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import requests
 
 @dataclass
 class ProxyConfig:
@@ -56,6 +56,8 @@ class ProxyManager:
     
     def test_proxy(self, proxy_dict: dict, test_url: str = "https://httpbin.org/ip") -> bool:
         """Test if proxy is working."""
+        import requests
+
         try:
             response = requests.get(test_url, proxies=proxy_dict, timeout=10)
             return response.status_code == 200
@@ -108,6 +110,10 @@ class RobustScraper:
     """Scraper with proxy support and advanced rate limiting."""
     
     def __init__(self, proxies: List[ProxyConfig] = None, rate_limit: RateLimiter = None):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self.proxy_manager = ProxyManager(proxies)
         self.rate_limiter = rate_limit or RateLimiter()
         self.session = requests.Session()
@@ -122,8 +128,10 @@ class RobustScraper:
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
-    def get_page(self, url: str) -> Optional[requests.Response]:
+    def get_page(self, url: str) -> Optional["requests.Response"]:
         """Get page with proxy rotation and rate limiting."""
+        import requests
+
         max_attempts = 3
         
         for attempt in range(max_attempts):
@@ -1,9 +1,10 @@
 import random
 import time
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-import requests
-from bs4 import BeautifulSoup
+if TYPE_CHECKING:  # imported on use: both are slow to import and unused by most callers
+    import requests
+    from bs4 import BeautifulSoup
 
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -15,7 +16,9 @@ DEFAULT_HEADERS = {
 }
 
 
-def polite_get(url: str, delay_seconds: float = 1.0, timeout: int = 20) -> Optional[requests.Response]:
+def polite_get(url: str, delay_seconds: float = 1.0, timeout: int = 20) -> Optional["requests.Response"]:
+    import requests
+
     time.sleep(delay_seconds + random.uniform(0, 0.5))
     try:
         resp = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
@@ -26,7 +29,9 @@ def polite_get(url: str, delay_seconds: float = 1.0, timeout: int = 20) -> Optio
         return None
 
 
-def get_soup(url: str, delay_seconds: float = 1.0) -> Optional[BeautifulSoup]:
+def get_soup(url: str, delay_seconds: float = 1.0) -> Optional["BeautifulSoup"]:
+    from bs4 import BeautifulSoup
+
     resp = polite_get(url, delay_seconds=delay_seconds)
     if not resp:
         return None
@@ -0,0 +1,183 @@
+"""Small statistics snapshot of the cleaned dataset for request-time lookups.
+
+``snapshot_from_csv`` reads only the columns it needs and writes global and
+per-ptype price summaries plus top title terms to a JSON file. Serving code
+keeps a :class:`StatsSnapshot` in memory and only re-reads the file when it
+(or the source CSV) changes, so a lookup is a dict access. pandas is only
+imported when a snapshot is built.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from src.utils.io import atomic_open
+from src.utils.logger import get_logger
+from src.utils.text import preprocess_text
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = get_logger(__name__)
+
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+
+def price_summary(prices: "pd.Series") -> Dict[str, Any]:
+    import pandas as pd
+
+    prices = pd.to_numeric(prices, errors="coerce").dropna()
+    if prices.empty:
+        return {"count": 0}
+    q = prices.quantile(list(QUANTILES))
+    return {
+        "count": int(len(prices)),
+        "median": float(prices.median()),
+        "mean": float(prices.mean()),
+        "min": float(prices.min()),
+        "max": float(prices.max()),
+        "quantiles": {f"q{int(p * 100)}": float(v) for p, v in zip(QUANTILES, q.to_numpy())},
+    }
+
+
+def top_terms(titles: "pd.Series", n: int = 30) -> List[List[Any]]:
+    counts: Counter = Counter()
+    for title in titles.fillna("").astype(str):
+        counts.update(preprocess_text(title).split())
+    return [[term, int(c)] for term, c in counts.most_common(n)]
+
+
+def build_stats(
+    df: "pd.DataFrame", price_col: str = "price_value", ptype_col: str = "ptype", title_col: str = "title", top_n: int = 30
+) -> Dict[str, Any]:
+    import pandas as pd
+
+    empty = pd.Series(dtype=object)
+    prices = df[price_col] if price_col in df.columns else empty
+    titles = df[title_col] if title_col in df.columns else empty
+    stats: Dict[str, Any] = {
+        "rows": int(len(df)),
+        "global": {**price_summary(prices), "top_terms": top_terms(titles, top_n)},
+        "by_ptype": {},
+    }
+    if ptype_col in df.columns:
+        for ptype, group in df.groupby(df[ptype_col].fillna("").astype(str)):
+            if not ptype:
+                continue
+            stats["by_ptype"][ptype] = {
+                **price_summary(group[price_col] if price_col in group.columns else empty),
+                "top_terms": top_terms(group[title_col] if title_col in group.columns else empty, top_n),
+            }
+    return stats
+
+
+def _source_stamp(path: str) -> Dict[str, Any]:
+    st = os.stat(path)
+    return {"path": os.path.abspath(path), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def snapshot_from_csv(csv_path: str, out_path: str, price_col: str = "price_value", **kwargs: Any) -> Dict[str, Any]:
+    """Build the snapshot for ``csv_path`` and write it atomically to ``out_path``."""
+    import pandas as pd
+
+    wanted = {price_col, kwargs.get("ptype_col", "ptype"), kwargs.get("title_col", "title")}
+    header = pd.read_csv(csv_path, nrows=0).columns
+    df = pd.read_csv(csv_path, usecols=[c for c in header if c in wanted], dtype=str)
+    stats = build_stats(df, price_col=price_col, **kwargs)
+    stats["source"] = _source_stamp(csv_path)
+    stats["version"] = hashlib.blake2b(json.dumps(stats, sort_keys=True).encode("utf-8"), digest_size=8).hexdigest()
+    stats["created"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    with atomic_open(out_path) as f:
+        json.dump(stats, f, indent=2)
+    return stats
+
+
+class StatsSnapshot:
+    """In-memory view of a snapshot file, refreshed when it or its source changes.
+
+    File checks are rate-limited to one ``stat`` per ``check_interval``
+    seconds; when ``source`` is newer than the snapshot and ``rebuild`` is
+    set, the snapshot is regenerated once in a background thread.
+    """
+
+    def __init__(self, path: str, source: Optional[str] = None, check_interval: float = 30.0, rebuild: bool = True) -> None:
+        self.path = path
+        self.source = source
+        self.check_interval = check_interval
+        self.rebuild = rebuild
+        self._stats: Dict[str, Any] = {}
+        self._stamp: Any = None
+        self._checked = float("-inf")
+        self._rebuilding = threading.Lock()
+
+    def _file_stamp(self, path: Optional[str]) -> Any:
+        try:
+            st = os.stat(path) if path else None
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size) if st else None
+
+    def _rebuild(self) -> None:
+        source = self.source
+        if source is None or not self._rebuilding.acquire(blocking=False):
+            return
+        try:
+            snapshot_from_csv(source, self.path)
+            logger.info("Rebuilt stats snapshot %s from %s", self.path, self.source)
+        except Exception as e:
+            logger.warning("Could not rebuild stats snapshot: %s", e)
+        finally:
+            self._rebuilding.release()
+
+    def _load(self) -> None:
+        stamp = self._file_stamp(self.path)
+        if stamp is None or stamp == self._stamp:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._stats = json.load(f)
+            self._stamp = stamp
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read stats snapshot %s: %s", self.path, e)
+
+    def stale(self) -> bool:
+        """True when the source CSV differs from the one the snapshot was built from."""
+        source = self._file_stamp(self.source)
+        recorded = self._stats.get("source", {})
+        return source is not None and source != (recorded.get("mtime_ns"), recorded.get("size"))
+
+    def refresh(self, background: bool = True) -> None:
+        self._checked = time.monotonic()
+        self._load()
+        if self.rebuild and self.stale():
+            if background:
+                threading.Thread(target=self._rebuild, name="stats-rebuild", daemon=True).start()
+            else:
+                self._rebuild()
+                self._load()
+
+    def get(self) -> Dict[str, Any]:
+        if time.monotonic() - self._checked >= self.check_interval:
+            self.refresh()
+        return self._stats
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.get().get("version")
+
+    def summary(self, ptype: Optional[str] = None) -> Dict[str, Any]:
+        """Per-ptype summary when available, else the global one."""
+        stats = self.get()
+        by_ptype: Dict[str, Dict[str, Any]] = stats.get("by_ptype", {})
+        if ptype and by_ptype.get(ptype, {}).get("count"):
+            return by_ptype[ptype]
+        summary: Dict[str, Any] = stats.get("global", {})
+        return summary
+
+    def median_price(self, ptype: Optional[str] = None, default: float = 0.0) -> float:
+        value = self.summary(ptype).get("median")
+        return float(value) if value is not None else default
@@ -0,0 +1,198 @@
+"""Precomputed per-ptype tag candidates.
+
+Etsy tags are limited to 13 letters; the web app wants multi-word tags.
+:class:`TagIndex` scores every valid two-word combination of a ptype's term
+pool once, together with multi-word eRank keywords that already fit, and
+keeps them ranked per ptype and bucketed by letter count. A suggestion is
+then a walk down that list, optionally starting with tags that contain
+terms from the user's own title.
+
+Term scores add a TF-IDF part (term score over the best score), an eRank
+part (``log1p`` volume over the largest) and a bonus for the ptype's base
+words. A pair scores the sum of its terms; a multi-word eRank keyword
+adds its volume part on top (so "wall art" outranks an unsearched pair).
+In a pair, base words come after other words ("gold ring") and follow
+the base list order among themselves ("metal art"). Ptypes without base
+words fall back to an index over the global pool alone.
+"""
+
+import heapq
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from src.utils.text import preprocess_text
+
+MAX_TAG_LETTERS = 13
+MAX_PER_TERM = 3
+
+BASE_BY_TYPE: Dict[str, List[str]] = {
+    "metal_wall_art": ["metal", "wall", "art", "decor", "custom", "gift", "modern", "home", "minimal"],
+    "poster": ["poster", "print", "wall", "art", "decor", "digital", "download", "gift"],
+    "jewelry": ["jewelry", "necklace", "ring", "gift", "handmade", "women"],
+    "bag": ["bag", "tote", "leather", "gift", "handmade", "travel"],
+    "canvas": ["canvas", "wall", "art", "decor", "print"],
+    "mug": ["coffee", "mug", "gift", "kitchen"],
+    "tshirt": ["tshirt", "tee", "graphic", "gift"],
+    "sticker": ["sticker", "vinyl", "laptop", "waterproof"],
+}
+
+
+def tag_letters(tag: str) -> int:
+    return len(tag.replace(" ", ""))
+
+
+def is_valid_tag(tag: str) -> bool:
+    """Multi-word and at most ``MAX_TAG_LETTERS`` letters (spaces excluded)."""
+    return " " in tag and tag_letters(tag) <= MAX_TAG_LETTERS
+
+
+@dataclass
+class PtypeTags:
+    tags: List[str] = field(default_factory=list)  # by descending score
+    scores: List[float] = field(default_factory=list)
+    letters: List[int] = field(default_factory=list)
+    default: List[int] = field(default_factory=list)  # greedy pick honouring MAX_PER_TERM
+    by_letters: Dict[int, List[int]] = field(default_factory=dict)  # letters -> positions in ``tags``
+    by_term: Dict[str, List[int]] = field(default_factory=dict)  # word -> positions in ``tags``
+
+
+class TagIndex:
+    """Ranked multi-word tag candidates for each ptype."""
+
+    def __init__(self, ptypes: Mapping[str, PtypeTags], fallback: Optional[PtypeTags] = None) -> None:
+        self.ptypes = dict(ptypes)
+        self.fallback = fallback  # used for ptypes without base words
+
+    @classmethod
+    def build(
+        cls,
+        top_terms: Sequence[Tuple[str, float]] = (),
+        erank: Sequence[Tuple[str, int]] = (),
+        ptype_terms: Optional[Mapping[str, Sequence[Tuple[str, float]]]] = None,
+        base_by_type: Mapping[str, Sequence[str]] = BASE_BY_TYPE,
+        pool_size: int = 80,
+        base_bonus: float = 1.0,
+    ) -> "TagIndex":
+        """Index tags for every ptype in ``base_by_type``, plus a fallback.
+
+        ``top_terms`` are global ``(term, tfidf score)`` pairs, ``erank`` is
+        ``(keyword, volume)`` and ``ptype_terms`` optionally adds per-ptype
+        ``(term, weight)`` pairs (e.g. title term counts). Each ptype's pool
+        is its ``pool_size`` best single words. The fallback has no base
+        words and no per-ptype terms.
+        """
+        tfidf = _normalised((t.strip().lower(), s) for t, s in top_terms if " " not in t.strip())
+        volume = {k.strip().lower(): v for k, v in erank}
+        max_log = max((math.log1p(v) for v in volume.values()), default=0.0) or 1.0
+        vol_score = {k: math.log1p(v) / max_log for k, v in volume.items()}
+        phrases = {k: s for k, s in vol_score.items() if is_valid_tag(k)}
+
+        def index(base: Sequence[str], terms: Sequence[Tuple[str, float]]) -> PtypeTags:
+            local = _normalised((t, s) for t, s in terms if " " not in t)
+            words = set(tfidf) | set(local) | {k for k in vol_score if " " not in k} | set(base)
+            base_set = set(base)
+            term_score = {
+                w: tfidf.get(w, 0.0) + local.get(w, 0.0) + vol_score.get(w, 0.0) + (base_bonus if w in base_set else 0.0)
+                for w in words
+            }
+            pool = sorted(term_score, key=lambda w: (-term_score[w], w))[:pool_size]
+            order = {w: i for i, w in enumerate(base)}
+            candidates: Dict[str, float] = {}
+            for a in pool:
+                for b in pool:
+                    pa, pb = order.get(a, -1), order.get(b, -1)
+                    if a != b and (pa < pb or pa == pb == -1):
+                        tag = f"{a} {b}"
+                        if is_valid_tag(tag):
+                            candidates[tag] = term_score[a] + term_score[b]
+            for tag, bonus in phrases.items():
+                candidates[tag] = candidates.get(tag, 0.0) + bonus
+            return _rank(candidates)
+
+        per_type = ptype_terms or {}
+        ptypes = {ptype: index(base, per_type.get(ptype, ())) for ptype, base in base_by_type.items()}
+        return cls(ptypes, fallback=index((), ()))
+
+    def suggest(
+        self,
+        ptype: str,
+        limit: int = 13,
+        title: str = "",
+        max_letters: int = MAX_TAG_LETTERS,
+        max_per_term: int = MAX_PER_TERM,
+        scan: int = 16,
+    ) -> List[str]:
+        """Top ``limit`` tags for ``ptype``; tags sharing words with ``title`` come first.
+
+        Unknown ptypes use the fallback index.
+
+        No word appears in more than ``max_per_term`` of the returned tags
+        unless there are too few candidates otherwise, and ``a b`` / ``b a``
+        count as the same tag. Only the best ``scan``
+        tags per title word are considered for the personal part.
+        """
+        entry = self.ptypes.get(ptype, self.fallback)
+        if entry is None:
+            return []
+        picked: List[str] = []
+        seen: set = set()
+        uses: Dict[str, int] = defaultdict(int)
+
+        def take(positions: Iterable[int], cap: int = max_per_term) -> None:
+            for pos in positions:
+                if len(picked) >= limit:
+                    return
+                tag = entry.tags[pos]
+                words = tag.split()
+                key = frozenset(words)
+                if key in seen or any(uses[w] >= cap for w in words):
+                    continue
+                seen.add(key)
+                for w in words:
+                    uses[w] += 1
+                picked.append(tag)
+
+        letters = entry.letters
+        if title:
+            terms = dict.fromkeys(preprocess_text(title).split())
+            personal = (entry.by_term.get(t, [])[:scan] for t in terms)
+            take(pos for pos in heapq.merge(*personal) if letters[pos] <= max_letters)
+        if max_letters >= MAX_TAG_LETTERS:
+            if max_per_term == MAX_PER_TERM:
+                take(entry.default)
+            ranked: Iterable[int] = range(len(entry.tags))
+        else:
+            ranked = list(heapq.merge(*(entry.by_letters.get(n, []) for n in range(1, max_letters + 1))))
+        take(ranked)
+        if len(picked) < limit:  # small vocabularies: fill up regardless of the per-word cap
+            take(ranked, cap=limit)
+        return picked
+
+
+def _normalised(pairs: Iterable[Tuple[str, float]]) -> Dict[str, float]:
+    scores: Dict[str, float] = {}
+    for term, score in pairs:
+        if term:
+            scores[term] = max(scores.get(term, 0.0), float(score))
+    top = max(scores.values(), default=0.0) or 1.0
+    return {t: s / top for t, s in scores.items()}
+
+
+def _rank(candidates: Mapping[str, float], default_size: int = 64) -> PtypeTags:
+    entry = PtypeTags()
+    uses: Dict[str, int] = defaultdict(int)
+    for pos, tag in enumerate(sorted(candidates, key=lambda t: (-candidates[t], t))):
+        words = tag.split()
+        entry.tags.append(tag)
+        entry.scores.append(candidates[tag])
+        entry.letters.append(tag_letters(tag))
+        entry.by_letters.setdefault(entry.letters[-1], []).append(pos)
+        for w in dict.fromkeys(words):
+            entry.by_term.setdefault(w, []).append(pos)
+        if len(entry.default) < default_size and all(uses[w] < MAX_PER_TERM for w in words):
+            entry.default.append(pos)
+            for w in words:
+                uses[w] += 1
+    return entry
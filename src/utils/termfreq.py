@@ -0,0 +1,200 @@
+"""Single-pass, sharded unigram/bigram counting for cleaned text columns.
+
+Counts are sharded by ``(ptype, sales bucket, field, n)`` so one pass over
+the data serves every category report. Partial counts from parallel
+workers merge by addition and persist to a small SQLite table.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.utils.analytics import price_bands
+from src.utils.io import ensure_dir, file_digest, iter_csv_chunks
+
+ShardKey = Tuple[str, str, str, int]  # (ptype, bucket, field, n)
+
+ALL_PTYPES = ""
+BUCKET_ALL = "all"
+BUCKET_TOP = "top"
+BUCKET_REST = "rest"
+BUCKET_UNKNOWN = "unknown"
+
+
+def iter_ngrams(tokens: Sequence[str], n: int) -> Iterator[str]:
+    if n == 1:
+        yield from tokens
+        return
+    for i in range(len(tokens) - n + 1):
+        yield " ".join(tokens[i : i + n])
+
+
+class TermCounts:
+    """Mergeable term counts plus per-shard row counts."""
+
+    def __init__(self) -> None:
+        self.tables: Dict[ShardKey, Counter] = defaultdict(Counter)
+        self.rows: Counter = Counter()
+
+    def add_frame(
+        self,
+        df: pd.DataFrame,
+        fields: Sequence[str] = ("title_clean", "description_clean"),
+        ngrams: Sequence[int] = (1, 2),
+        ptype_col: str = "ptype",
+        sales_col: str = "sales",
+        threshold: Optional[float] = None,
+        price_col: Optional[str] = None,
+    ) -> None:
+        """Count one frame. Buckets are sales buckets, or price bands when ``price_col`` is set."""
+        ptypes = df[ptype_col].fillna("").astype(str) if ptype_col in df.columns else pd.Series(ALL_PTYPES, index=df.index)
+        if price_col is not None and price_col in df.columns:
+            bands = price_bands(pd.to_numeric(df[price_col], errors="coerce"))
+            buckets = bands.astype(object).where(bands.notna(), BUCKET_UNKNOWN)
+        elif threshold is None or sales_col not in df.columns:
+            buckets = pd.Series(BUCKET_ALL, index=df.index)
+        else:
+            sales = pd.to_numeric(df[sales_col], errors="coerce")
+            buckets = pd.Series(BUCKET_REST, index=df.index)
+            buckets[sales >= threshold] = BUCKET_TOP
+            buckets[sales.isna()] = BUCKET_UNKNOWN
+        for ptype, bucket in zip(ptypes, buckets):
+            self.rows[(ptype, bucket)] += 1
+        for field in fields:
+            if field not in df.columns:
+                continue
+            texts = df[field].fillna("").astype(str)
+            for ptype, bucket, text in zip(ptypes, buckets, texts):
+                tokens = text.split()
+                for n in ngrams:
+                    self.tables[(ptype, bucket, field, n)].update(iter_ngrams(tokens, n))
+
+    def merge(self, other: "TermCounts") -> None:
+        for key, counter in other.tables.items():
+            self.tables[key].update(counter)
+        self.rows.update(other.rows)
+
+    def ptypes(self) -> List[str]:
+        return sorted({p for p, _ in self.rows})
+
+    def buckets(self) -> List[str]:
+        return sorted({b for _, b in self.rows})
+
+    def select(
+        self,
+        ptype: Optional[str] = None,
+        buckets: Optional[Iterable[str]] = None,
+        fields: Optional[Iterable[str]] = None,
+        n: int = 1,
+    ) -> Tuple[Counter, int]:
+        """Sum the matching shards; ``None`` means "any". Returns (counts, rows)."""
+        bucket_set = set(buckets) if buckets is not None else None
+        field_set = set(fields) if fields is not None else None
+        total: Counter = Counter()
+        for (p, b, f, k), counter in self.tables.items():
+            if k != n or (ptype is not None and p != ptype):
+                continue
+            if (bucket_set is not None and b not in bucket_set) or (field_set is not None and f not in field_set):
+                continue
+            total.update(counter)
+        rows = sum(
+            c for (p, b), c in self.rows.items()
+            if (ptype is None or p == ptype) and (bucket_set is None or b in bucket_set)
+        )
+        return total, rows
+
+    def save(self, path: str, append: bool = False) -> None:
+        """Persist counts; with ``append`` they are added to those already at ``path``."""
+        ensure_dir(os.path.dirname(path))
+        if not append and os.path.exists(path):
+            os.remove(path)
+        conn = sqlite3.connect(path)
+        try:
+            with conn:
+                _create_tables(conn)
+                conn.executemany(
+                    "INSERT INTO counts VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(ptype, bucket, field, n, term) DO UPDATE SET count = count + excluded.count",
+                    ((p, b, f, n, term, c) for (p, b, f, n), counter in self.tables.items() for term, c in counter.items()),
+                )
+                conn.executemany(
+                    "INSERT INTO rows VALUES (?, ?, ?) "
+                    "ON CONFLICT(ptype, bucket) DO UPDATE SET count = count + excluded.count",
+                    ((p, b, c) for (p, b), c in self.rows.items()),
+                )
+        finally:
+            conn.close()
+
+    @classmethod
+    def load(cls, path: str) -> "TermCounts":
+        out = cls()
+        conn = sqlite3.connect(path)
+        try:
+            for p, b, f, n, term, c in conn.execute("SELECT ptype, bucket, field, n, term, count FROM counts"):
+                out.tables[(p, b, f, int(n))][term] = int(c)
+            for p, b, c in conn.execute("SELECT ptype, bucket, count FROM rows"):
+                out.rows[(p, b)] = int(c)
+        finally:
+            conn.close()
+        return out
+
+
+def _create_tables(conn: sqlite3.Connection) -> None:
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS counts (
+            ptype TEXT, bucket TEXT, field TEXT, n INTEGER, term TEXT, count INTEGER,
+            PRIMARY KEY (ptype, bucket, field, n, term)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS rows (
+            ptype TEXT, bucket TEXT, count INTEGER, PRIMARY KEY (ptype, bucket)
+        ) WITHOUT ROWID;
+        """
+    )
+
+
+def _count_chunk(df: pd.DataFrame, kwargs: Dict) -> TermCounts:
+    counts = TermCounts()
+    counts.add_frame(df, **kwargs)
+    return counts
+
+
+def count_csv(path: str, chunksize: int = 50_000, workers: int = 1, **kwargs: Any) -> TermCounts:
+    """Stream ``path`` once and count every shard, optionally across processes.
+
+    At most ``2 * workers`` chunks are in flight, so memory stays bounded by
+    the chunk size and the number of distinct terms.
+    """
+    total = TermCounts()
+    if workers <= 1:
+        for chunk in iter_csv_chunks(path, chunksize):
+            total.add_frame(chunk, **kwargs)
+        return total
+
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in iter_csv_chunks(path, chunksize):
+            pending.append(pool.submit(_count_chunk, chunk, kwargs))
+            if len(pending) >= 2 * workers:
+                total.merge(pending.popleft().result())
+        while pending:
+            total.merge(pending.popleft().result())
+    return total
+
+
+def cached_counts(path: str, cache_dir: str = "data/cache", chunksize: int = 50_000, workers: int = 1, **kwargs: Any) -> TermCounts:
+    """Return counts for ``path``, reusing a table keyed by dataset hash and counting spec."""
+    spec = json.dumps(kwargs, sort_keys=True, default=list)
+    spec_hash = hashlib.blake2b(spec.encode("utf-8"), digest_size=6).hexdigest()
+    cache_path = os.path.join(cache_dir, f"termcounts-{file_digest(path)}-{spec_hash}.sqlite")
+    if os.path.exists(cache_path):
+        return TermCounts.load(cache_path)
+    counts = count_csv(path, chunksize=chunksize, workers=workers, **kwargs)
+    counts.save(cache_path)
+    return counts
@@ -1,7 +1,14 @@
 import re
-from typing import List
+from functools import lru_cache
+from typing import FrozenSet, List
 
-from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+@lru_cache(maxsize=1)
+def stop_words() -> FrozenSet[str]:
+    # scikit-learn's list, imported on first use: importing sklearn costs about a second.
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+    return frozenset(ENGLISH_STOP_WORDS)
 
 
 def normalize_text(text: str) -> str:
@@ -15,7 +22,8 @@ def normalize_text(text: str) -> str:
 
 
 def remove_stopwords(tokens: List[str]) -> List[str]:
-    return [t for t in tokens if t not in ENGLISH_STOP_WORDS and len(t) > 1]
+    words = stop_words()
+    return [t for t in tokens if t not in words and len(t) > 1]
 
 
 def tokenize(text: str) -> List[str]:
@@ -0,0 +1,244 @@
+"""Streaming TF-IDF: mergeable document-frequency stores and chunked transforms.
+
+The exact path reproduces ``TfidfVectorizer(ngram_range, min_df)`` (smooth
+idf, l2 norm) while keeping only the document frequencies in memory; the
+hashing path trades exact vocabulary for a fixed ``n_features`` footprint.
+scipy and scikit-learn are imported on first use.
+"""
+
+import json
+import os
+import sqlite3
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.utils.io import ensure_dir
+
+if TYPE_CHECKING:
+    from scipy import sparse
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+NgramRange = Tuple[int, int]
+
+
+def build_analyzer(ngram_range: NgramRange = (1, 2)) -> Callable[[str], List[str]]:
+    """Analyzer identical to the one ``TfidfVectorizer`` builds by default."""
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    analyzer: Callable[[str], List[str]] = CountVectorizer(ngram_range=ngram_range).build_analyzer()
+    return analyzer
+
+
+def hashing_vectorizer(n_features: int, ngram_range: NgramRange = (1, 2)) -> "HashingVectorizer":
+    """Raw-count hashing vectorizer whose columns line up with ``HashedDocFreqStore``."""
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    return HashingVectorizer(ngram_range=ngram_range, n_features=n_features, alternate_sign=False, norm=None)
+
+
+def smooth_idf(df: np.ndarray, n_docs: int) -> np.ndarray:
+    return np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+
+
+class DocFreqStore:
+    """SQLite-backed term -> document frequency table.
+
+    Batches are recorded by id so re-applying the same crawl batch is a no-op,
+    and two stores built on different workers can be merged by addition.
+    """
+
+    def __init__(self, path: str) -> None:
+        ensure_dir(os.path.dirname(path))
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS df (term TEXT PRIMARY KEY, df INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS batches (id TEXT PRIMARY KEY, n_docs INTEGER NOT NULL);
+            """
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @property
+    def n_docs(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(n_docs), 0) FROM batches").fetchone()
+        return int(row[0])
+
+    def has_batch(self, batch_id: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM batches WHERE id = ?", (batch_id,)).fetchone() is not None
+
+    def _add_counts(self, counts: Iterable[Tuple[str, int]]) -> None:
+        self._conn.executemany(
+            "INSERT INTO df (term, df) VALUES (?, ?) ON CONFLICT(term) DO UPDATE SET df = df + excluded.df",
+            counts,
+        )
+
+    def update(self, batch_id: str, docs: Iterable[str], analyzer: Callable[[str], List[str]]) -> int:
+        """Add document frequencies for one batch; return the docs counted (0 if already applied)."""
+        if self.has_batch(batch_id):
+            return 0
+        counts: Counter = Counter()
+        n_docs = 0
+        for doc in docs:
+            counts.update(set(analyzer(doc)))
+            n_docs += 1
+        with self._conn:
+            self._add_counts(counts.items())
+            self._conn.execute("INSERT INTO batches (id, n_docs) VALUES (?, ?)", (batch_id, n_docs))
+        return n_docs
+
+    def merge(self, other: "DocFreqStore") -> None:
+        """Fold another store's batches into this one, skipping batches already present."""
+        with self._conn:
+            for batch_id, n_docs in other._conn.execute("SELECT id, n_docs FROM batches"):
+                if self.has_batch(batch_id):
+                    raise ValueError(f"Batch {batch_id!r} exists in both stores; cannot merge without double counting")
+                self._conn.execute("INSERT INTO batches (id, n_docs) VALUES (?, ?)", (batch_id, n_docs))
+            self._add_counts(other._conn.execute("SELECT term, df FROM df"))
+
+    def vocabulary(self, min_df: int = 1) -> Tuple[List[str], np.ndarray]:
+        """Return sorted terms with ``df >= min_df`` and their document frequencies."""
+        rows = self._conn.execute("SELECT term, df FROM df WHERE df >= ? ORDER BY term", (min_df,)).fetchall()
+        terms = [t for t, _ in rows]
+        return terms, np.fromiter((d for _, d in rows), dtype=np.float64, count=len(rows))
+
+
+class HashedDocFreqStore:
+    """Fixed-size document frequency array over ``HashingVectorizer`` buckets."""
+
+    def __init__(self, path: str, n_features: int = 2**20) -> None:
+        self.path = path
+        self.n_features = n_features
+        self.df = np.zeros(n_features, dtype=np.int64)
+        self.batches: Dict[str, int] = {}
+        if os.path.exists(path):
+            with np.load(path) as data:
+                self.df = data["df"]
+                self.n_features = int(self.df.shape[0])
+                self.batches = json.loads(str(data["batches"]))
+
+    @property
+    def n_docs(self) -> int:
+        return sum(self.batches.values())
+
+    def has_batch(self, batch_id: str) -> bool:
+        return batch_id in self.batches
+
+    def update_counts(self, batch_id: str, counts: "sparse.csr_matrix") -> None:
+        """Add the document frequencies of one batch of hashed count rows."""
+        self.df += np.bincount(counts.indices, minlength=self.n_features)
+        self.batches[batch_id] = self.batches.get(batch_id, 0) + counts.shape[0]
+
+    def merge(self, other: "HashedDocFreqStore") -> None:
+        if other.n_features != self.n_features:
+            raise ValueError("Cannot merge hashed stores with different n_features")
+        overlap = set(self.batches) & set(other.batches)
+        if overlap:
+            raise ValueError(f"Batches {sorted(overlap)} exist in both stores; cannot merge without double counting")
+        self.df += other.df
+        self.batches.update(other.batches)
+
+    def save(self) -> None:
+        ensure_dir(os.path.dirname(self.path))
+        with open(self.path, "wb") as f:
+            np.savez(f, df=self.df, batches=np.array(json.dumps(self.batches)))
+
+
+class StreamingTfidf:
+    """Transform document chunks with a vocabulary and idf taken from a store."""
+
+    def __init__(
+        self,
+        idf: np.ndarray,
+        ngram_range: NgramRange = (1, 2),
+        terms: Optional[List[str]] = None,
+        n_features: Optional[int] = None,
+    ) -> None:
+        from scipy import sparse
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        self.idf = idf
+        self.terms = terms
+        self.counter: Union[CountVectorizer, HashingVectorizer]
+        if terms is not None:
+            self.counter = CountVectorizer(ngram_range=ngram_range, vocabulary=terms)
+        else:
+            self.counter = hashing_vectorizer(n_features or idf.shape[0], ngram_range)
+        self._idf_diag = sparse.diags(idf, format="csr")
+
+    @classmethod
+    def from_store(cls, store: DocFreqStore, min_df: int = 2, ngram_range: NgramRange = (1, 2)) -> "StreamingTfidf":
+        terms, df = store.vocabulary(min_df=min_df)
+        return cls(smooth_idf(df, store.n_docs), ngram_range=ngram_range, terms=terms)
+
+    @classmethod
+    def from_hashed_store(
+        cls, store: HashedDocFreqStore, min_df: int = 2, ngram_range: NgramRange = (1, 2)
+    ) -> "StreamingTfidf":
+        # Buckets below min_df get a zero weight, mirroring how the exact path drops them.
+        idf = np.where(store.df >= min_df, smooth_idf(store.df, store.n_docs), 0.0)
+        return cls(idf, ngram_range=ngram_range, n_features=store.n_features)
+
+    def counts(self, docs: List[str]) -> "sparse.csr_matrix":
+        from scipy import sparse
+
+        return sparse.csr_matrix(self.counter.transform(docs))
+
+    def transform(self, docs: List[str]) -> "sparse.csr_matrix":
+        from sklearn.preprocessing import normalize
+
+        X = self.counts(docs) @ self._idf_diag
+        X.eliminate_zeros()
+        return normalize(X, norm="l2", copy=False)
+
+
+def save_chunked_matrix(prefix: str, chunks: Iterable["sparse.csr_matrix"]) -> Iterator["sparse.csr_matrix"]:
+    """Save each chunk as ``{prefix}.partNNNNN.npz`` and pass it through."""
+    from scipy import sparse
+
+    ensure_dir(os.path.dirname(prefix))
+    for i, chunk in enumerate(chunks):
+        sparse.save_npz(f"{prefix}.part{i:05d}.npz", chunk)
+        yield chunk
+
+
+def column_maxima(chunks: Iterable["sparse.spmatrix"]) -> np.ndarray:
+    """Per-column maximum over row chunks without stacking them."""
+    best: Optional[np.ndarray] = None
+    for chunk in chunks:
+        m = np.asarray(chunk.max(axis=0).todense()).ravel()
+        best = m if best is None else np.maximum(best, m)
+    return best if best is not None else np.zeros(0)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` largest scores, highest first, via ``argpartition``."""
+    k = min(k, scores.size)
+    if k <= 0:
+        return np.zeros(0, dtype=np.intp)
+    idx = np.argpartition(-scores, k - 1)[:k]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def hashed_bucket(term: str, n_features: int) -> int:
+    """Bucket ``HashingVectorizer`` assigns to ``term``."""
+    from sklearn.utils import murmurhash3_32
+
+    return abs(int(murmurhash3_32(term, positive=False))) % n_features
+
+
+def resolve_hashed_terms(
+    docs: Iterable[str], analyzer: Callable[[str], List[str]], buckets: Iterable[int], n_features: int
+) -> Dict[int, str]:
+    """Map hashed buckets back to a representative term (the most frequent one seen)."""
+    seen: Dict[int, Counter] = {int(b): Counter() for b in buckets}
+    for doc in docs:
+        for term in analyzer(doc):
+            bucket = hashed_bucket(term, n_features)
+            if bucket in seen:
+                seen[bucket][term] += 1
+    return {b: c.most_common(1)[0][0] for b, c in seen.items() if c}
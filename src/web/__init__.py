@@ -0,0 +1,5 @@
+# web package initializer
+
+from src.web.app import create_app
+
+__all__ = ["create_app"]
@@ -0,0 +1,263 @@
+"""Flask application factory.
+
+``create_app`` builds the :class:`~src.web.service.ListingService` and
+registers the routes. With ``start=True`` the artifacts load in a background
+thread, so the server binds immediately and generation requests wait for the
+warm-up (``flask.warmup_timeout``); with ``start=False`` they load before the
+factory returns. Development uses ``days/day14_flask_app.py``; production
+uses ``days/serve.py``, which calls the factory once in the master process
+and forks workers from it.
+"""
+
+import json
+import logging
+import os
+import time
+from logging.handlers import RotatingFileHandler
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, cast
+
+from flask import Flask, Response, current_app, g, jsonify, make_response, render_template, request, stream_with_context
+from flask_wtf.csrf import CSRFProtect
+
+from src.config import AppConfig, load_config
+from src.utils.batch_api import BatchError, ndjson_line, parse_items
+from src.utils.logger import get_logger, setup_logging
+from src.utils.metrics import Labels, MetricsRegistry, RequestTimer, bind_timer, current_timer, span
+from src.web.page import HTML
+from src.web.service import PROJECT_ROOT, VALID_PTYPES, ListingService
+
+if TYPE_CHECKING:
+    from flask.typing import ResponseReturnValue
+    from werkzeug.exceptions import HTTPException
+
+logger = get_logger(__name__)
+slow_logger = get_logger("src.web.slow")
+
+# Routes whose POST requests are timed stage by stage.
+TIMED_ENDPOINTS = {"index": "form", "api_generate": "api"}
+
+
+def get_service() -> ListingService:
+    return cast("ListingService", current_app.extensions["listing"])
+
+
+def _slow_log_handler(path: str) -> None:
+    """Send slow-request records (one JSON object per line) to ``path`` instead of the app log."""
+    path = os.path.abspath(path)
+    if any(getattr(h, "baseFilename", None) == path for h in slow_logger.handlers):
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handler = RotatingFileHandler(path, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    slow_logger.addHandler(handler)
+    slow_logger.propagate = False
+
+
+def _cache_stats(service: ListingService) -> Dict[str, Any]:
+    return service.cache.stats() if service.cache is not None else {}
+
+
+def create_app(cfg: Optional[AppConfig] = None, root: str = PROJECT_ROOT, start: bool = True) -> Flask:
+    """Build the app; ``start=False`` warms up synchronously and leaves background threads to the caller (pre-fork servers)."""
+    cfg = cfg or load_config()
+    setup_logging(level=cfg.logging.level, log_file=cfg.logging.file)
+    service = ListingService(cfg, root=root, warm=not start)
+    if start:
+        service.start()
+
+    app = Flask(__name__)
+    app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", cfg.flask.secret_key)
+    app.config["MAX_CONTENT_LENGTH"] = cfg.flask.max_content_length
+    app.extensions["listing"] = service
+    csrf = CSRFProtect(app)
+
+    metrics = MetricsRegistry()
+    app.extensions["metrics"] = metrics
+
+    def cache_lookups() -> Dict[Labels, float]:
+        stats = _cache_stats(service)
+        return {(("result", k),): float(stats.get(k, 0)) for k in ("hits", "shared_hits", "misses")}
+
+    def cache_evictions() -> Dict[Labels, float]:
+        return {(): float(_cache_stats(service).get("evictions", 0))}
+
+    def cache_entries() -> Dict[Labels, float]:
+        return {(): float(_cache_stats(service).get("size", 0))}
+
+    def ready() -> Dict[Labels, float]:
+        return {(): float(service.status()["ready"])}
+
+    metrics.collector("listing_cache_lookups_total", "counter", "Generation cache lookups by result.", cache_lookups)
+    metrics.collector("listing_cache_evictions_total", "counter", "Generation cache LRU evictions.", cache_evictions)
+    metrics.collector("listing_cache_entries", "gauge", "Entries in the in-process generation cache.", cache_entries)
+    metrics.collector("listing_ready", "gauge", "1 once artifacts are loaded.", ready)
+    if cfg.metrics.slow_log_file:
+        _slow_log_handler(cfg.metrics.slow_log_file)
+
+    @app.before_request
+    def start_timer() -> None:
+        route = TIMED_ENDPOINTS.get(request.endpoint or "")
+        if cfg.metrics.enabled and route and request.method == "POST":
+            timer = RequestTimer(route)
+            timer.labels["ptype"] = "unknown"
+            g.request_timer = timer
+            bind_timer(timer)
+
+    @app.after_request
+    def observe_timer(response: Response) -> Response:
+        # Streamed (NDJSON) responses are timed up to the first byte.
+        timer = g.pop("request_timer", None)
+        if timer is not None:
+            bind_timer(None)
+            metrics.observe(timer)
+            total_ms = timer.finish() * 1000.0
+            if 0 < cfg.metrics.slow_request_ms <= total_ms:
+                slow_logger.warning(json.dumps({
+                    "route": timer.route,
+                    **timer.labels,
+                    "status": response.status_code,
+                    "total_ms": round(total_ms, 3),
+                    "stages_ms": timer.breakdown_ms(),
+                }))
+        return response
+
+    @app.teardown_request
+    def unbind_timer(exc: Optional[BaseException]) -> None:
+        bind_timer(None)
+
+    # Compiled once; render_template_string would re-parse the page on every request.
+    page = app.jinja_env.from_string(HTML)
+
+    def not_ready(svc: ListingService) -> Response:
+        if svc.warm_up_error is not None:
+            response = jsonify({"error": "Service failed to load its artifacts"})
+        else:
+            response = jsonify({"error": "Service is warming up"})
+            response.headers["Retry-After"] = "1"
+        response.status_code = 503
+        return response
+
+    @app.route("/", methods=["GET", "POST"])
+    def index() -> "ResponseReturnValue":
+        svc = get_service()
+        result = None
+        title_suggestions = []
+        tag_suggestions = []
+        description_suggestion = ""
+        best_title = ""
+        generated = False
+        cache_status = None
+        if request.method == "POST":
+            if not svc.wait_ready(cfg.flask.warmup_timeout):
+                return not_ready(svc)
+            title = request.form.get("title", "").strip()[:140]
+            ptype = request.form.get("ptype", "metal_wall_art")
+            if ptype not in VALID_PTYPES:
+                ptype = "metal_wall_art"
+            timer = current_timer()
+            if timer is not None:
+                timer.labels["ptype"] = ptype
+            # Fiyat kullanıcıdan istenmiyor; veri seti medyanını kullan (generate içinde)
+            model_version, active = svc.active_model(request.remote_addr or "")
+            parts, hit = svc.generate(title, ptype, active, model_version)
+            result = None if parts["score"] is None else int(parts["score"] > 0.5)
+            logger.debug("Generated with model %s (cache %s)", model_version, "hit" if hit else "miss")
+            tag_suggestions = parts["tags"]
+            title_suggestions = parts["title_suggestions"]
+            best_title = parts["title"]
+            description_suggestion = parts["description"]
+            generated = True
+            cache_status = "HIT" if hit else "MISS"
+        with span("render"):
+            response = make_response(render_template(
+                page,
+                result=result,
+                title_suggestions=title_suggestions,
+                tag_suggestions=tag_suggestions,
+                description_suggestion=description_suggestion,
+                best_title=best_title,
+                generated=generated,
+            ))
+        if cache_status and svc.cache is not None:
+            response.headers["X-Cache"] = cache_status
+        return response
+
+    def _wants_ndjson() -> bool:
+        if request.args.get("stream", "").lower() in ("1", "true", "yes"):
+            return True
+        return request.accept_mimetypes.best == "application/x-ndjson"
+
+    @app.route("/api/v1/generate", methods=["POST"])
+    @csrf.exempt
+    def api_generate() -> "ResponseReturnValue":
+        """Batch generation: JSON array of ``{title, ptype}`` in, one result per item out.
+
+        ``Accept: application/x-ndjson`` (or ``?stream=1``) streams one JSON line
+        per item as chunks are scored, followed by a ``summary`` line.
+        """
+        svc = get_service()
+        if not svc.wait_ready(cfg.flask.warmup_timeout):
+            return not_ready(svc)
+        try:
+            with span("parse"):
+                items, errors = parse_items(request.get_json(silent=True), VALID_PTYPES, max_items=cfg.flask.api_max_items)
+        except BatchError as e:
+            return jsonify({"error": str(e)}), e.status
+        timer = current_timer()
+        if timer is not None:
+            ptypes = {it.ptype for it in items}
+            timer.labels["ptype"] = ptypes.pop() if len(ptypes) == 1 else "mixed"
+        version, active = svc.active_model(request.remote_addr or "")
+        started = time.perf_counter()
+        results = svc.generate_batch(items, active, cfg.flask.api_chunk_size, model_version=version)
+
+        def summary() -> Dict[str, Any]:
+            return {
+                "model_version": version,
+                "items": len(items),
+                "errors": len(errors),
+                "total_ms": round((time.perf_counter() - started) * 1000.0, 3),
+            }
+
+        if _wants_ndjson():
+            def lines() -> Iterator[bytes]:
+                for err in errors:
+                    yield ndjson_line(err)
+                for result in results:
+                    yield ndjson_line(result)
+                yield ndjson_line({"summary": summary()})
+
+            return Response(stream_with_context(lines()), mimetype="application/x-ndjson")
+        out = list(results)
+        with span("render"):
+            return jsonify({"results": out, "errors": errors, "summary": summary()})
+
+    @app.route("/healthz")
+    def healthz() -> Response:
+        """Liveness: the process is up and serving requests."""
+        return jsonify({"status": "ok"})
+
+    @app.route("/readyz")
+    def readyz() -> "ResponseReturnValue":
+        """Readiness: artifacts are loaded (and the registry model, when one is current)."""
+        status = get_service().status()
+        return jsonify(status), 200 if status["ready"] else 503
+
+    @app.route("/metrics")
+    def metrics_endpoint() -> Response:
+        """Request/stage latency histograms and cache counters for this process (Prometheus text format)."""
+        return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+    @app.route("/cache/stats")
+    def cache_stats() -> Response:
+        """Generation cache hit/miss counters for this process."""
+        cache = get_service().cache
+        return jsonify(cache.stats() if cache is not None else {"enabled": False})
+
+    @app.errorhandler(413)
+    def too_large(e: "HTTPException") -> "ResponseReturnValue":
+        if request.path.startswith("/api/"):
+            return jsonify({"error": f"Request body exceeds {app.config['MAX_CONTENT_LENGTH']} bytes"}), 413
+        return e
+
+    return app
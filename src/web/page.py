@@ -0,0 +1,127 @@
+"""Single-page form served at ``/``."""
+
+HTML = """
+<!doctype html>
+<html lang="tr">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Etsy Ürün Oluşturma</title>
+  <style>
+    :root { --bg:#0f172a; --card:#111827; --text:#e5e7eb; --muted:#94a3b8; --primary:#22c55e; --border:#1f2937; }
+    *{ box-sizing:border-box }
+    body { font-family: -apple-system, system-ui, Segoe UI, Roboto, sans-serif; margin:0; background:var(--bg); color:var(--text); }
+    .container { max-width:980px; padding:24px; margin:0 auto; }
+    .header { display:flex; align-items:center; justify-content:space-between; gap:16px; margin-bottom:16px; }
+    .title { font-size:20px; font-weight:700; }
+    .muted { color:var(--muted); font-size:14px; }
+    .grid { display:grid; grid-template-columns: 1fr; gap:16px; }
+    @media(min-width:900px){ .grid{ grid-template-columns: 380px 1fr; } }
+    label { display:block; margin:8px 0 6px; font-weight:600; font-size:14px; }
+    input, textarea, select { width:100%; padding:10px 12px; border-radius:10px; border:1px solid var(--border); background:#0b1220; color:var(--text); outline:none; }
+    input::placeholder, textarea::placeholder { color:#64748b }
+    textarea { resize: vertical; min-height:120px; }
+    .btn { display:inline-flex; align-items:center; gap:8px; padding:10px 14px; border-radius:10px; border:1px solid #16a34a; background:var(--primary); color:#03281a; font-weight:700; cursor:pointer; }
+    .btn:disabled{ opacity:.6; cursor:not-allowed }
+    .card { border:1px solid var(--border); background:var(--card); padding:16px; border-radius:14px; }
+    .row { display:flex; align-items:center; gap:8px; }
+    .copy { border:1px solid var(--border); background:#0b1220; color:var(--text); padding:6px 10px; border-radius:8px; cursor:pointer; }
+    .hint { font-size:12px; color:var(--muted); margin-top:4px; }
+    .toast { position:fixed; right:16px; bottom:16px; background:#1e293b; color:#e2e8f0; padding:10px 14px; border-radius:10px; border:1px solid var(--border); opacity:0; transform:translateY(8px); transition:all .2s ease; }
+    .toast.show { opacity:1; transform:translateY(0); }
+  </style>
+</head>
+<body>
+  <div class="container">
+    <div class="header">
+      <div>
+        <div class="title">Etsy Ürün Oluşturma</div>
+        <div class="muted">Başlık ve tür gir; sistem Title / Description / Tags üretsin.</div>
+      </div>
+    </div>
+
+    <div class="grid">
+      <form method="post" class="card" id="genForm" onsubmit="return startGen()">
+        <input type="hidden" name="csrf_token" value="{{ csrf_token() }}" />
+        <div>
+          <label>Başlık</label>
+          <input name="title" placeholder="Örn: Metal Tree of Life Wall Art" maxlength="140" required />
+          <div class="hint">Özgün anahtar kelimeleri eklemen önerilir.</div>
+        </div>
+
+        <div style="margin-top:12px">
+          <label>Tür (kategori)</label>
+          <select name="ptype" required>
+            <option value="metal_wall_art">Metal Wall Art</option>
+            <option value="poster">Poster</option>
+            <option value="jewelry">Jewelry</option>
+            <option value="bag">Bag</option>
+            <option value="canvas">Canvas</option>
+            <option value="mug">Mug</option>
+            <option value="tshirt">T‑Shirt</option>
+            <option value="sticker">Sticker</option>
+          </select>
+        </div>
+
+        <div style="margin-top:16px">
+          <button class="btn" type="submit">
+            <span id="spinner" style="display:none">⏳</span>
+            Önerileri Oluştur
+          </button>
+        </div>
+      </form>
+
+      {% if generated %}
+      <div class="card">
+        <div class="row">
+          <div style="font-weight:700">Title</div>
+          <button class="copy" type="button" onclick="copyText('titleField')">Kopyala</button>
+        </div>
+        <input id="titleField" value="{{ best_title }}" />
+
+        <div class="row" style="margin-top:12px">
+          <div style="font-weight:700">Description</div>
+          <button class="copy" type="button" onclick="copyText('descField')">Kopyala</button>
+        </div>
+        <textarea id="descField" rows="8" placeholder="Ürün açıklaması">{{ description_suggestion }}</textarea>
+
+        <div class="row" style="margin-top:12px">
+          <div style="font-weight:700">Tags</div>
+          <button class="copy" type="button" onclick="copyText('tagsField')">Kopyala</button>
+        </div>
+        <input id="tagsField" value="{{ ", ".join(tag_suggestions) }}" />
+
+        {% if title_suggestions %}
+          <div class="hint" style="margin-top:10px">Diğer başlık seçenekleri: {{ "; ".join(title_suggestions) }}</div>
+        {% endif %}
+      </div>
+      {% endif %}
+    </div>
+
+    <div id="toast" class="toast">Kopyalandı</div>
+  </div>
+
+  <script>
+    function startGen(){
+      const btn = document.querySelector('.btn');
+      const sp = document.getElementById('spinner');
+      if(btn && sp){ btn.disabled = true; sp.style.display = 'inline-block'; }
+      return true;
+    }
+    function showToast(msg){
+      const t = document.getElementById('toast');
+      if(!t) return;
+      t.textContent = msg || 'Kopyalandı';
+      t.classList.add('show');
+      setTimeout(()=> t.classList.remove('show'), 1200);
+    }
+    function copyText(id){
+      const el = document.getElementById(id);
+      if(!el) return;
+      const val = el.value || el.innerText || '';
+      navigator.clipboard && navigator.clipboard.writeText(val).then(()=>showToast('Kopyalandı'));
+    }
+  </script>
+</body>
+</html>
+"""
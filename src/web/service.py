@@ -0,0 +1,405 @@
+"""Artifacts and generation logic behind the web app.
+
+:class:`ListingService` owns everything the routes need: the model (from
+the registry or the fixed artifact paths), the stats snapshot, the tag
+index, the title ranker and the generation cache.
+
+Loading the artifacts (:meth:`ListingService.warm_up`) runs either in the
+constructor or, with ``warm=False``, in a background thread started by
+:meth:`ListingService.start`; requests wait on :meth:`wait_ready` meanwhile,
+so a server can accept connections before the model is unpickled. A
+pre-forking server warms up in the master process and starts the polling
+threads in each worker after the fork.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.config import AppConfig
+from src.models.compiled import CompiledScorer
+from src.models.pipeline import ListingPipeline, NumericTransformer, load_pipeline, read_manifest
+from src.models.registry import ModelHolder, ModelRegistry
+from src.models.titles import TitleRanker, enforce_title_limit
+from src.utils.batch_api import BatchItem, chunked, score_titles
+from src.utils.erank import get_keyword_store
+from src.utils.gen_cache import GenerationCache, cache_key, epoch_of
+from src.utils.logger import get_logger
+from src.utils.metrics import span
+from src.utils.stats import StatsSnapshot
+from src.utils.tags import TagIndex
+
+logger = get_logger(__name__)
+
+VALID_PTYPES = ("metal_wall_art", "poster", "jewelry", "bag", "canvas", "mug", "tshirt", "sticker")
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+
+
+def build_description_suggestion(title: str, price: float, tags: List[str], ptype: str) -> str:
+    core = ", ".join(tags[:6])
+    # Base description without any price info
+    desc = (
+        f"Discover our {title.strip()} {ptype.replace('_',' ')} — crafted with high-quality materials for a timeless look. "
+        f"Perfect for living rooms, offices, and gift occasions. "
+        f"Style highlights: {core}. Handmade with care. "
+        f"Each piece is checked for quality and carefully packaged to arrive safely. "
+        f"Choose the size that fits your space and elevate your decor."
+    )
+    # Ensure minimum length of 200 characters
+    filler = (
+        " Designed to be timeless and versatile, it blends with modern and minimalist interiors, "
+        "making it a thoughtful gift for loved ones."
+    )
+    while len(desc) < 200:
+        desc += filler
+    return desc[: max(200, len(desc))]
+
+
+class ListingService:
+    def __init__(self, cfg: AppConfig, root: str = PROJECT_ROOT, warm: bool = True) -> None:
+        self.cfg = cfg
+        self.root = root
+        self.registry = ModelRegistry(self.path(cfg.models.registry_dir))
+        self.model_holder = ModelHolder(self.registry, poll_interval=cfg.models.reload_interval)
+        # Built by day04_clean_data.py; rebuilt in the background if day04_clean.csv is newer.
+        self.stats = StatsSnapshot(
+            self.path("data", "processed", "day04_stats.json"), source=self.path("data", "processed", "day04_clean.csv")
+        )
+        self.erank_path = self.path(cfg.erank.keywords_path)
+        self._title_ranker: Tuple[Any, Optional[TitleRanker]] = (None, None)
+        self._tag_index: Tuple[Any, Optional[TagIndex]] = (None, None)
+        cache = cfg.cache
+        self.cache: Optional[GenerationCache] = None
+        if cache.enabled:
+            shared = self.path(cache.shared_path) if cache.shared_path else None
+            self.cache = GenerationCache(cache.max_entries, cache.ttl, shared_path=shared)
+        self._started = False
+        self._ready = threading.Event()
+        self._warm_done = threading.Event()  # set after every attempt, failed or not
+        self._warm_error: Optional[BaseException] = None
+        self._warm_lock = threading.Lock()
+        self.model: Any = None
+        self.suggestions_pool: List[str] = []
+        self.top_term_scores: List[Tuple[str, float]] = []
+        self.top_terms: List[str] = []
+        if warm:
+            self.warm_up()
+
+    def path(self, *parts: str) -> str:
+        """Absolute path relative to the project root."""
+        return os.path.join(self.root, *parts)
+
+    # -- lifecycle --------------------------------------------------------
+    def warm_up(self) -> None:
+        """Load every artifact and build the indexes; idempotent."""
+        with self._warm_lock:
+            if self._ready.is_set():
+                return
+            started = time.perf_counter()
+            try:
+                self.model_holder.refresh()
+                self.model, self.suggestions_pool, self.top_term_scores = self.load_artifacts()
+                self.top_terms = [t for t, _ in self.top_term_scores]
+                self.tag_index()
+                self.title_ranker()
+                # One prediction pulls in the lazily imported scoring stack (pandas, scipy).
+                _, active = self.active_model("")
+                score_titles(active, ["warm up"], [self.median_price()])
+            except Exception as e:
+                self._warm_error = e
+                logger.exception("Warm-up failed")
+                raise
+            else:
+                self._warm_error = None
+                self._ready.set()
+                logger.info("Warm-up finished in %.2fs", time.perf_counter() - started)
+            finally:
+                self._warm_done.set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until warm-up has finished; False on timeout, and at once after a failed warm-up."""
+        return self._warm_done.wait(timeout) and self._ready.is_set()
+
+    @property
+    def warm_up_error(self) -> Optional[str]:
+        return None if self._warm_error is None else str(self._warm_error)
+
+    def start(self) -> "ListingService":
+        """Start background threads (warm-up if still pending, registry polling); call once per serving process."""
+        if not self._started:
+            self._started = True
+
+            def run() -> None:
+                try:
+                    self.warm_up()
+                except Exception:
+                    return
+                self.model_holder.start()
+
+            if self._ready.is_set():
+                run()
+            else:
+                threading.Thread(target=run, name="listing-warm-up", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.model_holder.stop()
+
+    def status(self) -> Dict[str, Any]:
+        """Readiness details for ``/readyz``."""
+        expects_registry = self.registry.current() is not None
+        version, active = self.active_model("")
+        ready = self._ready.is_set() and self._warm_error is None and (not expects_registry or self.model_holder.version is not None)
+        return {
+            "ready": ready,
+            "pid": os.getpid(),
+            "model_version": version,
+            "predictions": active is not None,
+            "stats_version": self.stats.version,
+            "warm_up_error": self.warm_up_error,
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+    # -- artifacts --------------------------------------------------------
+    def load_model(self) -> Any:
+        """Compiled scorer when it matches the current pipeline, else the memory-mapped
+        pipeline artifact, else the legacy model/vectorizer pair."""
+        models = self.cfg.models
+        manifest = read_manifest(self.path(models.pipeline_path))
+        try:
+            scorer = CompiledScorer.load(self.path(models.scorer_path))
+            if manifest is None or scorer.version == manifest.get("version"):
+                logger.info("Loaded compiled scorer %s", scorer.version)
+                return scorer
+            logger.warning("Compiled scorer %s is stale (pipeline %s); using the pipeline.", scorer.version, manifest.get("version"))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Could not load compiled scorer: %s", e)
+        try:
+            pipe = load_pipeline(self.path(models.pipeline_path))
+            logger.info("Loaded pipeline %s", pipe.version)
+            return pipe
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Could not load pipeline: %s. Trying legacy model files.", e)
+        try:
+            import joblib
+
+            clf = joblib.load(self.path("models", "day12_logreg.joblib"))
+            vec = joblib.load(self.path("models", "day12_vectorizer.joblib"))
+            if getattr(clf, "n_features_in_", None) != len(vec.vocabulary_) + 1:
+                logger.warning("Legacy model expects extra numeric features; train a pipeline artifact. Predictions will be disabled.")
+                return None
+            return ListingPipeline(vec, NumericTransformer(("price_value",)), clf)
+        except FileNotFoundError as e:
+            logger.warning("Model file not found: %s. Predictions will be disabled.", e)
+        except Exception as e:
+            logger.warning("Could not load model: %s. Predictions will be disabled.", e)
+        return None
+
+    def load_artifacts(self) -> Tuple[Any, List[str], List[Tuple[str, float]]]:
+        # Registry-managed models are served through model_holder; the fixed paths are the fallback.
+        model = self.load_model() if self.registry.current() is None else None
+
+        try:
+            with open(self.path("outputs", "day09_suggestions.txt"), "r", encoding="utf-8") as f:
+                suggestions = [line.strip() for line in f if line.strip()]
+        except FileNotFoundError:
+            suggestions = []
+
+        top_term_scores: List[Tuple[str, float]] = []
+        try:
+            with open(self.path("outputs", "day07_top_terms.json"), "r", encoding="utf-8") as f:
+                data = json.load(f)
+                top_term_scores = [(t, float(s)) for t, s in data.get("top_terms", [])]
+        except FileNotFoundError:
+            pass
+
+        return model, suggestions, top_term_scores
+
+    def median_price(self, default_value: float = 0.0, ptype: Optional[str] = None) -> float:
+        """Median price (per ptype when known) from the in-memory stats snapshot."""
+        with span("price"):
+            return self.stats.median_price(ptype, default=default_value)
+
+    def active_model(self, key: str) -> Tuple[Optional[str], Any]:
+        """Registry model for this client (A/B aware), else the statically loaded one."""
+        version, active = self.model_holder.get(key)
+        if active is None:
+            return getattr(self.model, "version", None), self.model
+        return version, active
+
+    def _erank_rows(self) -> List[Tuple[str, int]]:
+        erank = self.cfg.erank
+        rows = get_keyword_store(self.erank_path).rows(limit=erank.max_keywords, min_volume=erank.min_volume)
+        return [(r["keyword"], int(r["volume"])) for r in rows]
+
+    def title_ranker(self) -> TitleRanker:
+        version = get_keyword_store(self.erank_path).version
+        built_for, ranker = self._title_ranker
+        if built_for != version or ranker is None:
+            ranker = TitleRanker(self.top_term_scores, self._erank_rows())
+            self._title_ranker = (version, ranker)
+        return ranker
+
+    def tag_index(self) -> TagIndex:
+        # Rebuilt when the eRank keywords or the stats snapshot change; suggestions are then lookups.
+        stamp = (get_keyword_store(self.erank_path).version, self.stats.version)
+        built_for, index = self._tag_index
+        if built_for != stamp or index is None:
+            by_ptype = self.stats.get().get("by_ptype", {})
+            index = TagIndex.build(
+                top_terms=self.top_term_scores,
+                erank=self._erank_rows(),
+                ptype_terms={p: by_ptype.get(p, {}).get("top_terms", []) for p in VALID_PTYPES},
+            )
+            self._tag_index = (stamp, index)
+        return index
+
+    # -- generation ---------------------------------------------------------
+    def build_title_suggestions(
+        self,
+        k: int = 5,
+        length: int = 6,
+        ptype: str = "metal_wall_art",
+        title: str = "",
+        active: Any = None,
+        price: float = 0.0,
+        budget_ms: Optional[float] = None,
+    ) -> List[str]:
+        """Best ``k`` of the titles sampled and scored within the budget (``flask.title_budget_ms``)."""
+        n = max(3, min(7, length))
+        budget = self.title_budget(budget_ms)
+        with span("title"):
+            ranked = self.title_ranker().suggest(
+                ptype, k=k, model=active, price=price, title=title, budget_ms=budget, length=(max(3, n - 2), n + 2)
+            )
+            return [c.title for c in ranked]
+
+    def build_tag_suggestions(self, limit: int = 13, ptype: str = "metal_wall_art", title: str = "") -> List[str]:
+        """Multi-word tags (max 13 letters) for ``ptype``, led by ones sharing words with ``title``."""
+        with span("tag"):
+            return self.tag_index().suggest(ptype, limit=limit, title=title)
+
+    def title_budget(self, budget_ms: Optional[float] = None) -> float:
+        """Title sampling budget in ms; ``None`` means the form's ``flask.title_budget_ms``."""
+        return self.cfg.flask.title_budget_ms if budget_ms is None else budget_ms
+
+    def cache_key(
+        self, title: str, ptype: str, model_version: Optional[str], budget_ms: Optional[float] = None
+    ) -> Optional[str]:
+        """Generation cache key, or None when caching is off.
+
+        The epoch covers everything a reload can change besides the per-request
+        model version (eRank keywords, stats snapshot, primary model), so a
+        reload invalidates the in-process tier. The title budget is part of
+        the key kind: the form and the API sample titles under different
+        budgets and must not serve each other's suggestions.
+        """
+        if self.cache is None:
+            return None
+        epoch = epoch_of(
+            get_keyword_store(self.erank_path).version,
+            self.stats.version,
+            self.model_holder.version,
+            getattr(self.model, "version", None),
+        )
+        self.cache.observe_epoch(epoch)
+        return cache_key(title, ptype, model_version, epoch, kind=f"listing@{self.title_budget(budget_ms):g}ms")
+
+    def compose_listing(
+        self, title: str, ptype: str, price: float, tags: List[str], active: Any = None, budget_ms: Optional[float] = None
+    ) -> Tuple[List[str], str, str]:
+        """``(title_suggestions, best_title, description)`` for one input title."""
+        title_suggestions = self.build_title_suggestions(
+            k=5, length=6, ptype=ptype, title=title, active=active, price=price, budget_ms=budget_ms
+        )
+        best_title, description = self.finish_listing(title, ptype, price, tags, title_suggestions)
+        return title_suggestions, best_title, description
+
+    def finish_listing(self, title: str, ptype: str, price: float, tags: List[str], title_suggestions: List[str]) -> Tuple[str, str]:
+        """``(best_title, description)``; cheap, so it runs per request with the caller's exact title."""
+        with span("description"):
+            # If user-provided title has fewer than 2 words, prefer generated
+            user_words = len([w for w in (title or "").split() if w.strip()])
+            candidate = (title_suggestions[0] if (user_words < 2 and title_suggestions) else (title or title_suggestions[0]))
+            best_title = enforce_title_limit(candidate or "Metal Wall Art", limit=140)
+            description = build_description_suggestion(title=best_title, price=price, tags=tags, ptype=ptype)
+            return best_title, description
+
+    def generate(
+        self, title: str, ptype: str, active: Any, model_version: Optional[str], budget_ms: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Listing parts for one title, from the generation cache when possible: ``(parts, hit)``."""
+        price = self.median_price(default_value=0.0, ptype=ptype)
+        cache = self.cache
+        with span("cache"):
+            key = self.cache_key(title, ptype, model_version, budget_ms)
+            parts = cache.get(key) if cache is not None and key is not None else None
+        hit = parts is not None
+        if parts is None:
+            score = score_titles(active, [title], [price])[0][0]
+            parts = self._generate_parts(title, ptype, price, score, active, budget_ms)
+            if cache is not None and key is not None:
+                with span("cache"):
+                    cache.set(key, parts)
+        best_title, description = self.finish_listing(title, ptype, price, parts["tags"], parts["title_suggestions"])
+        return {**parts, "title": best_title, "description": description}, hit
+
+    def _generate_parts(
+        self, title: str, ptype: str, price: float, score: Optional[float], active: Any, budget_ms: Optional[float]
+    ) -> Dict[str, Any]:
+        """The cacheable (normalized-title dependent) part of a listing."""
+        tags = self.build_tag_suggestions(limit=13, ptype=ptype, title=title)
+        title_suggestions = self.build_title_suggestions(
+            k=5, length=6, ptype=ptype, title=title, active=active, price=price, budget_ms=budget_ms
+        )
+        return {"score": score, "tags": tags, "title_suggestions": title_suggestions}
+
+    def generate_batch(
+        self, items: Sequence[BatchItem], active: Any, chunk_size: int, model_version: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """One result per item; cache misses in a chunk are scored with a single model call."""
+        budget = self.cfg.flask.api_title_budget_ms
+        cache = self.cache
+        for chunk in chunked(items, chunk_size):
+            prices = [self.median_price(default_value=0.0, ptype=it.ptype) for it in chunk]
+            with span("cache"):
+                keys = [self.cache_key(it.title, it.ptype, model_version, budget) for it in chunk]
+                cached = [cache.get(k) if cache is not None and k is not None else None for k in keys]
+            misses = [i for i, parts in enumerate(cached) if parts is None]
+            scores, seconds = score_titles(active, [chunk[i].title for i in misses], [prices[i] for i in misses])
+            miss_scores = dict(zip(misses, scores))
+            score_ms = seconds * 1000.0 / len(misses) if misses else 0.0
+            for i, (it, price) in enumerate(zip(chunk, prices)):
+                start = time.perf_counter()
+                parts = cached[i]
+                if parts is None:
+                    parts = self._generate_parts(it.title, it.ptype, price, miss_scores[i], active, budget)
+                    key = keys[i]
+                    if cache is not None and key is not None:
+                        with span("cache"):
+                            cache.set(key, parts)
+                best_title, description = self.finish_listing(it.title, it.ptype, price, parts["tags"], parts["title_suggestions"])
+                score = parts["score"]
+                yield {
+                    "index": it.index,
+                    "ptype": it.ptype,
+                    "input_title": it.title,
+                    "title": best_title,
+                    "title_suggestions": parts["title_suggestions"],
+                    "tags": parts["tags"],
+                    "description": description,
+                    "score": score,
+                    "pred": None if score is None else int(score > 0.5),
+                    "cached": cached[i] is not None,
+                    "timings_ms": {
+                        "score": 0.0 if cached[i] is not None else round(score_ms, 3),
+                        "generate": round((time.perf_counter() - start) * 1000.0, 3),
+                    },
+                }
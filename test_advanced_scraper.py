@@ -66,6 +66,7 @@ def test_data_analysis():
     try:
         import pandas as pd
         from utils.advanced_scrape import save_products_csv, save_products_json
+        from utils.io import iter_json_records
         
         # Create sample data
         sample_data = [
@@ -92,10 +93,11 @@ def test_data_analysis():
         save_products_csv(sample_data, csv_file)
         console.print(f"[green]Saved CSV: {csv_file}[/green]")
         
-        # Test JSON saving
-        json_file = "test_output.json"
+        # Test JSONL saving (the default format) and read it back
+        json_file = "test_output.jsonl"
         save_products_json(sample_data, json_file)
-        console.print(f"[green]Saved JSON: {json_file}[/green]")
+        assert list(iter_json_records(json_file)) == sample_data
+        console.print(f"[green]Saved JSONL: {json_file}[/green]")
         
         # Clean up
         Path(csv_file).unlink(missing_ok=True)
@@ -0,0 +1,19 @@
+import pandas as pd
+
+from src.utils.analytics import compute_analytics
+
+DF = pd.DataFrame(
+    {
+        "title": ["Metal Wall Art", "wall poster", None, "Gold Ring"],
+        "price_clean": [5.0, 10.0, 99.99, None],
+        "seller": ["a", "b", "a", "a"],
+    }
+)
+
+
+def test_compute_analytics_single_pass():
+    out = compute_analytics(DF)
+    assert out["pricing"]["ranges"] == {"Under $10": 1, "$10-$25": 1, "$25-$50": 0, "$50-$100": 1, "Over $100": 0}
+    assert out["titles"]["word_counts"]["wall"] == 2
+    assert out["sellers"]["count"].to_dict() == {"a": 3, "b": 1}
+    assert out["sellers"].loc["a", "price_median"] == 52.5
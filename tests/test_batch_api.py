@@ -0,0 +1,41 @@
+import json
+
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from src.models.pipeline import ListingPipeline, NumericTransformer
+from src.utils.batch_api import BatchError, chunked, ndjson_line, parse_items, score_titles
+
+PTYPES = ("poster", "mug")
+
+
+def test_parse_items_collects_per_item_errors():
+    items, errors = parse_items(
+        {"items": [{"title": "  gold ring  ", "ptype": "mug"}, {"title": ""}, {"title": "x", "ptype": "hat"}, 3, {"title": "a" * 200}]},
+        PTYPES,
+        default_ptype="poster",
+    )
+    assert [(it.index, it.title, it.ptype) for it in items] == [(0, "gold ring", "mug"), (4, "a" * 140, "poster")]
+    assert [e["index"] for e in errors] == [1, 2, 3]
+
+    with pytest.raises(BatchError):
+        parse_items("nope", PTYPES)
+    with pytest.raises(BatchError) as exc:
+        parse_items([{"title": "a"}] * 3, PTYPES, default_ptype="poster", max_items=2)
+    assert exc.value.status == 413
+
+
+def test_score_titles_in_one_batch():
+    df = pd.DataFrame({"title": ["gold ring gift", "silver ring", "wall art print", "metal wall art"], "price_value": [30.0, 25.0, 10.0, 12.0]})
+    pipe = ListingPipeline(TfidfVectorizer().fit(df["title"]), NumericTransformer(), LogisticRegression(), text_col="title")
+    pipe.classifier.fit(pipe.features(df), [1, 1, 0, 0])
+
+    items, _ = parse_items([{"title": t, "ptype": "poster"} for t in df["title"]], PTYPES)
+    assert [len(c) for c in chunked(items, 3)] == [3, 1]
+    scores, seconds = score_titles(pipe, [it.title for it in items], df["price_value"].tolist())
+    assert scores == pytest.approx(pipe.predict_proba(df)[:, 1].tolist())
+    assert seconds >= 0
+    assert score_titles(None, ["a", "b"], [1.0, 2.0]) == ([None, None], 0.0)
+    assert json.loads(ndjson_line({"index": 0, "score": scores[0]})) == {"index": 0, "score": scores[0]}
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from src.models.compiled import CompiledScorer, save_compiled
+from src.models.pipeline import ListingPipeline, NumericTransformer
+
+DF = pd.DataFrame(
+    {
+        "title": ["Gold Ring Gift", "silver ring", "wall art print", "metal wall art", "Café poster", "gold wall ring"],
+        "price_value": [30.0, 25.0, 10.0, None, 12.0, 50.0],
+        "rating": [4.5, None, 4.0, 5.0, 3.5, 4.8],
+    }
+)
+Y = [1, 1, 0, 0, 0, 1]
+
+
+def test_compiled_scorer_matches_pipeline(tmp_path):
+    for vec, scale in [
+        (TfidfVectorizer(ngram_range=(1, 2)), True),
+        (TfidfVectorizer(strip_accents="unicode", sublinear_tf=True, stop_words=["art"]), False),
+    ]:
+        numeric = NumericTransformer(("price_value", "rating"), scale=scale).fit(DF)
+        vec.fit(DF["title"])
+        pipe = ListingPipeline(vec, numeric, LogisticRegression(), text_col="title")
+        pipe.classifier.fit(pipe.features(DF), Y)
+        path = str(tmp_path / "scorer.npz")
+        save_compiled(pipe, path)
+        scorer = CompiledScorer.load(path)
+
+        queries = pd.concat([DF, pd.DataFrame({"title": ["unseen words", None], "price_value": ["abc", 5]})], ignore_index=True)
+        assert np.allclose(scorer.predict_proba(queries), pipe.predict_proba(queries), atol=1e-12)
+        assert scorer.predict({"title": ["gold ring"], "price_value": [40.0]}).tolist() == pipe.predict(
+            {"title": ["gold ring"], "price_value": [40.0]}
+        ).tolist()
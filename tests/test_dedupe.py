@@ -0,0 +1,19 @@
+from src.utils.dedupe import HashedKeyIndex, NearDuplicateIndex, normalize_url
+
+
+def test_hashed_key_index_keeps_first():
+    index = HashedKeyIndex()
+    assert index.mark_new(["a", "b", "a"]) == [True, True, False]
+    assert index.mark_new(["b", "c"]) == [False, True]
+    assert "c" in index and len(index) == 3
+
+
+def test_near_duplicate_index_clusters_variants():
+    assert normalize_url("https://www.etsy.com/listing/42/tree?ref=a#x") == "listing:42"
+    assert normalize_url("https://www.Example.com/p/1/?utm=x") == "example.com/p/1"
+
+    index = NearDuplicateIndex(threshold=0.7)
+    assert index.assign("Metal Tree of Life Wall Art, Large", "https://e.com/listing/1/a") == (0, False)
+    assert index.assign("Metal Tree of Life Wall Art - Large", "https://e.com/listing/2/b") == (0, True)
+    assert index.assign("Gold ring", "https://e.com/listing/1/a?ref=other") == (0, True)
+    assert index.assign("Boho poster print", "https://e.com/listing/3") == (1, False)
@@ -1,7 +1,36 @@
-from src.utils.erank import load_erank_keywords, top_keywords_only
+import os
+
+from src.utils.erank import ErankKeywordStore, load_erank_keywords, top_keywords_only
 
 
 def test_erank_load_missing():
     assert load_erank_keywords("does_not_exist.csv") == []
     assert top_keywords_only("does_not_exist.csv") == []
 
+
+def test_erank_store_top_k_and_reload(tmp_path):
+    path = tmp_path / "erank.csv"
+    path.write_text("Keyword,Search Volume,Competition\nwall art,\"1,200\",High\nposter,300,Low\nmetal art,300,Medium\ngift,50,Low\n", encoding="utf-8")
+    store = ErankKeywordStore(str(path), check_interval=0.0)
+
+    assert store.top(limit=3, min_volume=100) == top_keywords_only(str(path), min_volume=100, limit=3) == ["wall art", "metal art", "poster"]
+    assert store.top(limit=10, min_volume=301) == ["wall art"]
+    assert store.rows(limit=2) == load_erank_keywords(str(path), limit=2)
+    assert store.volume_of("gift") == 50 and "nope" not in store
+
+    path.write_text("Keyword,Search Volume\ngift,5000\n", encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert store.top(limit=2) == ["gift"]
+
+
+def test_erank_reload_swaps_whole_snapshot(tmp_path):
+    path = tmp_path / "erank.csv"
+    path.write_text("Keyword,Search Volume\nposter,300\nwall art,1200\n", encoding="utf-8")
+    store = ErankKeywordStore(str(path), check_interval=0.0)
+    old = store.snapshot()
+    assert store.top(limit=1) == ["wall art"]
+
+    path.write_text("Keyword,Search Volume\ngift,5000\n", encoding="utf-8")
+    store.refresh(force=True)
+    assert old.keywords == ["poster", "wall art"] and old.top_cache == {(1, 0): ["wall art"]}
+    assert store.snapshot() is not old and store.top(limit=1) == ["gift"]
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+
+from src.models.feature_store import FeatureSpec, FeatureStore, dataset_hash, transform_features
+
+DF = pd.DataFrame({"title": ["metal wall art", "wall art", "gold ring", "gold ring gift"], "price_value": [10.0, None, 30.0, 5.0]})
+
+
+def test_feature_store_roundtrip_mmap(tmp_path):
+    store = FeatureStore(str(tmp_path))
+    spec = FeatureSpec(min_df=1)
+    built = store.get_or_build(DF, spec)
+    loaded = store.get_or_build(DF, spec)
+
+    assert isinstance(loaded.numeric, np.memmap) and not loaded.text.data.flags.writeable
+    assert (loaded.matrix() != built.matrix()).nnz == 0
+    assert loaded.numeric[:, 0].tolist() == [10.0, 0.0, 30.0, 5.0]
+    assert dataset_hash(DF.assign(title="x"), spec) != built.dataset_hash
+    served = transform_features(loaded.vectorizer, ["gold ring"], [[30.0]])
+    assert (served != built.matrix()[2]).nnz == 0
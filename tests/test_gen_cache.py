@@ -0,0 +1,34 @@
+from src.utils.gen_cache import GenerationCache, LRUCache, cache_key, epoch_of
+
+
+def test_lru_evicts_oldest_and_expires():
+    now = [0.0]
+    lru = LRUCache(maxsize=2, ttl=10.0, clock=lambda: now[0])
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)  # "b" is least recently used
+    assert lru.get("b") is None and lru.evictions == 1
+    now[0] = 11.0
+    assert lru.get("a") is None and lru.expired == 1
+
+
+def test_key_normalizes_title_and_epoch_is_stable():
+    e = epoch_of((1, 2.5), "v1")
+    assert e == epoch_of((1, 2.5), "v1") != epoch_of((1, 2.5), "v2")
+    assert cache_key("Gold  Ring!", "jewelry", "v1", e) == cache_key("gold ring", "jewelry", "v1", e)
+    assert cache_key("gold ring", "jewelry", "v1", e) != cache_key("gold ring", "jewelry", "v2", e)
+
+
+def test_shared_tier_serves_other_processes_and_epoch_invalidates(tmp_path):
+    path = str(tmp_path / "gen.sqlite")
+    a, b = GenerationCache(shared_path=path), GenerationCache(shared_path=path)
+    a.observe_epoch("e1")
+    a.set("k", {"tags": ["gold ring"]})
+    assert b.get("k") == {"tags": ["gold ring"]} and b.shared_hits == 1
+    assert b.get("k") and b.hits == 1  # promoted to the local tier
+
+    b.observe_epoch("e1")
+    b.observe_epoch("e2")
+    assert len(b.local) == 0 and b.invalidations == 1
+    assert b.get("missing") is None and b.stats()["misses"] == 1
@@ -0,0 +1,30 @@
+import os
+
+import pandas as pd
+
+from src.models.incremental import IncrementalTrainer
+from src.models.pipeline import load_pipeline
+
+TITLES = ["gold ring gift", "silver ring", "wall art print", "metal wall art", "gold necklace", "poster print"]
+
+
+def _batch(seed: int) -> pd.DataFrame:
+    rows = [(f"{t} {seed} {i}", 10.0 + i, int("ring" in t or "gold" in t)) for i in range(10) for t in TITLES]
+    return pd.DataFrame(rows, columns=["title", "price_value", "label_high_sales"])
+
+
+def test_incremental_trainer_checkpoints_and_resumes(tmp_path):
+    ckpt = str(tmp_path / "inc")
+    trainer = IncrementalTrainer(ckpt, holdout_frac=0.2, keep=2)
+    first = trainer.update("a:0", _batch(0))
+    assert first["train_rows"] + first["holdout_rows"] == 60
+    trainer.update("a:1", _batch(1))
+    assert trainer.update("a:0", _batch(0)) is None
+
+    resumed = IncrementalTrainer(ckpt, holdout_frac=0.2, keep=2)
+    assert resumed.seen("a:1") and len(resumed.holdout) == len(trainer.holdout)
+    metrics = resumed.update("b:0", _batch(2))
+    assert metrics["accuracy"] > 0.8
+    assert sorted(f for f in os.listdir(ckpt) if f.endswith(".joblib")) == ["ckpt-00002.joblib", "ckpt-00003.joblib"]
+    served = load_pipeline(os.path.join(ckpt, "ckpt-00003.joblib"))
+    assert served.predict({"title": ["gold ring"], "price_value": [12.0]}).tolist() == [1]
@@ -1,6 +1,20 @@
+import json
 import os
 
-from src.utils.io import ensure_dir, read_csv, write_csv
+import numpy as np
+import pytest
+
+from src.utils.io import (
+    CsvBatchWriter,
+    ensure_dir,
+    iter_csv_chunks,
+    iter_json_batches,
+    iter_json_records,
+    read_csv,
+    read_csv_columns,
+    write_csv,
+    write_csv_chunks,
+)
 
 
 def test_ensure_dir_and_csv(tmp_path):
@@ -14,3 +28,62 @@ def test_ensure_dir_and_csv(tmp_path):
     back = read_csv(str(path))
     assert back[0]["x"] == "1" and back[0]["y"] == "2"
 
+
+def test_csv_chunks_roundtrip(tmp_path):
+    src = tmp_path / "in.csv"
+    write_csv(str(src), [{"x": str(i), "y": "0.50"} for i in range(5)], ["x", "y"])
+    chunks = list(iter_csv_chunks(str(src), chunksize=2))
+    assert [len(c) for c in chunks] == [2, 2, 1]
+
+    out = tmp_path / "out.csv"
+    assert write_csv_chunks(str(out), chunks) == 5
+    assert out.read_text(encoding="utf-8") == src.read_text(encoding="utf-8")
+
+
+def test_json_array_and_jsonl_stream_identically(tmp_path):
+    records = [{"title": "a ] b", "price": "$1"}, {"title": "c", "seller": "s", "rating": 4.5}]
+    array_path = tmp_path / "p.json"
+    array_path.write_text(json.dumps(records, indent=2), encoding="utf-8")
+    lines_path = tmp_path / "p.jsonl"
+    lines_path.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+
+    assert list(iter_json_records(str(array_path), block_size=8)) == records
+    assert list(iter_json_records(str(lines_path))) == records
+
+    (batch,) = list(iter_json_batches(str(lines_path), as_text=True))
+    assert batch.columns.tolist() == ["title", "price", "seller", "rating"]
+    assert batch["rating"].tolist()[1] == "4.5"
+
+
+def test_json_array_many_small_records_small_blocks(tmp_path):
+    records = [{"i": i, "t": "x" * (i % 7)} for i in range(5000)] + [12345, "]", None]
+    path = tmp_path / "many.json"
+    path.write_text(" \n" + json.dumps(records), encoding="utf-8")
+    for block_size in (1, 7, 64):
+        assert list(iter_json_records(str(path), block_size=block_size)) == records
+
+    path.write_text("[1, 2", encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_json_records(str(path), block_size=2))
+
+
+def test_batch_writer_columns_gzip_and_atomic(tmp_path):
+    path = tmp_path / "rows.csv.gz"
+    with CsvBatchWriter(str(path), ["title", "price_value"]) as w:
+        w.write_columns({"title": ["a", "b"], "price_value": ["1.5", ""]})
+        w.write_rows([{"title": "c"}])
+    cols = read_csv_columns(str(path), {"price_value": float}, batch_size=2)
+    assert cols["title"] == ["a", "b", "c"]
+    assert cols["price_value"][0] == 1.5 and np.isnan(cols["price_value"][1:]).all()
+
+    with pytest.raises(RuntimeError), CsvBatchWriter(str(tmp_path / "x.csv"), ["a"]):
+        raise RuntimeError("boom")
+    with pytest.raises(ValueError, match="not in fieldnames: 'seller'"):
+        write_csv(str(tmp_path / "y.csv"), [{"title": "a", "seller": "s"}], ["title"])
+    with pytest.raises(ValueError, match="not in fieldnames"):
+        write_csv(str(tmp_path / "y.csv"), [{"price_value": "1", "seller": "s"}], ["title", "price_value"])
+    assert list(tmp_path.iterdir()) == [path]
+
+    with CsvBatchWriter(str(tmp_path / "z.csv"), ["title"], extrasaction="ignore") as w:
+        w.write_rows([{"title": "a", "seller": "s"}])
+    assert read_csv(str(tmp_path / "z.csv")) == [{"title": "a"}]
@@ -0,0 +1,32 @@
+from src.utils.metrics import Histogram, MetricsRegistry, RequestTimer, bind_timer, span
+
+
+def test_spans_fold_into_outer_stage_and_noop_without_timer():
+    with span("predict"):
+        pass  # no timer bound
+    timer = RequestTimer("api")
+    bind_timer(timer)
+    try:
+        with span("tag"), span("predict"):
+            pass
+        with span("render"):
+            pass
+    finally:
+        bind_timer(None)
+    assert set(timer.stages) == {"tag", "render"}
+    assert sum(timer.stages.values()) <= timer.finish()
+
+
+def test_histogram_renders_cumulative_buckets():
+    h = Histogram("x_seconds", "test", buckets=(0.1, 1.0))
+    for v in (0.05, 0.5, 5.0):
+        h.observe(v, route="api")
+    lines = h.render()
+    assert 'x_seconds_bucket{route="api",le="0.1"} 1' in lines
+    assert 'x_seconds_bucket{route="api",le="1"} 2' in lines
+    assert 'x_seconds_bucket{route="api",le="+Inf"} 3' in lines
+    assert 'x_seconds_count{route="api"} 3' in lines
+
+    registry = MetricsRegistry()
+    registry.collector("up", "gauge", "test", lambda: {(): 1.0})
+    assert registry.render().endswith("# TYPE up gauge\nup 1\n")
@@ -0,0 +1,39 @@
+import json
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from src.models.feature_store import transform_features
+from src.models.pipeline import ListingPipeline, NumericTransformer, load_pipeline, manifest_path, save_pipeline
+
+DF = pd.DataFrame({"title": ["gold ring gift", "silver ring", "wall art print", "metal wall art"], "price_value": [30.0, 25.0, 10.0, 12.0]})
+Y = [1, 1, 0, 0]
+
+
+def test_pipeline_roundtrip_mmap(tmp_path):
+    vec = TfidfVectorizer().fit(DF["title"])
+    clf = LogisticRegression().fit(transform_features(vec, DF["title"], DF[["price_value"]]), Y)
+    path = str(tmp_path / "pipe.joblib")
+    manifest = save_pipeline(ListingPipeline(vec, NumericTransformer(), clf), path, dataset_hash="abcdef0123")
+
+    with open(manifest_path(path), "r", encoding="utf-8") as f:
+        assert json.load(f) == manifest
+    assert manifest["numeric_scaled"] is False
+    loaded = load_pipeline(path)
+    assert isinstance(loaded.classifier.coef_, np.memmap)
+    assert loaded.version == manifest["version"] and manifest["dataset_hash"] == "abcdef0123"
+    assert loaded.predict(DF).tolist() == clf.predict(transform_features(vec, DF["title"], DF[["price_value"]])).tolist()
+    assert loaded.predict({"title": ["gold ring"], "price_value": [None]}).shape == (1,)
+
+
+def test_numeric_transformer_scales_and_fills():
+    df = pd.DataFrame({"price_value": [10.0, 100.0, None], "rating": [4.5, None, 5.0]})
+    nt = NumericTransformer(("price_value", "rating", "favorites"), scale=True).fit(df)
+    X = nt.transform(df)
+
+    assert np.allclose(X.mean(axis=0), 0.0)
+    assert np.isfinite(X).all() and np.allclose(X[:, 2], 0.0)
+    assert np.isclose(X[2, 0], nt.transform(pd.DataFrame({"price_value": [None]}))[0, 0])
+    assert NumericTransformer().transform(df)[2, 0] == 0.0
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from src.models.compiled import CompiledScorer
+from src.models.pipeline import ListingPipeline, NumericTransformer
+from src.models.registry import ModelHolder, ModelRegistry, RegistryError
+
+DF = pd.DataFrame({"title": ["gold ring gift", "silver ring", "wall art print", "metal wall art"], "price_value": [30.0, 25.0, 10.0, 12.0]})
+
+
+def _pipe(y):
+    pipe = ListingPipeline(TfidfVectorizer().fit(DF["title"]), NumericTransformer(), LogisticRegression(), text_col="title")
+    pipe.classifier.fit(pipe.features(DF), y)
+    return pipe
+
+
+def test_registry_promote_pin_rollback_and_hot_swap(tmp_path):
+    reg = ModelRegistry(str(tmp_path / "registry"))
+    holder = ModelHolder(reg, poll_interval=60)
+    assert holder.refresh() is False and holder.get() == (None, None)
+
+    v1 = reg.register(_pipe([1, 1, 0, 0]), {"accuracy": 0.9}, promote=True)
+    v2 = reg.register(_pipe([0, 0, 1, 1]), {"accuracy": 0.8})
+    assert v1 != v2 and reg.versions() == sorted([v1, v2]) and reg.current() == v1
+    assert holder.refresh() is True
+    version, model = holder.get()
+    assert version == v1 and isinstance(model, CompiledScorer)
+    assert model.predict({"title": ["gold ring"], "price_value": [30.0]}).tolist() == [1]
+
+    reg.pin()
+    assert reg.promote(v2) is False and reg.current() == v1
+    assert reg.promote(v2, force=True) and reg.rollback() == v1
+    with pytest.raises(RegistryError):
+        reg.rollback()
+
+    reg.set_ab(v2, 0.5)
+    holder.refresh()
+    seen = {holder.get(f"client-{i}")[0] for i in range(50)}
+    assert seen == {v1, v2}
+    assert holder.get("client-7") == holder.get("client-7")
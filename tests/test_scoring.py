@@ -0,0 +1,26 @@
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from src.models.pipeline import ListingPipeline, NumericTransformer, save_pipeline
+from src.models.scoring import score_file
+
+DF = pd.DataFrame({"title": ["gold ring gift", "silver ring", "wall art print", "metal wall art"], "price_value": [30.0, 25.0, 10.0, 12.0]})
+
+
+def test_score_file_parallel_matches_serial(tmp_path):
+    pipe = ListingPipeline(TfidfVectorizer().fit(DF["title"]), NumericTransformer(), LogisticRegression(), text_col="title")
+    pipe.classifier.fit(pipe.features(DF), [1, 1, 0, 0])
+    model = str(tmp_path / "pipe.joblib")
+    save_pipeline(pipe, model)
+    src = tmp_path / "cand.csv"
+    pd.concat([DF] * 5, ignore_index=True).to_csv(src, index=False)
+
+    serial = score_file(model, str(src), str(tmp_path / "a.csv"), chunksize=3, workers=1, top_k=2)
+    score_file(model, str(src), str(tmp_path / "b.csv"), chunksize=3, workers=2, top_k=2)
+
+    a, b = pd.read_csv(tmp_path / "a.csv"), pd.read_csv(tmp_path / "b.csv")
+    assert serial["rows"] == 20 and serial["titles_per_second"] > 0
+    pd.testing.assert_frame_equal(a, b)
+    assert a["pred"].tolist()[:4] == [1, 1, 0, 0]
+    assert a.loc[0, "top_terms"].split(";")[0].split(":")[0] in {"gold", "ring", "gift"}
@@ -0,0 +1,26 @@
+import os
+
+import pandas as pd
+
+from src.models.selection import SearchGrid, grid_search
+from src.models.training import TrainConfig
+
+DF = pd.DataFrame(
+    {
+        "title": ["gold ring gift", "silver ring", "wall art print", "metal wall art"] * 6,
+        "price_value": [30.0, 25.0, 10.0, 12.0] * 6,
+        "label_high_sales": [1, 1, 0, 0] * 6,
+    }
+)
+
+
+def test_grid_search_leaderboard_and_cache(tmp_path):
+    grid = SearchGrid(C=(0.1, 1.0), penalty=("l2", "l1"), ngram_range=((1, 1),), min_df=(1,))
+    cache = str(tmp_path / "cache")
+    board = grid_search(DF, TrainConfig(), grid, cv=3, n_jobs=1, cache_dir=cache)
+
+    assert len(board) == 4
+    assert board["accuracy_mean"].is_monotonic_decreasing
+    assert len(os.listdir(os.path.join(cache, os.listdir(cache)[0]))) == 3
+    again = grid_search(DF, TrainConfig(), grid, cv=3, n_jobs=1, cache_dir=cache)
+    pd.testing.assert_frame_equal(board.drop(columns="fit_seconds"), again.drop(columns="fit_seconds"))
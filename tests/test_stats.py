@@ -0,0 +1,30 @@
+import os
+
+import pandas as pd
+
+from src.utils.stats import StatsSnapshot, snapshot_from_csv
+
+
+def test_snapshot_build_lookup_and_rebuild(tmp_path):
+    src = tmp_path / "clean.csv"
+    out = str(tmp_path / "stats.json")
+    pd.DataFrame(
+        {
+            "title": ["Gold Ring Gift", "Silver Ring", "Wall Art Print", "Metal Wall Art"],
+            "price_value": [30.0, 20.0, 10.0, None],
+            "ptype": ["jewelry", "jewelry", "poster", "metal_wall_art"],
+        }
+    ).to_csv(src, index=False)
+    stats = snapshot_from_csv(str(src), out)
+    assert stats["global"]["median"] == 20.0 and stats["by_ptype"]["jewelry"]["median"] == 25.0
+    assert stats["global"]["top_terms"][0] in (["ring", 2], ["wall", 2], ["art", 2])
+
+    snap = StatsSnapshot(out, source=str(src), check_interval=0.0)
+    assert snap.median_price("jewelry") == 25.0
+    assert snap.median_price("metal_wall_art") == 20.0  # no prices for this ptype -> global
+    assert snap.median_price("unknown", default=1.0) == 20.0
+
+    pd.DataFrame({"title": ["a b"], "price_value": [99.0]}).to_csv(src, index=False)
+    os.utime(src, ns=(1, 1))
+    snap.refresh(background=False)
+    assert snap.median_price() == 99.0 and not snap.stale()
@@ -0,0 +1,41 @@
+from src.utils.tags import TagIndex, is_valid_tag, tag_letters
+
+BASE = {"poster": ["poster", "print", "wall", "art"], "mug": ["coffee", "mug", "gift"]}
+
+
+def _index():
+    return TagIndex.build(
+        top_terms=[("vintage", 2.0), ("botanical", 1.5), ("cat", 1.0), ("minimalist", 0.5)],
+        erank=[("wall art", 5000), ("cat lover gift", 900), ("cat", 300)],
+        base_by_type=BASE,
+    )
+
+
+def test_index_ranks_valid_tags_per_ptype():
+    index = _index()
+    tags = index.suggest("poster", limit=13)
+    assert len(tags) == 13 and len(set(tags)) == 13
+    assert all(is_valid_tag(t) for t in tags)
+    assert "wall art" in tags  # eRank phrase
+    assert "art poster" not in index.ptypes["poster"].tags and "poster art" in index.ptypes["poster"].tags
+    assert "cat lover gift" in index.ptypes["mug"].tags  # multi-word eRank keyword, 12 letters
+    assert not is_valid_tag("botanical minimalist") and not is_valid_tag("vintage")
+    top = index.suggest("poster", limit=6)
+    assert top == tags[:6]
+    for word in {w for t in top for w in t.split()}:
+        assert sum(word in t.split() for t in top) <= 3
+    hat = index.suggest("hat")  # unknown ptype: global pool without base words
+    assert hat and all(is_valid_tag(t) for t in hat) and "wall art" in hat
+    assert not any("poster" in t or "mug" in t for t in hat)
+    assert TagIndex({}).suggest("hat") == []
+
+
+def test_suggest_personalises_and_limits_letters():
+    index = _index()
+    plain = index.suggest("mug", limit=5)
+    personal = index.suggest("mug", limit=5, title="Minimalist Coffee Mug")
+    assert personal != plain
+    assert all("minimalist" in t or "coffee" in t or "mug" in t for t in personal[:3])
+    short = index.suggest("poster", limit=6, max_letters=8)
+    assert short and all(tag_letters(t) <= 8 for t in short)
+    assert index.suggest("poster", limit=3, title="cat") == index.suggest("poster", limit=3, title="cat")
@@ -0,0 +1,39 @@
+import pandas as pd
+
+from src.utils.termfreq import BUCKET_TOP, TermCounts, cached_counts
+
+DF = pd.DataFrame(
+    {
+        "title_clean": ["metal wall art", "wall art poster", "gold ring"],
+        "description_clean": ["metal art", None, "ring gift"],
+        "ptype": ["metal_wall_art", "poster", "jewelry"],
+        "sales": ["10", "1", "20"],
+    }
+)
+
+
+def test_counts_shard_and_merge(tmp_path):
+    a, b = TermCounts(), TermCounts()
+    a.add_frame(DF.iloc[:2], threshold=5)
+    b.add_frame(DF.iloc[2:], threshold=5)
+    a.merge(b)
+
+    unigrams, rows = a.select(buckets=[BUCKET_TOP], n=1)
+    assert rows == 2 and unigrams["art"] == 2 and unigrams["ring"] == 2 and "poster" not in unigrams
+    bigrams, _ = a.select(ptype="poster", n=2)
+    assert bigrams == {"wall art": 1, "art poster": 1}
+
+    path = str(tmp_path / "counts.sqlite")
+    a.save(path)
+    assert TermCounts.load(path).select(n=1) == a.select(n=1)
+
+
+def test_cached_counts_by_price_band(tmp_path):
+    path = tmp_path / "text.csv"
+    DF.assign(price_value=["5", "30", ""]).to_csv(path, index=False)
+    kwargs = {"fields": ["title_clean"], "ngrams": [1], "price_col": "price_value"}
+    first = cached_counts(str(path), cache_dir=str(tmp_path / "cache"), **kwargs)
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+    again = cached_counts(str(path), cache_dir=str(tmp_path / "cache"), **kwargs)
+    assert again.select(buckets=["$25-$50"], n=1) == first.select(buckets=["$25-$50"], n=1)
+    assert first.select(buckets=["$25-$50"], n=1)[0] == {"wall": 1, "art": 1, "poster": 1}
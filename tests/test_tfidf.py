@@ -0,0 +1,34 @@
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from src.utils.tfidf import (
+    DocFreqStore,
+    StreamingTfidf,
+    build_analyzer,
+    hashed_bucket,
+    hashing_vectorizer,
+    top_k_indices,
+)
+
+DOCS = ["metal wall art", "wall art poster", "gold ring gift", "metal ring", "poster print wall art"]
+
+
+def test_streaming_matches_tfidf_vectorizer(tmp_path):
+    store = DocFreqStore(str(tmp_path / "df.sqlite"))
+    analyzer = build_analyzer()
+    store.update("b1", DOCS[:3], analyzer)
+    other = DocFreqStore(str(tmp_path / "df2.sqlite"))
+    other.update("b2", DOCS[3:], analyzer)
+    store.merge(other)
+    assert store.update("b1", DOCS[:3], analyzer) == 0
+
+    tfidf = StreamingTfidf.from_store(store, min_df=2)
+    expected = TfidfVectorizer(ngram_range=(1, 2), min_df=2).fit_transform(DOCS).toarray()
+    got = np.vstack([tfidf.transform(DOCS[:2]).toarray(), tfidf.transform(DOCS[2:]).toarray()])
+    assert np.allclose(got, expected)
+
+
+def test_top_k_indices_and_hashed_bucket():
+    assert top_k_indices(np.array([0.1, 0.9, 0.5, 0.7]), 2).tolist() == [1, 3]
+    row = hashing_vectorizer(2**10, ngram_range=(1, 1)).transform(["poster"])
+    assert row.indices[0] == hashed_bucket("poster", 2**10)
@@ -0,0 +1,35 @@
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from src.models.pipeline import ListingPipeline, NumericTransformer
+from src.models.titles import TitleRanker, enforce_title_limit
+
+TERMS = [("gold", 3.0), ("ring", 2.0), ("silver", 1.0), ("wall", 1.0), ("print", 1.0), ("cat", 0.5), ("boho", 0.5)]
+
+
+def test_ranker_prefers_model_and_erank_coverage():
+    df = pd.DataFrame({"title": ["gold ring", "gold necklace", "wall print", "cat print"], "price_value": [1.0] * 4})
+    pipe = ListingPipeline(TfidfVectorizer().fit(df["title"]), NumericTransformer(), LogisticRegression(C=10.0), text_col="title")
+    pipe.classifier.fit(pipe.features(df), [1, 1, 0, 0])
+    ranker = TitleRanker(TERMS, erank=[("gold ring", 1000), ("boho", 50)], seed=0)
+
+    ranked = ranker.rank(["Wall Print Jewelry", "Gold Ring Jewelry", "Boho Cat Jewelry"], model=pipe)
+    assert ranked[0].title == "Gold Ring Jewelry"
+    cov = {c.title: c.coverage for c in ranked}
+    assert cov["Gold Ring Jewelry"] > cov["Boho Cat Jewelry"] > cov["Wall Print Jewelry"] == 0.0
+    assert ranked[0].model_score > 0.5
+
+    best = ranker.suggest("jewelry", k=3, model=pipe, title="Silver Cat", budget_ms=0)
+    assert len(best) == 3 and best == sorted(best, key=lambda c: -c.score)
+    assert len({frozenset(c.title.lower().split()) for c in best}) == 3
+    assert all(c.title.endswith("Jewelry") and len(c.title) <= 140 for c in best)
+
+
+def test_sample_without_model_and_title_limit():
+    ranker = TitleRanker(seed=1)  # falls back to generic terms
+    titles = ranker.sample("poster", 20, title_terms=["vintage"], length=(3, 5))
+    assert all(t.endswith(" Poster") for t in titles)
+    assert any("Vintage" in t for t in titles)
+    assert [c.model_score for c in ranker.suggest("poster", k=2, budget_ms=0)] == [None, None]
+    assert enforce_title_limit("word " * 40) == ("word " * 28).strip()
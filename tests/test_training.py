@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from src.models.training import TrainConfig, train_pipeline
+
+DF = pd.DataFrame(
+    {
+        "title": ["gold ring gift", "silver ring", "wall art print", "metal wall art"] * 6,
+        "price_value": [30.0, 25.0, 10.0, 12.0, 31.0, 26.0, 11.0, 500.0] * 3,
+        "label_high_sales": [1, 1, 0, 0] * 6,
+    }
+)
+
+
+def test_numeric_scaling_is_fit_on_training_rows_only():
+    cfg = TrainConfig(min_df=1, scale_numeric=True)
+    res = train_pipeline(DF, cfg)
+    y = DF["label_high_sales"].to_numpy()
+    train_idx, _ = train_test_split(np.arange(len(DF)), test_size=cfg.test_size, random_state=cfg.random_state, stratify=y)
+    prices = DF["price_value"].to_numpy()[train_idx]
+    numeric = res.pipeline.numeric
+    assert numeric.fill_ is not None and numeric.mean_ is not None
+    assert np.isclose(numeric.fill_[0], np.median(prices))
+    assert np.isclose(numeric.mean_[0], np.log1p(prices).mean())
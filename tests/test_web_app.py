@@ -0,0 +1,129 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from src.config import AppConfig
+from src.models.pipeline import ListingPipeline, NumericTransformer, save_pipeline
+from src.web import create_app
+from src.web.service import ListingService
+
+
+def _app(root, with_model=True, start=False):
+    if with_model:
+        df = pd.DataFrame({"title": ["gold ring gift", "silver ring", "wall art print", "metal wall art"], "price_value": [30.0, 25.0, 10.0, 12.0]})
+        pipe = ListingPipeline(TfidfVectorizer().fit(df["title"]), NumericTransformer(), LogisticRegression(), text_col="title")
+        pipe.classifier.fit(pipe.features(df), [1, 1, 0, 0])
+        (root / "models").mkdir()
+        save_pipeline(pipe, str(root / "models" / "day12_pipeline.joblib"))
+    cfg = AppConfig()
+    cfg.logging.file = None
+    cfg.flask.title_budget_ms = 0.0
+    cfg.flask.api_title_budget_ms = 0.0
+    app = create_app(cfg, root=str(root), start=start)
+    app.config["WTF_CSRF_ENABLED"] = False
+    return app
+
+
+def test_factory_serves_form_api_and_probes(tmp_path):
+    client = _app(tmp_path).test_client()
+    assert client.get("/healthz").get_json() == {"status": "ok"}
+    ready = client.get("/readyz")
+    assert ready.status_code == 200 and ready.get_json()["predictions"] is True
+
+    page = client.post("/", data={"title": "Gold Ring Gift", "ptype": "jewelry"})
+    assert page.status_code == 200 and b"titleField" in page.data
+
+    out = client.post("/api/v1/generate", json=[{"title": "gold ring", "ptype": "jewelry"}, {"title": ""}]).get_json()
+    assert out["summary"]["items"] == 1 and out["errors"][0]["index"] == 1
+    assert 0.0 < out["results"][0]["score"] < 1.0 and out["results"][0]["tags"]
+
+
+def test_repeated_generation_is_cached(tmp_path):
+    client = _app(tmp_path).test_client()
+    first = client.post("/", data={"title": "Gold Ring Gift", "ptype": "jewelry"})
+    again = client.post("/", data={"title": "gold ring gift!", "ptype": "jewelry"})
+    assert (first.headers["X-Cache"], again.headers["X-Cache"]) == ("MISS", "HIT")
+    assert b"gold ring gift!" in again.data  # best title/description use the exact input
+
+    out = client.post("/api/v1/generate", json=[{"title": "GOLD RING GIFT", "ptype": "jewelry"}]).get_json()
+    assert out["results"][0]["cached"] is True
+    stats = client.get("/cache/stats").get_json()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+
+
+def test_form_and_api_cache_separately_when_budgets_differ(tmp_path):
+    app = _app(tmp_path)
+    app.extensions["listing"].cfg.flask.api_title_budget_ms = 2.0
+    client = app.test_client()
+    assert client.post("/", data={"title": "Gold Ring Gift", "ptype": "jewelry"}).headers["X-Cache"] == "MISS"
+    out = client.post("/api/v1/generate", json=[{"title": "gold ring gift", "ptype": "jewelry"}]).get_json()
+    assert out["results"][0]["cached"] is False
+
+
+def test_apps_are_independent(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    with_model, without = _app(tmp_path / "a"), _app(tmp_path / "b", with_model=False)
+    assert with_model.extensions["listing"] is not without.extensions["listing"]
+    out = without.test_client().post("/api/v1/generate", json=[{"title": "gold ring", "ptype": "jewelry"}]).get_json()
+    assert out["results"][0]["score"] is None
+
+
+def test_background_warm_up_gates_requests(tmp_path):
+    app = _app(tmp_path, start=True)
+    try:
+        out = app.test_client().post("/api/v1/generate", json=[{"title": "gold ring", "ptype": "jewelry"}])
+        assert out.status_code == 200 and out.get_json()["results"][0]["score"] is not None
+        assert app.extensions["listing"].status()["ready"] is True
+    finally:
+        app.extensions["listing"].stop()
+
+    svc = ListingService(AppConfig(), root=str(tmp_path), warm=False)
+    assert svc.status()["ready"] is False and svc.model is None
+    svc.warm_up()
+    assert svc.wait_ready(0) and svc.model is not None
+
+
+def test_failed_warm_up_rejects_requests_without_waiting(tmp_path, monkeypatch):
+    def broken(self):
+        raise RuntimeError("corrupt artifact")
+
+    monkeypatch.setattr(ListingService, "load_artifacts", broken)
+    app = _app(tmp_path, with_model=False, start=True)
+    started = time.perf_counter()
+    out = app.test_client().post("/api/v1/generate", json=[{"title": "gold ring", "ptype": "jewelry"}])
+    assert out.status_code == 503 and "Retry-After" not in out.headers
+    assert time.perf_counter() - started < 5.0
+    assert app.extensions["listing"].status()["warm_up_error"] == "corrupt artifact"
+
+
+def test_web_import_skips_heavy_dependencies():
+    code = "import sys, src.web; print(sorted({'sklearn', 'scipy', 'pandas', 'joblib', 'numpy'} & set(sys.modules)))"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_metrics_break_requests_into_stages(tmp_path, caplog):
+    app = _app(tmp_path)
+    client = app.test_client()
+    client.post("/", data={"title": "Gold Ring Gift", "ptype": "jewelry"})
+    client.post("/api/v1/generate", json=[{"title": "gold ring", "ptype": "jewelry"}])
+    text = client.get("/metrics").data.decode()
+    assert 'listing_request_seconds_count{ptype="jewelry",route="form"} 1' in text
+    for stage in ("predict", "tag", "render", "parse"):
+        assert f'stage="{stage}"' in text
+    assert 'listing_cache_lookups_total{result="misses"} 2' in text
+
+    cfg = app.extensions["listing"].cfg
+    cfg.metrics.slow_request_ms = 1e-6
+    with caplog.at_level("WARNING", logger="src.web.slow"):
+        client.post("/", data={"title": "Gold Ring Gift", "ptype": "jewelry"})
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record["route"] == "form" and "render" in record["stages_ms"]